@@ -0,0 +1,31 @@
+"""
+Benchmarks for the call path of Convert and each Convertible.
+
+Run them with ``python -m benchmarks``, which prints the results as JSON so they can be compared between releases.
+"""
+
+from typing import Callable, Dict
+
+BENCHMARKS: Dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def benchmark(name: str):
+    """
+    Registers a benchmark.
+
+    Parameters
+    ----------
+    name : str
+        The name of the benchmark in the results.
+
+    Returns
+    -------
+    Callable
+        A decorator for a function that sets up the benchmark and returns the callable that is timed.
+    """
+
+    def benchmark(setup: Callable[[], Callable[[], object]]) -> Callable[[], Callable[[], object]]:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return benchmark
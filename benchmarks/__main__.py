@@ -0,0 +1,66 @@
+from typing import Callable, Dict
+from argparse import ArgumentParser
+from timeit import Timer
+import importlib
+import json
+import platform
+import statistics
+import sys
+
+import benchmarks
+from . import BENCHMARKS
+
+MODULES = ("bench_convert", "bench_builtins")
+
+
+def measure(function: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """
+    Measures the time of a single call of a function.
+
+    Parameters
+    ----------
+    function : Callable[[], object]
+        The function that is timed.
+    repeat : int
+        The amount of times the measurement is repeated.
+
+    Returns
+    -------
+    Dict[str, float]
+        The minimum and median seconds of a call and the amount of calls of each measurement.
+    """
+    timer = Timer(function)
+    loops, _ = timer.autorange()
+    times = [time / loops for time in timer.repeat(repeat, loops)]
+    return {"min": min(times), "median": statistics.median(times), "loops": loops}
+
+
+def main():
+    parser = ArgumentParser(prog="python -m benchmarks", description=benchmarks.__doc__)
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks whose name contains the filter")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="the amount of measurements of each benchmark")
+    parser.add_argument("-o", "--output", help="the file to write the results to, instead of stdout")
+    arguments = parser.parse_args()
+
+    for module in MODULES:
+        importlib.import_module(f"{__package__}.{module}")
+
+    results = {
+        name: measure(setup(), arguments.repeat) for name, setup in BENCHMARKS.items() if arguments.filter in name
+    }
+    report = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "results": results,
+    }
+
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            json.dump(report, file, indent=4)
+    else:
+        json.dump(report, sys.stdout, indent=4)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+from datetime import datetime
+from decimal import localcontext
+
+from convertible import Convertible, ConvertException
+from convertible.Convertible.builtins import Int, Decimal, Datetime
+
+from . import benchmark
+
+
+class NaiveInt(Convertible):
+    def convert(self, argument):
+        try:
+            return int(argument)
+        except ValueError:
+            raise ConvertException(self, argument)
+
+
+class NaiveDecimal(Convertible):
+    def convert(self, argument):
+        with localcontext() as context:
+            context.prec = 10
+            return context.create_decimal(argument)
+
+
+class NaiveDatetime(Convertible):
+    def convert(self, argument):
+        try:
+            return datetime.strptime(argument, "%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            raise ConvertException(self, argument)
+
+
+ROWS = [str(index) for index in range(1000)]
+
+
+@benchmark("builtins.int.naive")
+def int_naive():
+    return lambda: NaiveInt().convert("1")
+
+
+@benchmark("builtins.int")
+def int_builtin():
+    return lambda: Int().convert("1")
+
+
+@benchmark("builtins.int.identity")
+def int_identity():
+    return lambda: Int().convert(1)
+
+
+@benchmark("builtins.int.miss.naive")
+def int_miss_naive():
+    return lambda: NaiveInt().try_convert("a")
+
+
+@benchmark("builtins.int.miss")
+def int_miss():
+    return lambda: Int().try_convert("a")
+
+
+@benchmark("builtins.int.many.naive")
+def int_many_naive():
+    return lambda: NaiveInt().convert_many(ROWS)
+
+
+@benchmark("builtins.int.many")
+def int_many():
+    return lambda: Int().convert_many(ROWS)
+
+
+@benchmark("builtins.decimal.naive")
+def decimal_naive():
+    return lambda: NaiveDecimal().convert("1.5")
+
+
+@benchmark("builtins.decimal")
+def decimal_builtin():
+    convertible = Decimal(precision=10)
+    return lambda: convertible.convert("1.5")
+
+
+@benchmark("builtins.datetime.naive")
+def datetime_naive():
+    return lambda: NaiveDatetime().convert("2020-01-02 03:04:05")
+
+
+@benchmark("builtins.datetime")
+def datetime_builtin():
+    convertible = Datetime("%Y-%m-%d %H:%M:%S")
+    return lambda: convertible.convert("2020-01-02 03:04:05")
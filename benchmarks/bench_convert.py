@@ -0,0 +1,108 @@
+from convertible import convert, Convertible, ConvertException, ConvertHandler
+from convertible.Convertible.Greedy import Greedy
+from convertible.Convertible.Optional import Optional
+from convertible.Convertible.FirstOf import FirstOf
+
+from . import benchmark
+
+
+class Int(Convertible):
+    def convert(self, argument: str) -> int:
+        try:
+            return int(argument)
+        except ValueError:
+            raise ConvertException(self, argument)
+
+
+class Float(Convertible):
+    def convert(self, argument: str) -> float:
+        try:
+            return float(argument)
+        except ValueError:
+            raise ConvertException(self, argument)
+
+
+def function(test):
+    return test
+
+
+class Foo:
+    @convert(ConvertHandler(Int()))
+    def test(self, test):
+        return test
+
+
+@benchmark("call.raw")
+def call_raw():
+    return lambda: function("1")
+
+
+@benchmark("call.convert.function")
+def call_function():
+    test = convert(ConvertHandler(Int()))(function)
+    return lambda: test("1")
+
+
+@benchmark("call.convert.method")
+def call_method():
+    foo = Foo()
+    return lambda: foo.test("1")
+
+
+@benchmark("call.convert.keyword")
+def call_keyword():
+    test = convert(ConvertHandler(Int()))(function)
+    return lambda: test(test="1")
+
+
+@benchmark("call.convert.keywords")
+def call_keywords():
+    names = [f"test{index}" for index in range(10)]
+    test = convert(ConvertHandler(**{name: Int() for name in names}))(lambda **kwargs: kwargs)
+    kwargs = {name: str(index) for index, name in enumerate(names)}
+    return lambda: test(**kwargs)
+
+
+def _greedy(amount: int):
+    test = convert(ConvertHandler(Greedy(Int())))(function)
+    args = [str(index) for index in range(amount)]
+    return lambda: test(*args)
+
+
+@benchmark("greedy.1")
+def greedy_1():
+    return _greedy(1)
+
+
+@benchmark("greedy.10")
+def greedy_10():
+    return _greedy(10)
+
+
+@benchmark("greedy.1000")
+def greedy_1000():
+    return _greedy(1000)
+
+
+@benchmark("optional.hit")
+def optional_hit():
+    test = convert(ConvertHandler(Optional(Int())))(function)
+    return lambda: test("1")
+
+
+@benchmark("optional.miss")
+def optional_miss():
+    test = convert(ConvertHandler(Optional(Int())))(function)
+    return lambda: test("a")
+
+
+@benchmark("first_of.second")
+def first_of_second():
+    test = convert(ConvertHandler(FirstOf(Int(), Float())))(function)
+    return lambda: test("1.5")
+
+
+@benchmark("first_of.adaptive")
+def first_of_adaptive():
+    test = convert(ConvertHandler(FirstOf(Int(), Float(), adaptive=True)))(function)
+    return lambda: test("1.5")
@@ -0,0 +1,88 @@
+"""
+Measures the time to import the package with ``python -X importtime``, failing once a statement exceeds its budget.
+
+Run it with ``python -m benchmarks.importtime``, which prints the results as JSON and exits with a status of 1 if any
+statement is over budget.
+"""
+
+from typing import Dict, List
+from argparse import ArgumentParser
+import json
+import platform
+import subprocess
+import sys
+
+# The budget of each statement, in milliseconds of the cumulative import time of the package.
+BUDGETS: Dict[str, float] = {
+    "import convertible": 5.0,
+    "from convertible import Convertible": 25.0,
+    "from convertible import convert": 60.0,
+}
+
+
+def measure(statement: str, package: str = "convertible") -> float:
+    """
+    Measures the import time of a statement in a new interpreter.
+
+    Parameters
+    ----------
+    statement : str
+        The statement that imports the package.
+    package : str, optional
+        The package whose modules are timed, by default "convertible"
+
+    Returns
+    -------
+    float
+        The cumulative import time, in milliseconds, of the modules of the package imported at the top level.
+        The time of modules imported by the package, such as typing, is included.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    total = 0
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        # Nested modules are indented, so only the modules imported by the statement itself are counted.
+        if name[1:].split(".")[0] == package and cumulative.strip().isdigit():
+            total += int(cumulative)
+    return total / 1000
+
+
+def main():
+    parser = ArgumentParser(prog="python -m benchmarks.importtime", description=__doc__)
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="the amount of measurements of each statement")
+    parser.add_argument("-o", "--output", help="the file to write the results to, instead of stdout")
+    arguments = parser.parse_args()
+
+    results = {}
+    over: List[str] = []
+    for statement, budget in BUDGETS.items():
+        # The first import compiles the modules, so it is not measured.
+        measure(statement)
+        times = [measure(statement) for _ in range(arguments.repeat)]
+        results[statement] = {"min": min(times), "budget": budget}
+        if min(times) > budget:
+            over.append(statement)
+    report = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "results": results,
+    }
+
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            json.dump(report, file, indent=4)
+    else:
+        json.dump(report, sys.stdout, indent=4)
+        print()
+
+    if over:
+        print(f"Over budget: {', '.join(over)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
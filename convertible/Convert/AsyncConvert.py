@@ -0,0 +1,148 @@
+from typing import Callable, Optional, Any, List, Sequence, Iterable, Iterator, Union
+from inspect import iscoroutinefunction
+
+from convertible.Convertible import AsyncConvertible
+
+from .Convert import Convert
+from .ConvertHandler.ConvertHandler import ConvertHandler
+from .ConvertHandler.CallPlan import CallPlan
+from .ExceptionHandler.ExceptionHandler import ExceptionHandler
+from .ExceptionHandler.ConvertException import ConvertException
+
+
+class AsyncConvert(Convert):
+    """
+    A Convert for coroutine functions and for ConvertHandlers with an AsyncConvertible.
+    Calling it returns a coroutine, which awaits every asynchronous conversion of the call concurrently, so the
+    latency of a call is the latency of its slowest conversion.
+    """
+
+    __slots__ = ("coroutine", "synchronous", "positions", "keywords")
+
+    def __init__(
+        self,
+        function: Callable,
+        convert_handler: ConvertHandler,
+        exception_handler: Optional[ExceptionHandler] = None,
+        method: bool = False,
+    ):
+        """
+        Initializes the AsyncConvert class, which acts as a callable descriptor.
+
+        Parameters
+        ----------
+        function : Callable
+            The function we are decorating, which may be a coroutine function.
+        convert_handler : ConvertHandler
+            The convert handler provided.
+            This manages the many Convertibles for arguments and keyword arguments, respectively.
+        exception_handler : Optional[ExceptionHandler], optional
+            The manager for any exceptions, by default None
+            This will be called if a ConvertHandler raises a ConvertException.
+            If None is provided, the ConvertExceptions will leak passed the Convert class.
+        method : bool, optional
+            If the function is called as a method, so its first argument is passed through unconverted, by default
+            False
+        """
+        super().__init__(function, convert_handler, exception_handler, specialize=False, method=method)
+        self.coroutine = iscoroutinefunction(function)
+        self._split()
+
+    def _replan(self, plan: CallPlan):
+        super()._replan(plan)
+        self._split()
+
+    def _split(self):
+        """
+        Separates the AsyncConvertibles of the plan from the plan of the other Convertibles.
+        """
+        plan = self.plan
+        self.positions = tuple(
+            index for index, convertible in enumerate(plan.positional) if isinstance(convertible, AsyncConvertible)
+        )
+        self.keywords = tuple(
+            key for key, convertible in plan.keywords.items() if isinstance(convertible, AsyncConvertible)
+        )
+        positional = list(plan.positional)
+        for index in self.positions:
+            positional[index] = None
+        keywords = {key: convertible for key, convertible in plan.keywords.items() if key not in self.keywords}
+        self.synchronous = CallPlan(tuple(positional), keywords)
+
+    @staticmethod
+    def required(function: Callable, convert_handler: ConvertHandler) -> bool:
+        """
+        Determines if a function and ConvertHandler must be wrapped by AsyncConvert instead of Convert.
+
+        Parameters
+        ----------
+        function : Callable
+            The function we are decorating.
+        convert_handler : ConvertHandler
+            The convert handler provided.
+
+        Returns
+        -------
+        bool
+            If the function is a coroutine function or the ConvertHandler has an AsyncConvertible.
+        """
+        return convert_handler.plan.asynchronous or iscoroutinefunction(function)
+
+    async def __call__(self, *args, **kwargs):
+        """
+        The actual decorator for the descriptor.  When awaited, this will automatically convert all eligible arguments.
+        """
+        # The other Convertibles are converted first, so a ConvertException they raise does not leave any coroutine
+        # of an AsyncConvertible that is never awaited.
+        plan = self.synchronous
+        if plan.variadic:
+            args = self._get_variadic_arguments(plan.positional, args)
+        else:
+            args = self._get_arguments(plan.positional, args)
+        if kwargs and plan.keywords:
+            kwargs = self._get_keyword_arguments(plan.keywords, kwargs)
+
+        # The AsyncConvertibles provide coroutines, which are awaited together.
+        positional, keywords = self.plan.positional, self.plan.keywords
+        pending = [(args, index, positional[index]) for index in self.positions if index < len(args)]
+        pending.extend((kwargs, key, keywords[key]) for key in self.keywords if key in kwargs)
+        if pending:
+            # asyncio is imported once required, as importing it is slower than the rest of the package.
+            from asyncio import gather
+
+            coroutines = [convertible.convert(container[key]) for container, key, convertible in pending]
+            results = await gather(*coroutines, return_exceptions=True)
+            for (container, key, _), result in zip(pending, results):
+                if isinstance(result, ConvertException):
+                    result = self.exception_handler(result)
+                elif isinstance(result, BaseException):
+                    raise result
+                container[key] = result
+
+        result = self.function(*args, **kwargs)
+        if self.coroutine:
+            return await result
+        return result
+
+    def starmap(
+        self, rows: Iterable[Sequence[Any]], chunksize: Optional[int] = None
+    ) -> Union[List[Any], Iterator[Any]]:
+        """
+        Calls the function once for each row of positional arguments, like itertools.starmap.
+
+        Parameters
+        ----------
+        rows : Iterable[Sequence[Any]]
+            The positional arguments of each call.
+        chunksize : Optional[int], optional
+            The amount of calls to create at once, by default None
+            If provided, a generator is returned instead of a list.
+
+        Returns
+        -------
+        Union[List[Any], Iterator[Any]]
+            The coroutines of each call, in order, which can be awaited together.
+        """
+        if chunksize is not None:
+            return self._starmap_chunks(iter(rows), chunksize)
+        return [self(*row) for row in rows]
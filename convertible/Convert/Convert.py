@@ -1,23 +1,109 @@
-from typing import Callable, Optional, Iterator, Any, List, Dict, Union
+from typing import TYPE_CHECKING, Callable, Optional, Any, List, Dict, Tuple, Sequence, Iterable, Iterator, Union
+from itertools import islice, repeat
+from functools import partial
+from inspect import ismethod
+from types import MethodType
+from copyreg import __newobj__
 
 from convertible.Convertible import Convertible
+from convertible.Convertible.NoMoreArguments import NoMoreArguments
+from convertible.ignore_self import locate
 
 from .NextArgumentException import NextArgumentException
 from .RejectArgumentException import RejectArgumentException
-from .ConvertHandler.ConvertHandler import ConvertHandler, _InnerArgIterator
+from .ConvertHandler.ConvertHandler import ConvertHandler
+from .ConvertHandler.CallPlan import CallPlan
 from .ExceptionHandler.ExceptionHandler import ExceptionHandler
 from .ExceptionHandler.ConvertException import ConvertException
+from .Instrumentation import Instrumentation, Hook
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
-class NoMoreArguments:
-    """A class to indicate when there are no more arguments from the iterator"""
+
+class _FunctionReference:
+    """
+    A reference to a function that was replaced in its module by a decorator, such as convert, so it can be pickled.
+    """
+
+    __slots__ = ("module", "qualname")
+
+    def __init__(self, module: str, qualname: str):
+        self.module = module
+        self.qualname = qualname
+
+    @classmethod
+    def create(cls, function: Callable) -> Union[Callable, "_FunctionReference", "_MethodReference"]:
+        """
+        Creates a reference to the function if it was replaced by a decorator wrapping it.
+        Bound methods are referenced by their function and instance, as the function may be replaced in its class.
+        """
+        if ismethod(function):
+            return _MethodReference(cls.create(function.__func__), function.__self__)
+        try:
+            located = locate(function.__module__, function.__qualname__)
+        except (AttributeError, ImportError, TypeError):
+            return function
+        if located is not function and getattr(located, "__wrapped__", None) is function:
+            return cls(function.__module__, function.__qualname__)
+        return function
+
+    def resolve(self) -> Callable:
+        return locate(self.module, self.qualname).__wrapped__
+
+
+class _MethodReference:
+    """
+    A reference to a bound method, by its function and the instance it is bound to.
+    """
+
+    __slots__ = ("function", "instance")
+
+    def __init__(self, function: Union[Callable, _FunctionReference], instance: Any):
+        self.function = function
+        self.instance = instance
+
+    def resolve(self) -> Callable:
+        function = self.function
+        if isinstance(function, _FunctionReference):
+            function = function.resolve()
+        return MethodType(function, self.instance)
+
+
+def _convert_rows(convert: "Convert", rows: Sequence[Sequence[Any]], call: bool, return_exceptions: bool) -> List[Any]:
+    """
+    Converts and calls each row of a chunk of Convert.parallel_map inside of a worker.
+    """
+    results = []
+    for row in rows:
+        try:
+            results.append(convert(*row) if call else convert.convert_call(*row)[0])
+        except Exception as exception:
+            if not return_exceptions:
+                raise
+            results.append(exception)
+    return results
 
 
 class Convert:
-    __slots__ = ("function", "convert_handler", "exception_handler")
+    __slots__ = (
+        "function",
+        "convert_handler",
+        "exception_handler",
+        "plan",
+        "specialized",
+        "instrumentation",
+        "method",
+        "_method",
+    )
 
     def __init__(
-        self, function: Callable, convert_handler: ConvertHandler, exception_handler: Optional[ExceptionHandler] = None
+        self,
+        function: Callable,
+        convert_handler: ConvertHandler,
+        exception_handler: Optional[ExceptionHandler] = None,
+        specialize: bool = True,
+        method: bool = False,
     ):
         """
         Initializes the Convert class, which acts as a callable descriptor.
@@ -33,114 +119,302 @@ class Convert:
             The manager for any exceptions, by default None
             This will be called if a ConvertHandler raises a ConvertException.
             If None is provided, the ConvertExceptions will leak passed the Convert class.
+        specialize : bool, optional
+            If calls are converted by a function generated for the call plan, by default True
+            Plans with a Convertible that can consume multiple arguments are always converted generically.
+        method : bool, optional
+            If the function is called as a method, so its first argument is passed through unconverted, by default
+            False
         """
         self.function = function
         self.convert_handler = convert_handler
         self.exception_handler = exception_handler or ExceptionHandler({})
+        self.method = method
+        self.plan = convert_handler.bind(function, method)
+        self.specialized = self.plan.compile() if specialize else None
+        self.instrumentation: Optional[Instrumentation] = None
+        self._method: Optional[Convert] = None
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.function}, {self.convert_handler}, {self.exception_handler})"
 
-    def __get__(self, obj, type):
+    @property
+    def __wrapped__(self) -> Callable:
+        """The function decorated."""
+        return self.function
+
+    def __reduce__(self):
+        try:
+            located = locate(self.function.__module__, self.function.__qualname__)
+        except (AttributeError, ImportError, TypeError):
+            located = None
+        if located is self:
+            # The Convert replaces the function in its module, so it is pickled by the name of the function.
+            return locate, (self.function.__module__, self.function.__qualname__)
+        return __newobj__, (type(self),), self.__getstate__()
+
+    def __getstate__(self) -> Tuple:
+        return (
+            _FunctionReference.create(self.function),
+            self.convert_handler,
+            self.exception_handler,
+            self.specialized is not None,
+            self.method,
+        )
+
+    def __setstate__(self, state: Tuple):
+        function, convert_handler, exception_handler, specialized, method = state
+        if isinstance(function, (_FunctionReference, _MethodReference)):
+            function = function.resolve()
+        self.__init__(function, convert_handler, exception_handler, method=method)
+        if not specialized:
+            self.specialized = None
+
+    def instrument(self, on_convert: Optional[Hook] = None, reservoir: int = 1024) -> Instrumentation:
+        """
+        Measures the calls, latencies and failures of each Convertible, until uninstrument is called.
+        The Convertibles of the plan are replaced by Convertibles that measure them, so calls are not slowed down
+        while the Convert is not instrumented.  The calls of the function as a method of any instance are measured
+        together with the calls of the function.
+
+        Parameters
+        ----------
+        on_convert : Optional[Hook], optional
+            A hook called after each conversion with the Convertible, the argument, the result and the amount of
+            seconds elapsed, by default None
+        reservoir : int, optional
+            The most amount of latencies kept for the percentiles of each Convertible, by default 1024
+
+        Returns
+        -------
+        Instrumentation
+            The measurements of each Convertible.
+        """
+        instrumentation = Instrumentation(on_convert, reservoir)
+        for convert in self._converts():
+            convert._instrument(instrumentation)
+        return instrumentation
+
+    def uninstrument(self):
+        """
+        Stops measuring the Convertibles.
+        """
+        for convert in self._converts():
+            if convert.instrumentation is not None:
+                convert._instrument(None)
+
+    def _converts(self) -> Tuple["Convert", ...]:
+        """
+        Provides the Convert and the Convert of the function as a method, once it was looked up on an instance.
+        """
+        return (self,) if self._method is None else (self, self._method)
+
+    def _instrument(self, instrumentation: Optional[Instrumentation]):
+        """
+        Replaces the instrumentation, measuring the Convertibles of the plan if an instrumentation is provided.
+        """
+        self.instrumentation = instrumentation
+        plan = self.convert_handler.bind(self.function, self.method)
+        self._replan(plan if instrumentation is None else instrumentation.instrument(plan))
+
+    def _replan(self, plan: CallPlan):
+        """
+        Replaces the plan of the calls, generating the specialized function again if calls were specialized.
+        """
+        specialize = self.specialized is not None
+        self.plan = plan
+        self.specialized = plan.compile() if specialize else None
+
+    def __get__(self, obj, type=None):
         if obj is None:
             return self
-        return self.function
+        # Every instance shares the Convert of the method, which passes the instance through unconverted.
+        return BoundConvert(self._method or self._bind_method(), obj)
+
+    def _bind_method(self) -> "Convert":
+        """
+        Creates the Convert of the function called as a method.
+        """
+        method = type(self)(self.function, self.convert_handler, self.exception_handler, method=True)
+        if self.specialized is None:
+            method.specialized = None
+        if self.instrumentation is not None:
+            method._instrument(self.instrumentation)
+        self._method = method
+        return method
 
     def __call__(self, *args, **kwargs):
         """
         The actual decorator for the descriptor.  When called, this will automatically convert all eligible arguments.
         """
-        args_iter, kwargs_iter = self.convert_handler(*args, **kwargs)
-        return self.function(*self._get_arguments(args_iter), **self._get_keyword_argument(kwargs_iter))
+        if self.specialized is not None:
+            return self.specialized(self.function, self.exception_handler, args, kwargs)
+        args, kwargs = self.convert_call(*args, **kwargs)
+        return self.function(*args, **kwargs)
+
+    def convert_call(self, *args, **kwargs) -> Tuple[List[Any], Dict[str, Any]]:
+        """
+        Converts all eligible arguments of a call, without calling the function.
 
-    def _validate(self, iterator: Iterator) -> Any:
+        Returns
+        -------
+        Tuple[List[Any], Dict[str, Any]]
+            The converted arguments and keyword arguments, respectively.
         """
-        Validates a Convertible and handles simple exceptions.
+        plan = self.plan
+        if plan.variadic:
+            args = self._get_variadic_arguments(plan.positional, args)
+        else:
+            args = self._get_arguments(plan.positional, args)
+        if kwargs and plan.keywords:
+            kwargs = self._get_keyword_arguments(plan.keywords, kwargs)
+        return args, kwargs
+
+    def map(self, arguments: Iterable[Any], chunksize: Optional[int] = None) -> Union[List[Any], Iterator[Any]]:
+        """
+        Calls the function once for each argument, like the builtin map.
 
         Parameters
         ----------
-        iterator : Iterator
-            The iterator yielding the next result.
+        arguments : Iterable[Any]
+            The single positional argument of each call.
+        chunksize : Optional[int], optional
+            The amount of calls to convert at once, by default None
+            If provided, a generator is returned instead of a list.
 
         Returns
         -------
-        Any
-            The argument provided after converting it or leaving it as is.
+        Union[List[Any], Iterator[Any]]
+            The results of each call, in order.
         """
-        try:
-            return next(iterator)
-        except ConvertException as exception:
-            self.exception_handler(exception)
+        return self.starmap(((argument,) for argument in arguments), chunksize)
 
-    def _handle_next_argument_convertible(self, iterator: _InnerArgIterator, convertible: Convertible) -> Any:
+    def starmap(
+        self, rows: Iterable[Sequence[Any]], chunksize: Optional[int] = None
+    ) -> Union[List[Any], Iterator[Any]]:
         """
-        Some Convertibles can request to have an additional argument provided.
-        To provide the extra arguments, this method pulls the next argument from the iterator.
+        Calls the function once for each row of positional arguments, like itertools.starmap.
+        The arguments are converted column-wise through CallPlan.convert_batch before any call is made.
 
         Parameters
         ----------
-        iterator : Iterator
-            The iterator yielding the next result.
-        convertible : Convertible
-            The argument provided after converting it or leaving it as is.
-        arguments: List
-            The arguments that are currently provided to the convertible.
+        rows : Iterable[Sequence[Any]]
+            The positional arguments of each call.
+        chunksize : Optional[int], optional
+            The amount of calls to convert at once, by default None
+            If provided, a generator is returned instead of a list.
+
+        Returns
+        -------
+        Union[List[Any], Iterator[Any]]
+            The results of each call, in order.
         """
+        if chunksize is not None:
+            return self._starmap_chunks(iter(rows), chunksize)
+        if self.plan.variadic:
+            return [self(*row) for row in rows]
+        function = self.function
+        return [function(*args) for args in self.plan.convert_batch(rows, self.exception_handler)]
 
-        try:
-            # The Iterator will be of type _InnerArgIterator, having the method get_next.
-            argument = iterator.get_next()
-        except StopIteration:
-            # StopIteration is passed to the convertible to indicate that there are no more arguments.
-            argument = NoMoreArguments()
+    def parallel_map(
+        self,
+        rows: Iterable[Sequence[Any]],
+        executor: Optional["Executor"] = None,
+        chunksize: int = 1,
+        call: bool = True,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Converts, and optionally calls the function for, each row of positional arguments in parallel.
+        Each chunk of rows is sent to a worker of the executor together with a pickled copy of the Convert, so the
+        function, the ConvertHandler and the ExceptionHandler must be picklable.  Functions decorated at the top
+        level of a module are pickled by their name.
 
-        try:
-            return convertible.convert(argument)
-        except NextArgumentException as exception:
-            return self._handle_next_argument_convertible(iterator, exception.convertible)
-        except RejectArgumentException as exception:
-            # The Iterator will be of type _InnerArgIterator, having the method undo.
-            iterator.undo()
-            return exception.result
-        except ConvertException as exception:
-            self.exception_handler(exception)
+        Parameters
+        ----------
+        rows : Iterable[Sequence[Any]]
+            The positional arguments of each call.
+        executor : Optional[Executor], optional
+            The executor that runs the chunks, by default None
+            If None is provided, a ProcessPoolExecutor is created for the duration of the call.
+        chunksize : int, optional
+            The amount of rows sent to a worker at once, by default 1
+        call : bool, optional
+            If the function is called in the worker, by default True
+            Otherwise, the converted positional arguments of each row are provided.
+        return_exceptions : bool, optional
+            If exceptions are provided in place of the result of their row, by default False
+            Otherwise, the first exception is raised.
+
+        Returns
+        -------
+        List[Any]
+            The results of each row, in order.
+
+        Raises
+        ------
+        ValueError
+            Raises an exception if the chunksize is not positive.
+        """
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be at least 1, not {chunksize!r}")
+        rows = list(rows)
+        chunks = [rows[index : index + chunksize] for index in range(0, len(rows), chunksize)]
+        arguments = (repeat(self), chunks, repeat(call), repeat(return_exceptions))
 
-    def _validate_args(self, iterator: Union[Iterator, _InnerArgIterator]) -> Any:
+        if executor is None:
+            # concurrent.futures is imported once required, as it imports multiprocessing.
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(_convert_rows, *arguments))
+        else:
+            results = list(executor.map(_convert_rows, *arguments))
+        return [result for chunk in results for result in chunk]
+
+    def _starmap_chunks(self, rows: Iterator[Sequence[Any]], chunksize: int) -> Iterator[Any]:
         """
-        Provides an extra series of checks for simple exceptions, to provide the ability to combine
-        multiple arguments together to form types such as lists and sets.
+        Lazily calls the function for each row, converting chunksize rows at a time.
+        """
+        while chunk := list(islice(rows, chunksize)):
+            yield from self.starmap(chunk)
+
+    def _get_arguments(self, convertibles: Sequence[Optional[Convertible]], args: Sequence[Any]) -> List[Any]:
+        """
+        Converts the positional arguments when each Convertible converts exactly one argument.
 
         Parameters
         ----------
-        iterator : Iterator
-            The iterator yielding the next result.
+        convertibles : Sequence[Optional[Convertible]]
+            The Convertibles of the call plan, in order.
+        args : Sequence[Any]
+            The arguments passed to __call__.
 
         Returns
         -------
-        Any
-            The argument provided after converting it or leaving it as is.
+        List[Any]
+            The results of the arguments if no exceptions occur.
         """
-        try:
-            return self._validate(iterator)
-        except NextArgumentException as exception:
-            if isinstance(iterator, _InnerArgIterator):
-                return self._handle_next_argument_convertible(iterator, exception.convertible)
-            raise
-        except RejectArgumentException as exception:
-            if isinstance(iterator, _InnerArgIterator):
-                iterator.undo()
-                return exception.result
-            raise
+        new_args = list(args)
+        for index, (convertible, argument) in enumerate(zip(convertibles, args)):
+            if convertible is None:
+                continue
+            try:
+                new_args[index] = convertible.convert(argument)
+            except ConvertException as exception:
+                new_args[index] = self.exception_handler(exception)
+        return new_args
 
-    def _get_arguments(self, iterator: _InnerArgIterator, *args: Any) -> List[Any]:
+    def _get_variadic_arguments(self, convertibles: Sequence[Optional[Convertible]], args: Sequence[Any]) -> List[Any]:
         """
-        Generates the a list of all the arguments passed from __call__.
+        Converts the positional arguments when a Convertible may consume multiple arguments.
+        Each Convertible provides a single result, regardless of the amount of arguments it consumed.
 
         Parameters
         ----------
-        iterator : Iterator
-            The argument iterator that will automatically convert the arguments specified.
-        args: Any
+        convertibles : Sequence[Optional[Convertible]]
+            The Convertibles of the call plan, in order.
+        args : Sequence[Any]
             The arguments passed to __call__.
 
         Returns
@@ -149,22 +423,73 @@ class Convert:
             The results of the arguments if no exceptions occur.
         """
         new_args = []
-        while True:
+        index = 0
+        for convertible in convertibles:
+            if index >= len(args):
+                return new_args
+            if convertible is None:
+                new_args.append(args[index])
+                index += 1
+                continue
             try:
-                new_args.append(self._validate_args(iterator))
-            except StopIteration:
-                break
+                result, consumed = convertible.convert_arguments(args, index)
+                index += consumed
+            except NextArgumentException as exception:
+                # Convertibles that only implement the exception protocol are still supported.
+                result, index = self._handle_next_argument_convertible(exception.convertible, args, index + 1)
+            except RejectArgumentException as exception:
+                result = exception.result
+            except ConvertException as exception:
+                result = self.exception_handler(exception)
+                index += 1
+            new_args.append(result)
+        new_args.extend(args[index:])
         return new_args
 
-    def _get_keyword_argument(self, iterator: Iterator, **kwargs: Any) -> Dict[str, Any]:
+    def _handle_next_argument_convertible(
+        self, convertible: Convertible, args: Sequence[Any], index: int
+    ) -> Tuple[Any, int]:
+        """
+        Some Convertibles request additional arguments by raising a NextArgumentException.
+        To provide the extra arguments, this method continues to pull arguments until the Convertible provides a
+        result or rejects the last argument.
+
+        Parameters
+        ----------
+        convertible : Convertible
+            The Convertible that requested the argument at index.
+        args : Sequence[Any]
+            The arguments passed to __call__.
+        index : int
+            The index of the next argument to provide.
+
+        Returns
+        -------
+        Tuple[Any, int]
+            The result of the Convertible and the index of the next argument that was not consumed.
         """
-        Generates the a list of all the keyword arguments passed from __call__.
+        while True:
+            # NoMoreArguments is passed to the convertible to indicate that there are no more arguments.
+            argument = args[index] if index < len(args) else NoMoreArguments()
+            try:
+                return convertible.convert(argument), index + 1
+            except NextArgumentException as exception:
+                convertible = exception.convertible
+            except RejectArgumentException as exception:
+                return exception.result, index
+            except ConvertException as exception:
+                return self.exception_handler(exception), index + 1
+            index += 1
+
+    def _get_keyword_arguments(self, convertibles: Dict[str, Convertible], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Converts the keyword arguments passed from __call__ in place.
 
         Parameters
         ----------
-        iterator : Iterator
-            The keyword argument iterator that will automatically convert the keyword arguments specified.
-        kwargs : Any
+        convertibles : Dict[str, Convertible]
+            The Convertibles of the call plan, by keyword.
+        kwargs : Dict[str, Any]
             The keyword arguments passed to __call__.
 
         Returns
@@ -172,11 +497,61 @@ class Convert:
         Dict[str, Any]
             The results of the keyword arguments if no exceptions occur.
         """
-        new_kwargs = {}
-        while True:
+        for key, argument in kwargs.items():
+            convertible = convertibles.get(key)
+            if convertible is None:
+                continue
             try:
-                key, value = self._validate_args(iterator)
-            except StopIteration:
-                break
-            new_kwargs.update({key: value})
-        return new_kwargs
+                kwargs[key] = convertible.convert(argument)
+            except ConvertException as exception:
+                kwargs[key] = self.exception_handler(exception)
+        return kwargs
+
+
+class BoundConvert(partial):
+    """
+    A Convert bound to an instance, which is provided when a Convert is looked up on an instance.
+    It is created with the Convert of the method, which passes the instance through unconverted, and the instance.
+    The Convert of the method is shared by every instance, so binding only creates this partial of it.
+    """
+
+    __slots__ = ()
+
+    @property
+    def convert(self) -> Convert:
+        """The Convert of the method."""
+        return self.func
+
+    @property
+    def instance(self) -> Any:
+        """The instance the method is bound to."""
+        return self.args[0]
+
+    def __getattr__(self, name: str) -> Any:
+        # Provides the attributes of the Convert of the method, such as the plan.
+        return getattr(self.func, name)
+
+    def convert_call(self, *args, **kwargs) -> Tuple[List[Any], Dict[str, Any]]:
+        """
+        Converts all eligible arguments of a call, without calling the method, see Convert.convert_call.
+        """
+        args, kwargs = self.func.convert_call(*self.args, *args, **kwargs)
+        return args[1:], kwargs
+
+    # The rows are converted and called through the BoundConvert, which is pickled with the instance.
+    parallel_map = Convert.parallel_map
+
+    def map(self, arguments: Iterable[Any], chunksize: Optional[int] = None) -> Union[List[Any], Iterator[Any]]:
+        """
+        Calls the method once for each argument, see Convert.map.
+        """
+        return self.starmap(((argument,) for argument in arguments), chunksize)
+
+    def starmap(
+        self, rows: Iterable[Sequence[Any]], chunksize: Optional[int] = None
+    ) -> Union[List[Any], Iterator[Any]]:
+        """
+        Calls the method once for each row of positional arguments, see Convert.starmap.
+        """
+        instance = self.args[0]
+        return self.func.starmap(((instance, *row) for row in rows), chunksize)
@@ -0,0 +1,213 @@
+from typing import Tuple, Dict, Optional, Iterable, Sequence, Any, List, Callable
+from inspect import Signature, Parameter
+
+from convertible.Convertible import Convertible, AsyncConvertible
+from convertible.Convert.ExceptionHandler.ConvertException import ConvertException
+
+_UNCOMPILED = object()
+_POSITIONAL = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+_KEYWORD = (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY)
+
+
+class CallPlan:
+    """
+    A precompiled description of how the arguments of a call are converted.
+    The plan is built once by the ConvertHandler, so Convert can convert each call in a single loop without
+    constructing any iterators.
+    """
+
+    __slots__ = ("positional", "keywords", "variadic", "asynchronous", "_compiled")
+
+    def __init__(self, positional: Tuple[Optional[Convertible], ...], keywords: Dict[str, Convertible]):
+        """
+        Initializes a CallPlan.
+
+        Parameters
+        ----------
+        positional : Tuple[Optional[Convertible], ...]
+            The Convertibles for the positional arguments, in order.
+            None is provided for the positional arguments that are not converted.
+        keywords : Dict[str, Convertible]
+            The Convertibles for the keyword arguments, by the name of the keyword.
+
+        Raises
+        ------
+        TypeError
+            Raises an exception if a Convertible wraps an AsyncConvertible, as only the AsyncConvertibles of the plan
+            itself are awaited.
+        """
+        self.positional = positional
+        self.keywords = keywords
+        self.variadic = any(convertible is not None and convertible.multiple_arguments for convertible in positional)
+        self.asynchronous = False
+        for convertible in (*positional, *keywords.values()):
+            if isinstance(convertible, AsyncConvertible):
+                self.asynchronous = True
+            elif convertible is not None and convertible.asynchronous:
+                raise TypeError(f"{convertible} wraps an AsyncConvertible, which would not be awaited")
+        self._compiled = _UNCOMPILED
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.positional}, {self.keywords})"
+
+    def __getstate__(self) -> Tuple[Tuple[Optional[Convertible], ...], Dict[str, Convertible]]:
+        # The generated function cannot be pickled, so it is generated again once required.
+        return self.positional, self.keywords
+
+    def __setstate__(self, state: Tuple[Tuple[Optional[Convertible], ...], Dict[str, Convertible]]):
+        self.__init__(*state)
+
+    def bind(self, signature: Signature) -> "CallPlan":
+        """
+        Binds the plan to the parameters of a function, so each parameter is converted by the same Convertible
+        regardless of if it is passed positionally or by keyword.
+        The positional Convertibles map onto the positional parameters in order and the keyword Convertibles map
+        onto the parameters of the same name, taking precedence over the positional Convertibles.
+
+        Parameters
+        ----------
+        signature : Signature
+            The signature of the function that is converted.
+
+        Returns
+        -------
+        CallPlan
+            The plan for the parameters of the function.
+        """
+        parameters = signature.parameters
+        positional_parameters = [name for name, parameter in parameters.items() if parameter.kind in _POSITIONAL]
+
+        convertibles = dict(zip(positional_parameters, self.positional))
+        convertibles.update(self.keywords)
+
+        positional = [convertibles.get(name) for name in positional_parameters]
+        if len(self.positional) > len(positional_parameters):
+            # The remaining Convertibles convert the variadic positional arguments.
+            positional.extend(self.positional[len(positional_parameters) :])
+        while positional and positional[-1] is None:
+            positional.pop()
+
+        keywords = {
+            name: convertible
+            for name, convertible in convertibles.items()
+            if convertible is not None
+            and not convertible.multiple_arguments
+            and (name not in parameters or parameters[name].kind in _KEYWORD)
+        }
+        return CallPlan(tuple(positional), keywords)
+
+    def compile(self) -> Optional[Callable[[Callable, Callable, Tuple, Dict[str, Any]], Any]]:
+        """
+        Generates a function specialized to the plan, which converts the arguments of a call with straight-line code
+        and then calls the function, similar to how dataclasses generates __init__.
+        The function is only generated once for each plan.
+
+        Returns
+        -------
+        Optional[Callable[[Callable, Callable, Tuple, Dict[str, Any]], Any]]
+            A function that takes the function to call, the exception handler, the positional arguments and the
+            keyword arguments.
+            If the plan has a Convertible that can consume multiple arguments or is asynchronous, None is provided,
+            as the generic conversion is required.
+        """
+        if self._compiled is _UNCOMPILED:
+            self._compiled = None if self.variadic or self.asynchronous else self._compile()
+        return self._compiled
+
+    def _compile(self) -> Callable[[Callable, Callable, Tuple, Dict[str, Any]], Any]:
+        namespace = {"ConvertException": ConvertException}
+        lines = ["def __convert__(function, handle, args, kwargs):"]
+
+        positional = [
+            (index, convertible) for index, convertible in enumerate(self.positional) if convertible is not None
+        ]
+        if positional:
+            lines += ["    length = len(args)", "    if length:", "        args = list(args)"]
+        for index, convertible in positional:
+            namespace[f"_positional_{index}"] = convertible.convert
+            lines += [
+                f"    if length > {index}:",
+                "        try:",
+                f"            args[{index}] = _positional_{index}(args[{index}])",
+                "        except ConvertException as exception:",
+                f"            args[{index}] = handle(exception)",
+            ]
+
+        if self.keywords:
+            lines.append("    if kwargs:")
+        for index, (name, convertible) in enumerate(self.keywords.items()):
+            namespace[f"_keyword_{index}"] = convertible.convert
+            lines += [
+                f"        if {name!r} in kwargs:",
+                "            try:",
+                f"                kwargs[{name!r}] = _keyword_{index}(kwargs[{name!r}])",
+                "            except ConvertException as exception:",
+                f"                kwargs[{name!r}] = handle(exception)",
+            ]
+
+        lines.append("    return function(*args, **kwargs)")
+        exec("\n".join(lines), namespace)
+        return namespace["__convert__"]
+
+    def convert_batch(
+        self, rows: Iterable[Sequence[Any]], exception_handler: Optional[Callable[[ConvertException], Any]] = None
+    ) -> List[List[Any]]:
+        """
+        Converts the positional arguments of many calls at once.
+        The rows are converted column-wise, so each Convertible converts every argument of its column in a single
+        call to Convertible.convert_many.
+
+        Parameters
+        ----------
+        rows : Iterable[Sequence[Any]]
+            The positional arguments of each call.
+        exception_handler : Optional[Callable[[ConvertException], Any]], optional
+            The manager for any exceptions, by default None
+            If a column raises a ConvertException, it is converted one argument at a time and the result of the
+            exception handler is used for each argument that could not be converted.
+            If None is provided, the ConvertExceptions will leak passed the CallPlan.
+
+        Returns
+        -------
+        List[List[Any]]
+            The converted positional arguments of each call, in order.
+
+        Raises
+        ------
+        ValueError
+            Raises an exception if a Convertible of the plan can consume multiple arguments.
+        """
+        if self.variadic:
+            raise ValueError(f"{self} cannot convert multiple arguments column-wise")
+
+        results = [list(row) for row in rows]
+        width = max(map(len, results), default=0)
+        for index, convertible in enumerate(self.positional[:width]):
+            if convertible is None:
+                continue
+            members = [row for row in results if len(row) > index]
+            column = [row[index] for row in members]
+            try:
+                column = convertible.convert_many(column)
+            except ConvertException:
+                if exception_handler is None:
+                    raise
+                column = _convert_column(convertible, column, exception_handler)
+            for row, result in zip(members, column):
+                row[index] = result
+        return results
+
+
+def _convert_column(
+    convertible: Convertible, column: List[Any], exception_handler: Callable[[ConvertException], Any]
+) -> List[Any]:
+    """
+    Converts a column one argument at a time, handling the ConvertException of each argument.
+    """
+    results = []
+    for argument in column:
+        try:
+            results.append(convertible.convert(argument))
+        except ConvertException as exception:
+            results.append(exception_handler(exception))
+    return results
@@ -1,6 +1,11 @@
-from typing import Tuple, Any, Iterator
+from typing import Tuple, Any, Iterator, Dict, Iterable, Sequence, List, Callable, Optional
+from inspect import signature, ismethod
+from weakref import WeakKeyDictionary
 
 from convertible.Convertible import Convertible
+from convertible.Convert.ExceptionHandler.ConvertException import ConvertException
+
+from .CallPlan import CallPlan
 
 
 class _InnerArgIterator:
@@ -54,6 +59,28 @@ class _ConvertArgsIterator:
         return iter(_InnerArgIterator(self.convertibles, *args))
 
 
+class _InnerKwargIterator:
+    """
+    The class that handles the iteration of keyword arguments.
+    """
+
+    __slots__ = ("convertibles", "kwargs")
+
+    def __init__(self, convertibles: Dict[str, Convertible], **kwargs: Any):
+        self.convertibles = convertibles
+        self.kwargs = kwargs
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.kwargs})"
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        for key, value in self.kwargs.items():
+            if key in self.convertibles:
+                yield key, self.convertibles[key].convert(value)
+            else:
+                yield key, value
+
+
 class _ConvertKwargsIterator:
     __slots__ = ("convertibles",)
 
@@ -63,34 +90,31 @@ class _ConvertKwargsIterator:
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.convertibles})"
 
-    def __call__(self, **kwargs) -> Iterator:
-        class _InnerKwargIterator:
-            def __init__(_self, **kwargs):
-                _self.kwargs = kwargs
-
-            def __repr__(_self) -> str:
-                return f"{_self.__class__.__name__}({_self.kwargs})"
-
-            def __iter__(_self):
-                for key, value in kwargs.items():
-                    if key in self.convertibles:
-                        yield key, self.convertibles[key].convert(value)
-                    else:
-                        yield key, value
-
-        return iter(_InnerKwargIterator(**kwargs))
+    def __call__(self, **kwargs) -> Iterator[Tuple[str, Any]]:
+        return iter(_InnerKwargIterator(self.convertibles, **kwargs))
 
 
 class ConvertHandler:
-    __slots__ = ("args_converter", "kwargs_converter")
+    __slots__ = ("args_converter", "kwargs_converter", "plan", "_bindings")
 
     def __init__(self, *args: Convertible, **kwargs: Convertible):
         self.args_converter = _ConvertArgsIterator(*args)
         self.kwargs_converter = _ConvertKwargsIterator(**kwargs)
+        self.plan = CallPlan(args, kwargs)
+        # The plans of each function, which do not keep the functions alive.
+        self._bindings: "WeakKeyDictionary[Callable, Dict[str, CallPlan]]" = WeakKeyDictionary()
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.args_converter.convertibles}, {self.kwargs_converter.convertibles})"
 
+    def __getstate__(self) -> Tuple[Tuple[Convertible, ...], Dict[str, Convertible]]:
+        # The plans bound to each function are rebuilt, as they are keyed by the functions.
+        return self.plan.positional, self.plan.keywords
+
+    def __setstate__(self, state: Tuple[Tuple[Convertible, ...], Dict[str, Convertible]]):
+        args, kwargs = state
+        self.__init__(*args, **kwargs)
+
     def __call__(self, *args, **kwargs) -> Tuple[_InnerArgIterator, Iterator[Tuple[str, Any]]]:
         """
         The args and kwargs passed to this method represent the arguments passed to the inner function
@@ -105,3 +129,69 @@ class ConvertHandler:
             An iterator for the args and kwargs passed to the inner function, respectively.
         """
         return self.args_converter(*args), self.kwargs_converter(**kwargs)
+
+    def bind(self, function: Callable, method: bool = False) -> CallPlan:
+        """
+        Provides the call plan for the parameters of a function, see CallPlan.bind.
+        The plan is only created once for each function, including methods bound to different instances.
+
+        Parameters
+        ----------
+        function : Callable
+            The function that is converted.
+        method : bool, optional
+            If the function is called as a method, so its first argument is passed through unconverted, by default
+            False
+
+        Returns
+        -------
+        CallPlan
+            The plan for the parameters of the function.
+            If the signature of the function cannot be inspected, the plan of the handler is provided.
+        """
+        if ismethod(function):
+            key, kind = function.__func__, "bound"
+        else:
+            key, kind = function, "method" if method else "function"
+        try:
+            plans = self._bindings.setdefault(key, {})
+        except TypeError:
+            # Callables that cannot be weakly referenced are bound each time.
+            plans = {}
+        try:
+            return plans[kind]
+        except KeyError:
+            pass
+
+        try:
+            parameters = signature(function)
+            if kind == "method":
+                parameters = parameters.replace(parameters=tuple(parameters.parameters.values())[1:])
+            plan = self.plan.bind(parameters)
+        except (TypeError, ValueError):
+            plan = self.plan
+        if kind == "method":
+            plan = CallPlan((None, *plan.positional), plan.keywords)
+        plans[kind] = plan
+        return plan
+
+    def convert_batch(
+        self, rows: Iterable[Sequence[Any]], exception_handler: Optional[Callable[[ConvertException], Any]] = None
+    ) -> List[List[Any]]:
+        """
+        Converts the positional arguments of many calls at once, see CallPlan.convert_batch.
+
+        Parameters
+        ----------
+        rows : Iterable[Sequence[Any]]
+            The positional arguments of each call.
+        exception_handler : Optional[Callable[[ConvertException], Any]], optional
+            The manager for any exceptions, by default None
+            If None is provided, the ConvertExceptions will leak passed the ConvertHandler.
+
+        Returns
+        -------
+        List[List[Any]]
+            The converted positional arguments of each call, in order.
+        """
+        return self.plan.convert_batch(rows, exception_handler)
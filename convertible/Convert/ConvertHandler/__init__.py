@@ -1 +1,2 @@
 from .ConvertHandler import ConvertHandler
+from .CallPlan import CallPlan
@@ -1,19 +1,103 @@
-from typing import Type, Callable, Dict
+from typing import Type, Callable, Dict, Optional, Sequence, Tuple, Union, Any
 
 from .ConvertException import ConvertException
 
+Handler = Callable[..., Any]
+
 
 class ExceptionHandler:
-    __slots__ = ("handlers",)
+    """
+    A manager of the handlers for each type of ConvertException.
+    The handler of an exception is the handler of the first type of its method resolution order, so subclasses of
+    a registered exception are handled as well.  The handler resolved for each type of exception is cached.
+    """
+
+    __slots__ = ("handlers", "default", "substitute", "_resolved")
+
+    def __init__(
+        self,
+        handlers: Dict[Type[Exception], Union[Handler, Sequence[Handler]]],
+        default: Optional[Handler] = None,
+        substitute: bool = False,
+    ):
+        """
+        Initializes the ExceptionHandler.
 
-    def __init__(self, handlers: Dict[Type[Exception], Callable]):
+        Parameters
+        ----------
+        handlers : Dict[Type[Exception], Union[Handler, Sequence[Handler]]]
+            The handlers of each type of exception, which are called with the Convertible and the argument.
+            A sequence of handlers is a chain, whose handlers are called in order until one provides a result other
+            than None.
+        default : Optional[Handler], optional
+            The handler of the exceptions without a handler, by default None
+            If None is provided, the exceptions without a handler are raised.
+        substitute : bool, optional
+            If the result of the handler is used in place of the argument, by default False
+            Otherwise, the argument is replaced by None.
+        """
         self.handlers = handlers
+        self.default = default
+        self.substitute = substitute
+        self._resolved: Dict[Type[Exception], Optional[Tuple[Handler, ...]]] = {}
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.handlers})"
 
-    def __call__(self, exception: ConvertException):
-        if (type_ := type(exception)) in self.handlers.keys():
-            self.handlers[type_](exception.convert, exception.argument)
-        else:
+    def register(self, type_: Type[Exception], handler: Union[Handler, Sequence[Handler]]):
+        """
+        Registers the handler of a type of exception.
+        Handlers must be registered through this method once the ExceptionHandler is in use, so the cached handlers
+        are cleared.
+
+        Parameters
+        ----------
+        type_ : Type[Exception]
+            The type of exception, including its subclasses, to handle.
+        handler : Union[Handler, Sequence[Handler]]
+            The handler or chain of handlers of the exception.
+        """
+        self.handlers[type_] = handler
+        self._resolved.clear()
+
+    def resolve(self, type_: Type[Exception]) -> Optional[Tuple[Handler, ...]]:
+        """
+        Resolves the chain of handlers of a type of exception.
+
+        Parameters
+        ----------
+        type_ : Type[Exception]
+            The type of exception raised.
+
+        Returns
+        -------
+        Optional[Tuple[Handler, ...]]
+            The chain of handlers of the exception, or None if the exception does not have a handler.
+        """
+        try:
+            return self._resolved[type_]
+        except KeyError:
+            pass
+
+        chain = None
+        for base in type_.__mro__:
+            if base in self.handlers:
+                handler = self.handlers[base]
+                chain = (handler,) if callable(handler) else tuple(handler)
+                break
+        if chain is None and self.default is not None:
+            chain = (self.default,)
+        self._resolved[type_] = chain
+        return chain
+
+    def __call__(self, exception: ConvertException) -> Any:
+        chain = self.resolve(type(exception))
+        if chain is None:
             raise exception
+
+        result = None
+        for handler in chain:
+            result = handler(exception.convert, exception.argument)
+            if result is not None:
+                break
+        return result if self.substitute else None
@@ -0,0 +1,262 @@
+from typing import Callable, Optional, Any, List, Dict, Tuple, Sequence, Iterator, Type
+from collections import Counter
+from random import randrange
+from threading import Lock
+from time import perf_counter
+
+from convertible.Convertible import Convertible, AsyncConvertible, FAILED
+
+from .NextArgumentException import NextArgumentException
+from .RejectArgumentException import RejectArgumentException
+from .ConvertHandler.CallPlan import CallPlan
+from .ExceptionHandler.ConvertException import ConvertException
+
+Hook = Callable[[Convertible, Any, Any, float], None]
+
+
+class ConvertibleStatistics:
+    """
+    The statistics of a single Convertible of an instrumented Convert.
+    The latencies are sampled into a bounded reservoir, so the percentiles are estimates once more calls were made
+    than the reservoir can hold.
+    """
+
+    __slots__ = ("convertible", "calls", "failures", "consumed", "total", "samples", "reservoir", "_lock")
+
+    def __init__(self, convertible: Convertible, reservoir: int = 1024):
+        """
+        Initializes the statistics of a Convertible.
+
+        Parameters
+        ----------
+        convertible : Convertible
+            The Convertible measured.
+        reservoir : int, optional
+            The most amount of latencies kept for the percentiles, by default 1024
+        """
+        self.convertible = convertible
+        self.reservoir = reservoir
+        self._lock = Lock()
+        self.reset()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.convertible}, calls={self.calls}, failures={sum(self.failures.values())})"
+        )
+
+    def reset(self):
+        """
+        Removes every measurement.
+        """
+        self.calls = 0
+        self.total = 0.0
+        self.failures: Counter = Counter()
+        self.consumed: Counter = Counter()
+        self.samples: List[float] = []
+
+    @property
+    def mean(self) -> float:
+        """The mean latency of a call, in seconds."""
+        return self.total / self.calls if self.calls else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """
+        Estimates a percentile of the latency of a call.
+
+        Parameters
+        ----------
+        percent : float
+            The percentile, between 0 and 100.
+
+        Returns
+        -------
+        float
+            The latency, in seconds, that the percent of the calls did not exceed.
+        """
+        with self._lock:
+            samples = sorted(self.samples)
+        if not samples:
+            return 0.0
+        return samples[min(len(samples) - 1, int(len(samples) * percent / 100))]
+
+    def record(
+        self, elapsed: float, calls: int = 1, failure: Optional[Type[Exception]] = None, consumed: Optional[int] = None
+    ):
+        """
+        Records the measurement of a call.
+
+        Parameters
+        ----------
+        elapsed : float
+            The amount of seconds spent by the calls.
+        calls : int, optional
+            The amount of arguments converted, by default 1
+        failure : Optional[Type[Exception]], optional
+            The type of exception raised by the call, by default None
+        consumed : Optional[int], optional
+            The amount of arguments consumed by a Convertible of multiple arguments, by default None
+        """
+        with self._lock:
+            seen = self.calls
+            self.calls += calls
+            self.total += elapsed
+            if failure is not None:
+                self.failures[failure] += 1
+            if consumed is not None:
+                self.consumed[consumed] += 1
+
+            # Each call is sampled with an equal probability, through reservoir sampling.
+            if len(self.samples) < self.reservoir:
+                self.samples.append(elapsed / calls)
+            else:
+                index = randrange(seen + 1)
+                if index < self.reservoir:
+                    self.samples[index] = elapsed / calls
+
+
+class _InstrumentedConvertible(Convertible):
+    """
+    A Convertible that measures the Convertible it wraps.
+    """
+
+    __slots__ = ("convertible", "statistics", "on_convert")
+
+    def __init__(self, convertible: Convertible, statistics: ConvertibleStatistics, on_convert: Optional[Hook]):
+        self.convertible = convertible
+        self.statistics = statistics
+        self.on_convert = on_convert
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.convertible})"
+
+    @property
+    def multiple_arguments(self) -> bool:
+        return self.convertible.multiple_arguments
+
+    def _record(self, argument: Any, result: Any, elapsed: float, **kwargs):
+        self.statistics.record(elapsed, **kwargs)
+        if self.on_convert is not None:
+            self.on_convert(self.convertible, argument, result, elapsed)
+
+    def convert(self, argument: Any) -> Any:
+        start = perf_counter()
+        try:
+            result = self.convertible.convert(argument)
+        except (NextArgumentException, RejectArgumentException):
+            # The exceptions of multiple arguments are not failures.
+            raise
+        except Exception as exception:
+            self._record(argument, exception, perf_counter() - start, failure=type(exception))
+            raise
+        self._record(argument, result, perf_counter() - start)
+        return result
+
+    def try_convert(self, argument: Any) -> Any:
+        start = perf_counter()
+        result = self.convertible.try_convert(argument)
+        failure = ConvertException if result is FAILED else None
+        self._record(argument, result, perf_counter() - start, failure=failure)
+        return result
+
+    def convert_arguments(self, arguments: Sequence[Any], start: int) -> Tuple[Any, int]:
+        begin = perf_counter()
+        try:
+            result, consumed = self.convertible.convert_arguments(arguments, start)
+        except (NextArgumentException, RejectArgumentException):
+            raise
+        except Exception as exception:
+            self._record(arguments[start:], exception, perf_counter() - begin, failure=type(exception))
+            raise
+        self._record(arguments[start : start + consumed], result, perf_counter() - begin, consumed=consumed)
+        return result, consumed
+
+    def convert_many(self, arguments: Sequence[Any]) -> List[Any]:
+        start = perf_counter()
+        try:
+            results = self.convertible.convert_many(arguments)
+        except Exception as exception:
+            self._record(
+                arguments, exception, perf_counter() - start, calls=len(arguments) or 1, failure=type(exception)
+            )
+            raise
+        elapsed = perf_counter() - start
+        self.statistics.record(elapsed, calls=len(arguments) or 1)
+        if self.on_convert is not None:
+            for argument, result in zip(arguments, results):
+                self.on_convert(self.convertible, argument, result, elapsed / len(arguments))
+        return results
+
+
+class Instrumentation:
+    """
+    The measurements of each Convertible of an instrumented Convert.
+    Convert is instrumented by replacing the Convertibles of its call plan with Convertibles that measure them, so
+    a Convert that is not instrumented does not pay for the measurements.  Asynchronous Convertibles are not measured.
+    """
+
+    __slots__ = ("on_convert", "reservoir", "_statistics")
+
+    def __init__(self, on_convert: Optional[Hook] = None, reservoir: int = 1024):
+        """
+        Initializes the Instrumentation.
+
+        Parameters
+        ----------
+        on_convert : Optional[Hook], optional
+            A hook called after each conversion with the Convertible, the argument, the result and the amount of
+            seconds elapsed, by default None
+            If the conversion failed, the exception is provided as the result.
+        reservoir : int, optional
+            The most amount of latencies kept for the percentiles of each Convertible, by default 1024
+        """
+        self.on_convert = on_convert
+        self.reservoir = reservoir
+        self._statistics: Dict[int, ConvertibleStatistics] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)})"
+
+    def __getitem__(self, convertible: Convertible) -> ConvertibleStatistics:
+        return self._statistics[id(convertible)]
+
+    def __iter__(self) -> Iterator[ConvertibleStatistics]:
+        return iter(self._statistics.values())
+
+    def reset(self):
+        """
+        Removes the measurements of every Convertible.
+        """
+        for statistics in self:
+            statistics.reset()
+
+    def instrument(self, plan: CallPlan) -> CallPlan:
+        """
+        Creates a plan whose Convertibles are measured.
+
+        Parameters
+        ----------
+        plan : CallPlan
+            The plan of the Convert.
+
+        Returns
+        -------
+        CallPlan
+            The plan with each Convertible replaced by one that measures it.
+        """
+        wrappers: Dict[int, Convertible] = {}
+
+        def wrap(convertible: Optional[Convertible]) -> Optional[Convertible]:
+            if convertible is None or isinstance(convertible, AsyncConvertible):
+                return convertible
+            # A Convertible that converts multiple parameters is measured once.
+            if id(convertible) not in wrappers:
+                statistics = self._statistics.get(id(convertible))
+                if statistics is None:
+                    statistics = self._statistics[id(convertible)] = ConvertibleStatistics(convertible, self.reservoir)
+                wrappers[id(convertible)] = _InstrumentedConvertible(convertible, statistics, self.on_convert)
+            return wrappers[id(convertible)]
+
+        return CallPlan(
+            tuple(wrap(convertible) for convertible in plan.positional),
+            {name: wrap(convertible) for name, convertible in plan.keywords.items()},
+        )
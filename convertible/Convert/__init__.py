@@ -1,4 +1,6 @@
 from .Convert import Convert
+from .AsyncConvert import AsyncConvert
 from .NextArgumentException import NextArgumentException
+from .Instrumentation import Instrumentation, ConvertibleStatistics
 from .ConvertHandler import *
 from .ExceptionHandler import *
@@ -0,0 +1,24 @@
+from typing import Any
+from abc import abstractmethod
+
+from .Convertible import Convertible
+
+
+class AsyncConvertible(Convertible):
+    """
+    A class to automatically convert an argument asynchronously.
+    Functions with an AsyncConvertible are wrapped by AsyncConvert, which awaits the conversions of a call concurrently.
+    """
+
+    asynchronous = True
+
+    @abstractmethod
+    async def convert(self, argument: Any) -> Any:
+        """
+        Converts the argument provided to a specified type.
+
+        Parameters
+        ----------
+        argument : Any
+            The argument to be converted.
+        """
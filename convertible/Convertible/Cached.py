@@ -0,0 +1,172 @@
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Tuple
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+
+from .ConvertException import ConvertException
+
+from .Convertible import Convertible, wraps_asynchronous
+
+
+def _copy_exception(exception: ConvertException) -> ConvertException:
+    """
+    Copies an exception without calling its __init__, which subclasses may have changed the parameters of.
+    The copy has no traceback, cause or context.
+    """
+    copied = type(exception).__new__(type(exception), *exception.args)
+    copied.args = exception.args
+    copied.__dict__.update(vars(exception))
+    return copied
+
+
+class CacheInfo(NamedTuple):
+    """
+    The statistics of a Cached Convertible.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class Cached(Convertible):
+    """
+    A Convertible that memoizes the results of the Convertible provided by argument.
+    Arguments that could not be converted are cached as well, so a new ConvertException with the same arguments is
+    raised without converting the argument.
+    The cache is guarded by a lock, so a single instance can be shared between threads.
+    """
+
+    __slots__ = ("convertible", "maxsize", "ttl", "key", "_cache", "_lock", "_hits", "_misses", "_evictions")
+
+    def __init__(
+        self,
+        convertible: Convertible,
+        maxsize: Optional[int] = 128,
+        ttl: Optional[float] = None,
+        key: Optional[Callable[[Any], Hashable]] = None,
+    ):
+        """
+        Initialize a Cached Convertible.
+
+        Parameters
+        ----------
+        convertible : Convertible
+            The Convertible whose results are cached.  It should always provide the same result for an argument.
+        maxsize : Optional[int], optional
+            The most amount of results that are kept, by default 128
+            Once exceeded, the least recently used result is evicted.  If None is provided, there is no limit.
+        ttl : Optional[float], optional
+            The amount of seconds a result is kept, by default None
+            If None is provided, results do not expire.
+        key : Optional[Callable[[Any], Hashable]], optional
+            Creates the key of the cache for an argument, by default None
+            If None is provided, the type and the argument itself are used, so equal arguments of different types,
+            such as 1, 1.0 and True, are cached separately, and unhashable arguments are not cached.
+        """
+        self.convertible = convertible
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.key = key
+        self._cache = OrderedDict()
+        self._lock = Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def __repr__(self) -> str:
+        convertible = "..." if self.convertible is self else f"{self.convertible}"
+        return f"{self.__class__.__name__}({convertible}, maxsize={self.maxsize}, ttl={self.ttl})"
+
+    @property
+    def asynchronous(self) -> bool:
+        return wraps_asynchronous(self, self.convertible)
+
+    def __getstate__(self) -> Tuple:
+        # The lock cannot be pickled, so a copy starts with an empty cache.
+        return self.convertible, self.maxsize, self.ttl, self.key
+
+    def __setstate__(self, state: Tuple):
+        convertible, maxsize, ttl, key = state
+        self.__init__(convertible, maxsize, ttl, key)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Provides the statistics of the cache.
+
+        Returns
+        -------
+        CacheInfo
+            The hits, misses, evictions, maximum size and current size of the cache.
+            Expired results are counted as evictions.
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self.maxsize, len(self._cache))
+
+    def cache_clear(self):
+        """
+        Removes every result from the cache and resets its statistics.
+        """
+        with self._lock:
+            self._cache.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def convert(self, argument: Any) -> Any:
+        """
+        Converts the argument with the Convertible provided or provides the cached result.
+
+        Parameters
+        ----------
+        argument : Any
+            The argument to be converted.
+
+        Returns
+        -------
+        Any
+            The converted argument.
+
+        Raises
+        ------
+        ConvertException
+            Raises the exception of the Convertible provided, which may have been cached.
+        """
+        try:
+            key = (type(argument), argument) if self.key is None else self.key(argument)
+            hash(key)
+        except TypeError:
+            return self.convertible.convert(argument)
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                expires, failed, result = entry
+                if expires is None or expires > monotonic():
+                    self._hits += 1
+                    self._cache.move_to_end(key)
+                    if failed:
+                        # Each hit raises its own exception, as raising an exception modifies its traceback.
+                        raise _copy_exception(result)
+                    return result
+                del self._cache[key]
+                self._evictions += 1
+            self._misses += 1
+
+        try:
+            result = self.convertible.convert(argument)
+            failed = False
+        except ConvertException as exception:
+            result = exception
+            failed = True
+
+        expires = None if self.ttl is None else monotonic() + self.ttl
+        with self._lock:
+            self._cache[key] = (expires, failed, _copy_exception(result) if failed else result)
+            self._cache.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+                    self._evictions += 1
+
+        if failed:
+            raise result
+        return result
@@ -0,0 +1,86 @@
+from typing import Any, Iterable, List
+
+from .Convertible import Convertible, FAILED, wraps_asynchronous
+
+
+class Chain(Convertible):
+    """
+    A Convertible that converts the argument with each Convertible provided in turn, such as to strip, parse and then
+    validate an argument.
+    Nested Chains are flattened when the Chain is created.
+    """
+
+    __slots__ = ("convertibles",)
+
+    def __init__(self, *convertibles: Convertible):
+        """
+        Initialize a Chain Convertible.
+
+        Parameters
+        ----------
+        *convertibles : Convertible
+            The Convertibles that convert the result of the previous Convertible, in order.
+        """
+        flattened = []
+        for convertible in convertibles:
+            if isinstance(convertible, Chain):
+                flattened.extend(convertible.convertibles)
+            else:
+                flattened.append(convertible)
+        self.convertibles = tuple(flattened)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({', '.join(map(repr, self.convertibles))})"
+
+    @property
+    def asynchronous(self) -> bool:
+        return wraps_asynchronous(self, *self.convertibles)
+
+    def convert(self, argument: Any) -> Any:
+        """
+        Converts the argument with each Convertible provided.
+
+        Parameters
+        ----------
+        argument : Any
+            The argument to be converted.
+
+        Returns
+        -------
+        Any
+            The result of the last Convertible.
+
+        Raises
+        ------
+        ConvertException
+            Raises the exception of the first Convertible that could not convert its argument.
+        """
+        for convertible in self.convertibles:
+            argument = convertible.convert(argument)
+        return argument
+
+    def try_convert(self, argument: Any) -> Any:
+        for convertible in self.convertibles:
+            argument = convertible.try_convert(argument)
+            if argument is FAILED:
+                return FAILED
+        return argument
+
+    def convert_many(self, arguments: Iterable[Any]) -> List[Any]:
+        """
+        Converts a column of arguments, converting the entire column with each Convertible in turn.
+
+        Parameters
+        ----------
+        arguments : Iterable[Any]
+            The arguments to be converted.
+
+        Returns
+        -------
+        List[Any]
+            The results of the last Convertible, in order.
+        """
+        arguments = list(arguments)
+        for convertible in self.convertibles:
+            arguments = convertible.convert_many(arguments)
+        return arguments
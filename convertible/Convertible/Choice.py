@@ -0,0 +1,174 @@
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from enum import Enum
+
+from .Convertible import Convertible, FAILED
+from .ConvertException import ConvertException
+
+_CANDIDATES = ""
+
+
+class _Ambiguous(tuple):
+    """The names of the candidates of an ambiguous prefix"""
+
+    __slots__ = ()
+
+
+class AmbiguousChoiceException(ConvertException):
+    """
+    An exception that is raised when an abbreviation matches more than one choice.
+    """
+
+    def __init__(self, convert: Convertible, argument: Any, candidates: Tuple[str, ...], message: Optional[str] = None):
+        super().__init__(convert, argument, message)
+        self.candidates = candidates
+        self.args = (convert, argument, candidates, message)
+
+    def __str__(self) -> str:
+        return self.message or f"{self.argument!r} is ambiguous between {', '.join(self.candidates)}"
+
+
+class Choice(Convertible):
+    """
+    A Convertible that converts a str to one of a fixed set of choices, such as the members of an Enum.
+    The names of the choices are stored in a table and in a trie of their prefixes when the Choice is created, so each
+    conversion only depends on the length of the argument.
+    """
+
+    __slots__ = ("choices", "case_sensitive", "allow_prefix", "_table", "_trie", "_values", "_unhashable")
+
+    def __init__(
+        self,
+        values: Union[Iterable[Any], Mapping[str, Any], type],
+        case_sensitive: bool = False,
+        allow_prefix: bool = True,
+        aliases: Optional[Mapping[str, Any]] = None,
+    ):
+        """
+        Initialize a Choice Convertible.
+
+        Parameters
+        ----------
+        values : Union[Iterable[Any], Mapping[str, Any], type]
+            The choices.  An Enum is converted to its members by their names, a mapping to its values by their keys
+            and any other iterable to its items by the str of each item.
+        case_sensitive : bool, optional
+            If the case of the argument must match the name of the choice, by default False
+        allow_prefix : bool, optional
+            If an argument can be a prefix of the name of a single choice, by default True
+        aliases : Optional[Mapping[str, Any]], optional
+            The additional names of the choices, by default None
+            Each alias provides the choice of the name it maps to, or the value it maps to otherwise.
+
+        Raises
+        ------
+        ValueError
+            Raises an exception if two names of different choices are the same when the case is not sensitive.
+        """
+        if isinstance(values, type) and issubclass(values, Enum):
+            choices = dict(values.__members__)
+        elif isinstance(values, Mapping):
+            choices = dict(values)
+        else:
+            choices = {str(value): value for value in values}
+        for alias, target in (aliases or {}).items():
+            choices[alias] = choices.get(target, target)
+
+        self.choices: Dict[str, Any] = choices
+        self.case_sensitive = case_sensitive
+        self.allow_prefix = allow_prefix
+
+        self._table: Dict[str, Any] = {}
+        self._trie: Dict[str, Any] = {}
+        for name, value in choices.items():
+            key = self._normalize(name)
+            if self._table.setdefault(key, value) != value:
+                raise ValueError(f"{name!r} names another choice regardless of case")
+            if allow_prefix:
+                node = self._trie
+                for character in key:
+                    node = node.setdefault(character, {_CANDIDATES: {}})
+                    node[_CANDIDATES].setdefault(id(value), name)
+        # The choices by themselves, so an argument equal to a choice provides that choice.
+        self._values: Dict[Any, Any] = {}
+        self._unhashable: List[Any] = []
+        for value in choices.values():
+            try:
+                self._values.setdefault(value, value)
+            except TypeError:
+                self._unhashable.append(value)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self.choices)})"
+
+    def __getstate__(self) -> Tuple:
+        return self.choices, self.case_sensitive, self.allow_prefix
+
+    def __setstate__(self, state: Tuple):
+        self.__init__(*state)
+
+    def _normalize(self, name: str) -> str:
+        return name if self.case_sensitive else name.casefold()
+
+    def _lookup(self, argument: Any) -> Any:
+        """
+        Finds the choice of an argument, providing the names of the candidates if the argument is ambiguous.
+        """
+        # A str is always looked up by name, as it may be both a choice and the name of another choice.
+        if type(argument) is not str:
+            try:
+                return self._values[argument]
+            except (KeyError, TypeError):
+                for value in self._unhashable:
+                    if value == argument:
+                        return value
+        if not isinstance(argument, str):
+            return FAILED
+
+        key = self._normalize(argument)
+        result = self._table.get(key, FAILED)
+        if result is not FAILED or not self.allow_prefix or not key:
+            return result
+
+        node = self._trie
+        for character in key:
+            node = node.get(character)
+            if node is None:
+                return FAILED
+        candidates = node[_CANDIDATES]
+        if len(candidates) == 1:
+            return self.choices[next(iter(candidates.values()))]
+        return _Ambiguous(sorted(candidates.values()))
+
+    def convert(self, argument: Any) -> Any:
+        """
+        Converts the argument to the choice of its name, alias or unique prefix.
+
+        Parameters
+        ----------
+        argument : Any
+            The argument to be converted.  A value equal to a choice that is not a str provides that choice.
+
+        Returns
+        -------
+        Any
+            The choice.
+
+        Raises
+        ------
+        AmbiguousChoiceException
+            Raises an exception with the names of the candidates if the argument is a prefix of several choices.
+        ConvertException
+            Raises an exception if the argument does not name a choice.
+        """
+        result = self._lookup(argument)
+        if result is FAILED:
+            raise ConvertException(self, argument)
+        if type(result) is _Ambiguous:
+            raise AmbiguousChoiceException(self, argument, tuple(result))
+        return result
+
+    def try_convert(self, argument: Any) -> Any:
+        result = self._lookup(argument)
+        if type(result) is _Ambiguous:
+            return FAILED
+        return result
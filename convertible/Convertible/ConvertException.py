@@ -0,0 +1,20 @@
+from typing import Optional, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .Convertible import Convertible
+
+
+class ConvertException(Exception):
+    """
+    An exception that is raised when Convert cannot convert the argument.
+    The message is only formatted once the exception is displayed, as most are handled without being displayed.
+    """
+
+    def __init__(self, convert: "Convertible", argument: Any, message: Optional[str] = None):
+        self.convert = convert
+        self.argument = argument
+        self.message = message
+        super().__init__(convert, argument, message)
+
+    def __str__(self) -> str:
+        return self.message or f"{self.convert} was unable to convert {self.argument}"
@@ -1,12 +1,47 @@
-from typing import Any
+from typing import Any, Optional, Sequence, Tuple, Iterable, List
 from abc import ABC, abstractmethod
 
+from .ConvertException import ConvertException
+
+
+class _Failed:
+    """A class to indicate that a Convertible was unable to convert an argument, without raising an exception"""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "FAILED"
+
+
+FAILED = _Failed()
+
 
 class Convertible(ABC):
     """
     A class to automatically convert an argument
+
+    Convertibles that can detect an invalid argument without raising an exception should override try_convert and
+    implement convert through it, so Optional and other Convertibles can check for FAILED instead of catching a
+    ConvertException.
+
+    A Convertible should not store the state of a call on itself, so a single instance can be shared by many
+    functions and threads.  Every built-in Convertible follows this rule.
+
+    Attributes
+    ----------
+    multiple_arguments : bool
+        If the Convertible can request additional arguments, such as Greedy.
+        Convert will only use the multiple argument protocol, convert_arguments, for handlers that contain such a
+        Convertible.
+    asynchronous : bool
+        If the Convertible is an AsyncConvertible or wraps one, such as an Optional of an AsyncConvertible.
+        Convert only awaits the AsyncConvertibles of the handler itself, so handlers reject Convertibles that wrap
+        one.
     """
 
+    multiple_arguments: bool = False
+    asynchronous: bool = False
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
 
@@ -20,3 +55,83 @@ class Convertible(ABC):
         argument : Any
             The argument to be converted.
         """
+
+    def try_convert(self, argument: Any) -> Any:
+        """
+        Converts the argument provided to a specified type, without raising a ConvertException.
+
+        Parameters
+        ----------
+        argument : Any
+            The argument to be converted.
+
+        Returns
+        -------
+        Any
+            The converted argument or FAILED if the argument could not be converted.
+        """
+        try:
+            return self.convert(argument)
+        except ConvertException:
+            return FAILED
+
+    def convert_arguments(self, arguments: Sequence[Any], start: int) -> Tuple[Any, int]:
+        """
+        Converts one or more arguments, starting from the argument at index start.
+        Convertibles that can consume multiple arguments should override this method to provide their result
+        directly, instead of raising NextArgumentException and RejectArgumentException for each argument.
+
+        Parameters
+        ----------
+        arguments : Sequence[Any]
+            The arguments provided to the call.
+        start : int
+            The index of the first argument to be converted.
+
+        Returns
+        -------
+        Tuple[Any, int]
+            The result and the amount of arguments consumed to create it.
+        """
+        return self.convert(arguments[start]), 1
+
+    def convert_many(self, arguments: Iterable[Any]) -> List[Any]:
+        """
+        Converts a column of arguments at once, used for batch conversions.
+        Convertibles with a faster way to convert many arguments at once should override this method.
+
+        Parameters
+        ----------
+        arguments : Iterable[Any]
+            The arguments to be converted.
+
+        Returns
+        -------
+        List[Any]
+            The converted arguments, in order.
+        """
+        convert = self.convert
+        return [convert(argument) for argument in arguments]
+
+
+def wraps_asynchronous(wrapper: Convertible, *convertibles: Optional[Convertible]) -> bool:
+    """
+    Determines if any of the Convertibles wrapped is asynchronous, for the asynchronous attribute of Convertibles
+    that wrap others.
+
+    Parameters
+    ----------
+    wrapper : Convertible
+        The Convertible that wraps the others, which is skipped if it wraps itself.
+    *convertibles : Optional[Convertible]
+        The Convertibles wrapped, or None for those that are not provided.
+
+    Returns
+    -------
+    bool
+        If any of the Convertibles is asynchronous.
+    """
+    return any(
+        convertible is not None and convertible is not wrapper and convertible.asynchronous
+        for convertible in convertibles
+    )
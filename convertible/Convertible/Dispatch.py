@@ -0,0 +1,144 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+from weakref import WeakKeyDictionary
+
+from .ConvertException import ConvertException
+
+from .Convertible import Convertible, FAILED, wraps_asynchronous
+
+
+class Dispatch(Convertible):
+    """
+    A Convertible that converts the argument with the Convertible of its type, such as to parse a str and decode
+    bytes.
+    The Convertible of an argument is the Convertible of the first type of its method resolution order, so
+    subclasses of a registered type are converted as well.  The Convertible resolved for each type is cached, so
+    arguments of a type that was seen before cost a single lookup.  The cache only references the types weakly, so
+    it does not grow with classes that no longer exist.
+    """
+
+    __slots__ = ("convertibles", "default", "_resolved")
+
+    def __init__(self, convertibles: Dict[Type, Convertible], default: Optional[Convertible] = None):
+        """
+        Initialize a Dispatch Convertible.
+
+        Parameters
+        ----------
+        convertibles : Dict[Type, Convertible]
+            The Convertibles of each type of argument.
+        default : Optional[Convertible], optional
+            The Convertible of the arguments whose type does not have a Convertible, by default None
+            If None is provided, those arguments cannot be converted.
+        """
+        self.convertibles = dict(convertibles)
+        self.default = default
+        self._resolved: WeakKeyDictionary[Type, Optional[Convertible]] = WeakKeyDictionary()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.convertibles})"
+
+    @property
+    def asynchronous(self) -> bool:
+        return wraps_asynchronous(self, *self.convertibles.values(), self.default)
+
+    def __getstate__(self) -> Tuple[Dict[Type, Convertible], Optional[Convertible]]:
+        return self.convertibles, self.default
+
+    def __setstate__(self, state: Tuple[Dict[Type, Convertible], Optional[Convertible]]):
+        self.__init__(*state)
+
+    def register(self, type_: Type, convertible: Convertible):
+        """
+        Registers the Convertible of a type, clearing the cached Convertibles.
+
+        Parameters
+        ----------
+        type_ : Type
+            The type of argument, including its subclasses, to convert.
+        convertible : Convertible
+            The Convertible of the type.
+        """
+        self.convertibles[type_] = convertible
+        self._resolved = WeakKeyDictionary()
+
+    def resolve(self, type_: Type) -> Optional[Convertible]:
+        """
+        Resolves the Convertible of a type of argument.
+
+        Parameters
+        ----------
+        type_ : Type
+            The type of the argument.
+
+        Returns
+        -------
+        Optional[Convertible]
+            The Convertible of the type, or None if the type cannot be converted.
+        """
+        try:
+            return self._resolved[type_]
+        except KeyError:
+            pass
+
+        convertible = self.default
+        for base in type_.__mro__:
+            if base in self.convertibles:
+                convertible = self.convertibles[base]
+                break
+        self._resolved[type_] = convertible
+        return convertible
+
+    def convert(self, argument: Any) -> Any:
+        """
+        Converts the argument with the Convertible of its type.
+
+        Parameters
+        ----------
+        argument : Any
+            The argument to be converted.
+
+        Returns
+        -------
+        Any
+            The converted argument.
+
+        Raises
+        ------
+        ConvertException
+            Raises an exception if the type of the argument does not have a Convertible or it could not convert the
+            argument.
+        """
+        convertible = self.resolve(type(argument))
+        if convertible is None:
+            raise ConvertException(self, argument)
+        return convertible.convert(argument)
+
+    def try_convert(self, argument: Any) -> Any:
+        convertible = self.resolve(type(argument))
+        if convertible is None:
+            return FAILED
+        return convertible.try_convert(argument)
+
+    def convert_many(self, arguments: Iterable[Any]) -> List[Any]:
+        """
+        Converts a column of arguments.  When every argument has the same type, the column is converted by the batch
+        conversion of its Convertible.
+
+        Parameters
+        ----------
+        arguments : Iterable[Any]
+            The arguments to be converted.
+
+        Returns
+        -------
+        List[Any]
+            The converted arguments, in order.
+        """
+        arguments = list(arguments)
+        types = set(map(type, arguments))
+        if len(types) == 1:
+            convertible = self.resolve(types.pop())
+            if convertible is not None:
+                return convertible.convert_many(arguments)
+        convert = self.convert
+        return [convert(argument) for argument in arguments]
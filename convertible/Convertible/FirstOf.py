@@ -0,0 +1,108 @@
+from typing import Any, List, Tuple
+
+from .ConvertException import ConvertException
+
+from .Convertible import Convertible, FAILED, wraps_asynchronous
+
+
+class FirstOf(Convertible):
+    """
+    A Convertible that provides the result of the first Convertible that can convert the argument, such as to convert
+    an argument to an int or else a float.
+    Nested FirstOfs are flattened when the FirstOf is created.
+
+    When adaptive, the Convertibles are periodically reordered by how often they converted an argument, so the most
+    common kind of argument is tried first.  This should only be used when at most one Convertible can convert each
+    argument, as otherwise the result may change with the order.  The order is replaced as a whole, so an adaptive
+    FirstOf can be shared between threads.
+    """
+
+    __slots__ = ("convertibles", "adaptive", "interval", "_order", "_hits", "_calls")
+
+    def __init__(self, *convertibles: Convertible, adaptive: bool = False, interval: int = 1024):
+        """
+        Initialize a FirstOf Convertible.
+
+        Parameters
+        ----------
+        *convertibles : Convertible
+            The Convertibles to try, in order.
+        adaptive : bool, optional
+            If the Convertibles are reordered by how often they converted an argument, by default False
+        interval : int, optional
+            The amount of conversions between each reorder, by default 1024
+        """
+        flattened = []
+        for convertible in convertibles:
+            if isinstance(convertible, FirstOf):
+                flattened.extend(convertible.convertibles)
+            else:
+                flattened.append(convertible)
+        self.convertibles = tuple(flattened)
+        self.adaptive = adaptive
+        self.interval = interval
+        self._order: Tuple[int, ...] = tuple(range(len(self.convertibles)))
+        self._hits: List[int] = [0] * len(self.convertibles)
+        self._calls = 0
+
+    def __repr__(self) -> str:
+        convertibles = ", ".join(map(repr, self.convertibles))
+        if self.adaptive:
+            convertibles += ", adaptive=True"
+        return f"{self.__class__.__name__}({convertibles})"
+
+    @property
+    def asynchronous(self) -> bool:
+        return wraps_asynchronous(self, *self.convertibles)
+
+    @property
+    def order(self) -> Tuple[Convertible, ...]:
+        """The Convertibles in the order they are tried."""
+        return tuple(self.convertibles[index] for index in self._order)
+
+    def convert(self, argument: Any) -> Any:
+        """
+        Converts the argument with the first Convertible that can convert it.
+
+        Parameters
+        ----------
+        argument : Any
+            The argument to be converted.
+
+        Returns
+        -------
+        Any
+            The result of the first Convertible that converted the argument.
+
+        Raises
+        ------
+        ConvertException
+            Raises an exception if no Convertible could convert the argument.
+        """
+        result = self.try_convert(argument)
+        if result is FAILED:
+            raise ConvertException(self, argument)
+        return result
+
+    def try_convert(self, argument: Any) -> Any:
+        convertibles = self.convertibles
+        for index in self._order:
+            result = convertibles[index].try_convert(argument)
+            if result is not FAILED:
+                if self.adaptive:
+                    self._hit(index)
+                return result
+        return FAILED
+
+    def _hit(self, index: int):
+        """
+        Counts the argument converted by the Convertible at index, reordering the Convertibles once an interval
+        has passed.  The counts may be slightly off when shared between threads, which only affects the order.
+        """
+        self._hits[index] += 1
+        self._calls += 1
+        if self._calls >= self.interval:
+            hits = self._hits
+            self._order = tuple(sorted(range(len(hits)), key=lambda position: -hits[position]))
+            self._hits = [count // 2 for count in hits]
+            self._calls = 0
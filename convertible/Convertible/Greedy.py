@@ -1,23 +1,27 @@
-from typing import List, Any, Optional
+from typing import List, Any, Optional, Sequence, Tuple
 
-from convertible.Convert.NextArgumentException import NextArgumentException
-from convertible.Convert.RejectArgumentException import RejectArgumentException
-from convertible.Convert.ExceptionHandler.ConvertException import ConvertException
-from convertible.Convert.Convert import NoMoreArguments
-
-from .Convertible import Convertible
+from .Convertible import Convertible, FAILED, wraps_asynchronous
+from .ConvertException import ConvertException
+from .NextArgumentException import NextArgumentException
+from .RejectArgumentException import RejectArgumentException
+from .NoMoreArguments import NoMoreArguments
 
 
 class Greedy(Convertible):
     """
-    A Convertible that will continue to ask for more arguments until it runs into a ConvertException or
-    is provided the argument of StopIterator.
+    A Convertible that will continue to ask for more arguments until it runs into a ConvertException,
+    is provided the argument of StopIterator or has converted the maximum amount of arguments.
     Once the Convertible is stopped, it will raise a RejectArgumentException with itself and the final result.
+    When used by Convert, the arguments are consumed through convert_arguments, which does not raise either exception.
+
+    Greedy does not store any state of a call, so a single instance can be shared between threads.
     """
 
-    __slots__ = ("convertible", "_results")
+    __slots__ = ("convertible", "minimum", "maximum")
+
+    multiple_arguments = True
 
-    def __init__(self, convertible: Convertible, *, _results: Optional[List] = None):
+    def __init__(self, convertible: Convertible, *, minimum: int = 0, maximum: Optional[int] = None):
         """
         Initialize a Greedy Convertible.
 
@@ -25,38 +29,70 @@ class Greedy(Convertible):
         ----------
         convertible : Convertible
             The Convertible that convert until an invalid argument rises.
-        _results : Optional[List]
-            During the Converting of multiple variables, _results maintains the list of the prior results.
+        minimum : int, optional
+            The least amount of arguments that must be converted, by default 0
+            If fewer arguments are converted, a ConvertException is raised.
+        maximum : Optional[int], optional
+            The most amount of arguments that will be converted, by default None
+            Once reached, the next argument is left untouched.  If None is provided, there is no limit.
         """
         self.convertible = convertible
-        self._results = _results or []
+        self.minimum = minimum
+        self.maximum = maximum
 
     def __repr__(self) -> str:
-        if self.convertible is self:
-            if self._results:
-                return f"{self.__class__.__name__}(..., _results={self._results})"
-            else:
-                return f"{self.__class__.__name__}(...)"
-        else:
-            if self._results:
-                return f"{self.__class__.__name__}({self.convertible}, _results={self._results})"
-            else:
-                return f"{self.__class__.__name__}({self.convertible})"
-
-    def _return_results(self):
+        convertible = "..." if self.convertible is self else f"{self.convertible}"
+        if self.minimum:
+            convertible += f", minimum={self.minimum}"
+        if self.maximum is not None:
+            convertible += f", maximum={self.maximum}"
+        return f"{self.__class__.__name__}({convertible})"
+
+    @property
+    def asynchronous(self) -> bool:
+        return wraps_asynchronous(self, self.convertible)
+
+    def convert_arguments(self, arguments: Sequence[Any], start: int) -> Tuple[List, int]:
         """
-        Returns the results by raising a RejectArgumentException.
-        This method also cleans up the results, for it to be called again.
+        Converts arguments, starting from the index start, until an argument cannot be converted.
+
+        Parameters
+        ----------
+        arguments : Sequence[Any]
+            The arguments provided to the call.
+        start : int
+            The index of the first argument to be converted.
+
+        Returns
+        -------
+        Tuple[List, int]
+            The converted arguments and the amount of arguments consumed.
 
         Raises
         ------
-        RejectArgumentException
-            Raises an exception to declare that the last argument was not used and returns the result.
+        ConvertException
+            Raises an exception if fewer arguments than the minimum were converted.
         """
-        self._results, results = [], self._results
-        raise RejectArgumentException(self, results)
+        results = []
+        stop = len(arguments)
+        if self.maximum is not None:
+            stop = min(stop, start + self.maximum)
+
+        try_convert = self.convertible.try_convert
+        append = results.append
+        index = start
+        while index < stop:
+            result = try_convert(arguments[index])
+            if result is FAILED:
+                break
+            append(result)
+            index += 1
 
-    def convert(self, argument: Any) -> None:
+        if len(results) < self.minimum:
+            raise ConvertException(self, arguments[index] if index < len(arguments) else NoMoreArguments())
+        return results, index - start
+
+    def convert(self, argument: Any) -> List:
         """
         Converts the argument provided to a specified type.
 
@@ -65,17 +101,64 @@ class Greedy(Convertible):
         argument : Any
             The argument to be converted.
 
+        Returns
+        -------
+        List
+            The converted arguments, once the maximum amount of arguments was converted.
+
         Raises
         ------
         NextArgumentException
             Raises an exception to request another argument.
         """
+        # The results of the call are stored by a new context, so the shared instance is never modified.
+        return _GreedyContext(self).convert(argument)
+
+
+class _GreedyContext(Convertible):
+    """
+    The state of a single call of a Greedy Convertible, for the exception protocol of multiple arguments.
+    The context requests each argument with a NextArgumentException and appends its result in place.
+    """
+
+    __slots__ = ("greedy", "results")
+
+    def __init__(self, greedy: Greedy):
+        self.greedy = greedy
+        self.results: List = []
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.greedy}, {self.results})"
+
+    def _return_results(self, argument: Any):
+        """
+        Returns the results by raising a RejectArgumentException.
+
+        Parameters
+        ----------
+        argument : Any
+            The argument that was rejected.
+
+        Raises
+        ------
+        RejectArgumentException
+            Raises an exception to declare that the last argument was not used and returns the result.
+        ConvertException
+            Raises an exception if fewer arguments than the minimum were converted.
+        """
+        if len(self.results) < self.greedy.minimum:
+            raise ConvertException(self.greedy, argument)
+        raise RejectArgumentException(self.greedy, self.results)
+
+    def convert(self, argument: Any) -> List:
         if isinstance(argument, NoMoreArguments):
-            self._return_results()
+            self._return_results(argument)
 
-        try:
-            res = self.convertible.convert(argument)
-        except ConvertException:
-            self._return_results()
+        result = self.greedy.convertible.try_convert(argument)
+        if result is FAILED:
+            self._return_results(argument)
 
-        raise NextArgumentException(Greedy(self.convertible, _results=self._results + [res]))
+        self.results.append(result)
+        if self.greedy.maximum is not None and len(self.results) >= self.greedy.maximum:
+            return self.results
+        raise NextArgumentException(self)
@@ -0,0 +1,19 @@
+from typing import Any, Iterable, List
+
+from .Convertible import Convertible
+
+
+class Identity(Convertible):
+    """
+    A Convertible that provides the argument unchanged.
+    """
+
+    __slots__ = ()
+
+    def convert(self, argument: Any) -> Any:
+        return argument
+
+    try_convert = convert
+
+    def convert_many(self, arguments: Iterable[Any]) -> List[Any]:
+        return list(arguments)
@@ -0,0 +1,77 @@
+from typing import Any, Dict, Optional
+from collections.abc import Mapping
+
+from .ConvertException import ConvertException
+
+from .Convertible import Convertible, FAILED, wraps_asynchronous
+
+
+class MapOf(Convertible):
+    """
+    A Convertible that converts each key and value of a mapping, providing a dict.
+    """
+
+    __slots__ = ("key", "value")
+
+    def __init__(self, key: Optional[Convertible], value: Optional[Convertible]):
+        """
+        Initialize a MapOf Convertible.
+
+        Parameters
+        ----------
+        key : Optional[Convertible]
+            The Convertible of the keys.  If None is provided, the keys are not converted.
+        value : Optional[Convertible]
+            The Convertible of the values.  If None is provided, the values are not converted.
+        """
+        self.key = key
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.key}, {self.value})"
+
+    @property
+    def asynchronous(self) -> bool:
+        return wraps_asynchronous(self, self.key, self.value)
+
+    def convert(self, argument: Any) -> Dict:
+        """
+        Converts each key and value of the mapping provided.
+
+        Parameters
+        ----------
+        argument : Any
+            The mapping to be converted.
+
+        Returns
+        -------
+        Dict
+            The converted keys and values.
+
+        Raises
+        ------
+        ConvertException
+            Raises an exception if the argument is not a mapping or any key or value could not be converted.
+        """
+        result = self.try_convert(argument)
+        if result is FAILED:
+            raise ConvertException(self, argument)
+        return result
+
+    def try_convert(self, argument: Any) -> Any:
+        if not isinstance(argument, Mapping):
+            return FAILED
+
+        key, value = self.key, self.value
+        result = {}
+        for name, item in argument.items():
+            if key is not None:
+                name = key.try_convert(name)
+                if name is FAILED:
+                    return FAILED
+            if value is not None:
+                item = value.try_convert(item)
+                if item is FAILED:
+                    return FAILED
+            result[name] = item
+        return result
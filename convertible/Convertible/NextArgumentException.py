@@ -0,0 +1,17 @@
+from typing import Optional
+
+from .Convertible import Convertible
+
+
+class NextArgumentException(Exception):
+    """
+    An exception to request the next element of the iterator.
+    """
+
+    def __init__(self, convertible: Convertible, message: Optional[str] = None):
+        self.convertible = convertible
+        self.message = message
+        super().__init__(convertible, message)
+
+    def __str__(self) -> str:
+        return self.message or f"{self.convertible} requested the next argument"
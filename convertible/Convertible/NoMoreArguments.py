@@ -0,0 +1,2 @@
+class NoMoreArguments:
+    """A class to indicate when there are no more arguments from the iterator"""
@@ -1,8 +1,8 @@
-from typing import Any
+from typing import Any, Iterable, List
 
-from convertible.Convert.ExceptionHandler.ConvertException import ConvertException
+from .ConvertException import ConvertException
 
-from .Convertible import Convertible
+from .Convertible import Convertible, FAILED, wraps_asynchronous
 
 
 class Optional(Convertible):
@@ -29,6 +29,10 @@ class Optional(Convertible):
         else:
             return f"{self.__class__.__name__}({self.convertible})"
 
+    @property
+    def asynchronous(self) -> bool:
+        return wraps_asynchronous(self, self.convertible)
+
     def convert(self, argument: Any) -> Any:
         """
         Converts the argument to the specified type of the Convertible provided or returns None.
@@ -44,8 +48,31 @@ class Optional(Convertible):
             The converted argument or None.
         """
         try:
-            return self.convertible.convert(argument)
-        except ConvertException:
-            return None
+            result = self.convertible.try_convert(argument)
         except StopIteration:
             return None
+        return None if result is FAILED else result
+
+    try_convert = convert
+
+    def convert_many(self, arguments: Iterable[Any]) -> List[Any]:
+        """
+        Converts a column of arguments, using the batch conversion of the Convertible provided when every argument
+        can be converted.
+
+        Parameters
+        ----------
+        arguments : Iterable[Any]
+            The arguments to be converted.
+
+        Returns
+        -------
+        List[Any]
+            The converted arguments or None for each argument that could not be converted.
+        """
+        arguments = list(arguments)
+        try:
+            return self.convertible.convert_many(arguments)
+        except ConvertException:
+            convert = self.convert
+            return [convert(argument) for argument in arguments]
@@ -0,0 +1,31 @@
+from typing import Optional, Any
+
+from .Convertible import Convertible
+
+
+class RejectArgumentException(Exception):
+    """
+    An exception to request the next element of the iterator.
+    """
+
+    def __init__(self, convertible: Convertible, result: Any, message: Optional[str] = None):
+        """
+        Creates an exception to denote that the last argument was not used, and to push this to the iterator.
+
+        Parameters
+        ----------
+        convertible : Convertible
+            The Convertible that rejected the last input.
+        result : Any
+            The final result o the Convertible, as the Convertible will not be called again.
+        message : Optional[str], optional
+            The message of the exception if it is not caught, by default None
+            If None is passed, a message will automatically be provided once the exception is displayed.
+        """
+        self.convertible = convertible
+        self.result = result
+        self.message = message
+        super().__init__(convertible, result, message)
+
+    def __str__(self) -> str:
+        return self.message or f"The {self.convertible} returned {self.result} and rejected the last argument"
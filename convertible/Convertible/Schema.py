@@ -0,0 +1,193 @@
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union
+from collections.abc import Mapping as MappingType
+from keyword import iskeyword
+
+from .Convertible import Convertible, FAILED, wraps_asynchronous
+from .ConvertException import ConvertException
+
+_EXTRA = ("ignore", "keep", "error")
+_MISSING = object()
+
+
+def _record(name: str, fields: Tuple[str, ...]) -> type:
+    """
+    Creates a class with a slot for each field, whose instances are smaller than a dict of the same fields.
+    """
+    arguments = ", ".join(f"_{index}" for index in range(len(fields)))
+    lines = [f"def __init__(self, {arguments}):"] if fields else ["def __init__(self):", "    pass"]
+    lines += [f"    self.{field} = _{index}" for index, field in enumerate(fields)]
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{field}={getattr(self, field)!r}" for field in fields)
+        return f"{name}({values})"
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in fields)
+
+    return type(
+        name,
+        (),
+        {
+            "__slots__": fields,
+            "__init__": namespace["__init__"],
+            "__repr__": __repr__,
+            "__eq__": __eq__,
+            "_fields": fields,
+        },
+    )
+
+
+class Schema(Convertible):
+    """
+    A Convertible that converts each field of a mapping, such as parsed JSON, with the Convertible of the field.
+    The fields are compiled into a single function when the Schema is created, similar to how CallPlan generates the
+    conversion of a call, so a mapping is converted in one pass without looking up any Convertible.
+
+    A mapping of fields in place of a Convertible is a nested Schema, with the same handling of extra keys and records.
+    """
+
+    __slots__ = ("fields", "extra", "defaults", "record", "_compiled")
+
+    def __init__(
+        self,
+        fields: Mapping[str, Union[Convertible, Mapping, None]],
+        extra: str = "ignore",
+        defaults: Optional[Mapping[str, Any]] = None,
+        record: Optional[str] = None,
+    ):
+        """
+        Initialize a Schema Convertible.
+
+        Parameters
+        ----------
+        fields : Mapping[str, Union[Convertible, Mapping, None]]
+            The Convertible of each field.  If None is provided, the field is not converted.
+        extra : str, optional
+            How the keys without a field are handled, by default "ignore"
+            Either "ignore" to leave them out of the result, "keep" to provide them unchanged or "error" to reject the
+            mapping.
+        defaults : Optional[Mapping[str, Any]], optional
+            The values of the fields that can be missing, by default None
+            The default values are not converted.  A mapping without a field that has no default is rejected.
+        record : Optional[str], optional
+            The name of a class with a slot for each field, by default None
+            If provided, the result is an instance of the class instead of a dict.  The class is created with the
+            Schema, so its instances can only be pickled with the Schema.
+
+        Raises
+        ------
+        ValueError
+            Raises an exception if extra is not a known handling, or records keep extra keys or have fields that are
+            not identifiers.
+        """
+        if extra not in _EXTRA:
+            raise ValueError(f"extra must be one of {', '.join(_EXTRA)}, not {extra!r}")
+        if record is not None and extra == "keep":
+            raise ValueError("records cannot keep extra keys")
+        if record is not None and not all(name.isidentifier() and not iskeyword(name) for name in fields):
+            raise ValueError("the fields of records must be identifiers")
+
+        self.fields: Dict[str, Optional[Convertible]] = {
+            name: (
+                Schema(convertible, extra, record=record and f"{record}_{name}")
+                if isinstance(convertible, MappingType)
+                else convertible
+            )
+            for name, convertible in fields.items()
+        }
+        self.extra = extra
+        self.defaults: Dict[str, Any] = dict(defaults or {})
+        self.record = None if record is None else _record(record, tuple(self.fields))
+        self._compiled = self._compile()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.fields}, extra={self.extra!r})"
+
+    @property
+    def asynchronous(self) -> bool:
+        return wraps_asynchronous(self, *self.fields.values())
+
+    def __getstate__(self) -> Tuple:
+        return self.fields, self.extra, self.defaults, None if self.record is None else self.record.__name__
+
+    def __setstate__(self, state: Tuple):
+        self.__init__(*state)
+
+    def _compile(self) -> Callable[[Mapping], Any]:
+        namespace: Dict[str, Any] = {
+            "FAILED": FAILED,
+            "_MISSING": _MISSING,
+            "_fields": frozenset(self.fields),
+            "_defaults": self.defaults,
+            "_record": self.record,
+        }
+        lines = ["def __convert__(argument):"]
+        if self.extra == "error":
+            lines += ["    if not _fields.issuperset(argument):", "        return FAILED"]
+
+        for index, (name, convertible) in enumerate(self.fields.items()):
+            lines.append(f"    value_{index} = argument.get({name!r}, _MISSING)")
+            lines.append(f"    if value_{index} is _MISSING:")
+            if name in self.defaults:
+                lines.append(f"        value_{index} = _defaults[{name!r}]")
+            else:
+                lines.append("        return FAILED")
+            if convertible is not None:
+                namespace[f"_field_{index}"] = convertible.try_convert
+                lines += [
+                    "    else:",
+                    f"        value_{index} = _field_{index}(value_{index})",
+                    f"        if value_{index} is FAILED:",
+                    "            return FAILED",
+                ]
+
+        values = ", ".join(f"value_{index}" for index in range(len(self.fields)))
+        if self.record is not None:
+            lines.append(f"    return _record({values})")
+        else:
+            result = ", ".join(f"{name!r}: value_{index}" for index, name in enumerate(self.fields))
+            if self.extra == "keep":
+                lines += [
+                    "    result = {key: value for key, value in argument.items() if key not in _fields}",
+                    f"    result.update({{{result}}})",
+                    "    return result",
+                ]
+            else:
+                lines.append(f"    return {{{result}}}")
+
+        exec("\n".join(lines), namespace)
+        return namespace["__convert__"]
+
+    def convert(self, argument: Any) -> Any:
+        """
+        Converts each field of the mapping provided.
+
+        Parameters
+        ----------
+        argument : Any
+            The mapping to be converted.
+
+        Returns
+        -------
+        Any
+            A dict or record of the converted fields.
+
+        Raises
+        ------
+        ConvertException
+            Raises an exception if the argument is not a mapping, a field is missing or could not be converted, or
+            the mapping has extra keys that are rejected.
+        """
+        result = self.try_convert(argument)
+        if result is FAILED:
+            raise ConvertException(self, argument)
+        return result
+
+    def try_convert(self, argument: Any) -> Any:
+        if type(argument) is not dict and not isinstance(argument, MappingType):
+            return FAILED
+        return self._compiled(argument)
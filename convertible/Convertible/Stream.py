@@ -0,0 +1,77 @@
+from typing import Iterator, Iterable
+
+from .ConvertException import ConvertException
+
+from .Convertible import Convertible, wraps_asynchronous
+
+
+class Stream(Convertible):
+    """
+    A Convertible that lazily converts each item of an iterable argument with the Convertible provided.
+    The items are only converted as the generator returned is consumed, so arbitrarily large iterables are converted
+    in constant memory.
+    """
+
+    __slots__ = ("convertible", "skip_invalid")
+
+    def __init__(self, convertible: Convertible, *, skip_invalid: bool = False):
+        """
+        Initialize a Stream Convertible.
+
+        Parameters
+        ----------
+        convertible : Convertible
+            The Convertible that converts each item of the iterable.
+        skip_invalid : bool, optional
+            If items that cannot be converted are skipped, by default False
+            Otherwise, the ConvertException is raised when the item is reached.
+        """
+        self.convertible = convertible
+        self.skip_invalid = skip_invalid
+
+    def __repr__(self) -> str:
+        convertible = "..." if self.convertible is self else f"{self.convertible}"
+        if self.skip_invalid:
+            return f"{self.__class__.__name__}({convertible}, skip_invalid=True)"
+        return f"{self.__class__.__name__}({convertible})"
+
+    @property
+    def asynchronous(self) -> bool:
+        return wraps_asynchronous(self, self.convertible)
+
+    def convert(self, argument: Iterable) -> Iterator:
+        """
+        Converts the argument to a generator of the converted items.
+
+        Parameters
+        ----------
+        argument : Iterable
+            The iterable to be converted.
+
+        Returns
+        -------
+        Iterator
+            A generator that converts each item as it is requested.
+
+        Raises
+        ------
+        ConvertException
+            Raises an exception if the argument is not iterable.
+        """
+        try:
+            iterator = iter(argument)
+        except TypeError:
+            raise ConvertException(self, argument)
+        return self._stream(iterator)
+
+    def _stream(self, iterator: Iterator) -> Iterator:
+        """
+        Converts each item of the iterator on demand.
+        """
+        convert = self.convertible.convert
+        for item in iterator:
+            try:
+                yield convert(item)
+            except ConvertException:
+                if not self.skip_invalid:
+                    raise
@@ -1 +1,6 @@
-from .Convertible import Convertible
+from .ConvertException import ConvertException
+from .NextArgumentException import NextArgumentException
+from .RejectArgumentException import RejectArgumentException
+from .NoMoreArguments import NoMoreArguments
+from .Convertible import Convertible, FAILED
+from .AsyncConvertible import AsyncConvertible
@@ -0,0 +1,190 @@
+"""
+Convertibles for binary arguments, such as bytes, bytearray and memoryview.
+
+Each Convertible reads the argument through a memoryview, so sub-ranges of a buffer are converted without copying
+them.  Slice provides a sub-range of a buffer for the other Convertibles, such as
+``Chain(Slice(4, 8), IntFromBytes())``.
+"""
+
+from typing import Any, List, Optional, Tuple, Union
+from struct import Struct as _Struct, error as StructError
+
+from .ConvertException import ConvertException
+
+from .Convertible import Convertible, FAILED, wraps_asynchronous
+
+
+def _view(argument: Any) -> Optional[memoryview]:
+    """
+    Provides a flat memoryview of bytes of the argument, or None if the argument is not a buffer.
+    """
+    try:
+        view = memoryview(argument)
+    except TypeError:
+        return None
+    if view.ndim != 1 or view.format != "B":
+        try:
+            view = view.cast("B")
+        except TypeError:
+            return None
+    return view
+
+
+class _BinaryConvertible(Convertible):
+    """
+    A Convertible of buffers, which only implements try_convert.
+    """
+
+    __slots__ = ()
+
+    def convert(self, argument: Any) -> Any:
+        result = self.try_convert(argument)
+        if result is FAILED:
+            raise ConvertException(self, argument)
+        return result
+
+
+class Struct(_BinaryConvertible):
+    """
+    A Convertible that unpacks a buffer with a struct format, providing a tuple of its fields.
+    When repeated, the buffer is unpacked as a sequence of records, providing a list of tuples.
+    """
+
+    __slots__ = ("struct", "offset", "repeat")
+
+    def __init__(self, format: str, offset: int = 0, repeat: bool = False):
+        """
+        Initialize a Struct Convertible.
+
+        Parameters
+        ----------
+        format : str
+            The format of the struct, as used by the struct module.
+        offset : int, optional
+            The index of the first byte of the struct in the buffer, by default 0
+            Any bytes after the struct are ignored.
+        repeat : bool, optional
+            If the buffer from offset is a sequence of records, by default False
+            The buffer must then be a multiple of the size of the struct.
+        """
+        self.struct = _Struct(format)
+        self.offset = offset
+        self.repeat = repeat
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.struct.format!r}, offset={self.offset}, repeat={self.repeat})"
+
+    def try_convert(self, argument: Any) -> Union[Tuple, List[Tuple], Any]:
+        view = _view(argument)
+        if view is None:
+            return FAILED
+        try:
+            if self.repeat:
+                return list(self.struct.iter_unpack(view[self.offset :]))
+            return self.struct.unpack_from(view, self.offset)
+        except StructError:
+            return FAILED
+
+
+class Utf8(_BinaryConvertible):
+    """
+    A Convertible that decodes a buffer of UTF-8.
+    """
+
+    __slots__ = ("errors",)
+
+    def __init__(self, errors: str = "strict"):
+        """
+        Initialize a Utf8 Convertible.
+
+        Parameters
+        ----------
+        errors : str, optional
+            How invalid bytes are handled, by default "strict"
+            When strict, buffers with invalid bytes cannot be converted.
+        """
+        self.errors = errors
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.errors!r})"
+
+    def try_convert(self, argument: Any) -> Union[str, Any]:
+        view = _view(argument)
+        if view is None:
+            return FAILED
+        try:
+            return str(view, "utf-8", self.errors)
+        except UnicodeDecodeError:
+            return FAILED
+
+
+class IntFromBytes(_BinaryConvertible):
+    """
+    A Convertible that reads an integer from a buffer.
+    """
+
+    __slots__ = ("byteorder", "signed")
+
+    def __init__(self, byteorder: str = "big", signed: bool = False):
+        """
+        Initialize an IntFromBytes Convertible.
+
+        Parameters
+        ----------
+        byteorder : str, optional
+            The order of the bytes of the integer, either "big" or "little", by default "big"
+        signed : bool, optional
+            If the integer is stored as two's complement, by default False
+        """
+        self.byteorder = byteorder
+        self.signed = signed
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.byteorder!r}, signed={self.signed})"
+
+    def try_convert(self, argument: Any) -> Union[int, Any]:
+        view = _view(argument)
+        if view is None:
+            return FAILED
+        return int.from_bytes(view, self.byteorder, signed=self.signed)
+
+
+class Slice(_BinaryConvertible):
+    """
+    A Convertible that provides a sub-range of a buffer as a memoryview, optionally converting it with another
+    Convertible.  The sub-range shares the memory of the buffer, so it is not copied.
+    """
+
+    __slots__ = ("start", "stop", "convertible")
+
+    def __init__(self, start: int = 0, stop: Optional[int] = None, convertible: Optional[Convertible] = None):
+        """
+        Initialize a Slice Convertible.
+
+        Parameters
+        ----------
+        start : int, optional
+            The index of the first byte, by default 0
+        stop : Optional[int], optional
+            The index after the last byte, by default None
+            If None is provided, the sub-range ends with the buffer.  Otherwise, shorter buffers cannot be converted.
+        convertible : Optional[Convertible], optional
+            The Convertible of the sub-range, by default None
+        """
+        self.start = start
+        self.stop = stop
+        self.convertible = convertible
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.start}, {self.stop}, {self.convertible})"
+
+    @property
+    def asynchronous(self) -> bool:
+        return wraps_asynchronous(self, self.convertible)
+
+    def try_convert(self, argument: Any) -> Any:
+        view = _view(argument)
+        if view is None or len(view) < (self.start if self.stop is None else self.stop):
+            return FAILED
+        view = view[self.start : self.stop]
+        return view if self.convertible is None else self.convertible.try_convert(view)
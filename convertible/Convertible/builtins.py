@@ -0,0 +1,359 @@
+"""
+Convertibles for the common types of the standard library.
+
+Each Convertible provides arguments that already have its type unchanged, without raising or catching any exception,
+and implements try_convert and convert_many directly.  Use register_builtins to register them for convert.auto.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Pattern
+from datetime import datetime
+from decimal import Context, Decimal as _Decimal, DecimalException
+from pathlib import Path as _Path, PurePath
+from uuid import UUID as _UUID
+import re
+
+from .Convertible import Convertible, FAILED
+from .ConvertException import ConvertException
+
+if TYPE_CHECKING:
+    from convertible.Registry.Registry import Registry
+
+
+class _Builtin(Convertible):
+    """
+    A Convertible that implements convert through try_convert.
+    """
+
+    __slots__ = ()
+
+    def convert(self, argument: Any) -> Any:
+        result = self.try_convert(argument)
+        if result is FAILED:
+            raise ConvertException(self, argument)
+        return result
+
+    def convert_many(self, arguments: Iterable[Any]) -> List[Any]:
+        try_convert = self.try_convert
+        results = []
+        append = results.append
+        for argument in arguments:
+            result = try_convert(argument)
+            if result is FAILED:
+                raise ConvertException(self, argument)
+            append(result)
+        return results
+
+
+class Int(_Builtin):
+    """
+    A Convertible that converts an argument with int.
+    """
+
+    __slots__ = ()
+
+    def convert(self, argument: Any) -> Any:
+        if type(argument) is int:
+            return argument
+        try:
+            return int(argument)
+        except (TypeError, ValueError, OverflowError):
+            raise ConvertException(self, argument)
+
+    def try_convert(self, argument: Any) -> Any:
+        if type(argument) is int:
+            return argument
+        try:
+            return int(argument)
+        except (TypeError, ValueError, OverflowError):
+            return FAILED
+
+    def convert_many(self, arguments: Iterable[Any]) -> List[Any]:
+        arguments = list(arguments)
+        try:
+            return list(map(int, arguments))
+        except (TypeError, ValueError, OverflowError):
+            # Find the argument that could not be converted.
+            return super().convert_many(arguments)
+
+
+class Float(_Builtin):
+    """
+    A Convertible that converts an argument with float.
+    """
+
+    __slots__ = ()
+
+    def convert(self, argument: Any) -> Any:
+        if type(argument) is float:
+            return argument
+        try:
+            return float(argument)
+        except (TypeError, ValueError, OverflowError):
+            raise ConvertException(self, argument)
+
+    def try_convert(self, argument: Any) -> Any:
+        if type(argument) is float:
+            return argument
+        try:
+            return float(argument)
+        except (TypeError, ValueError, OverflowError):
+            return FAILED
+
+    def convert_many(self, arguments: Iterable[Any]) -> List[Any]:
+        arguments = list(arguments)
+        try:
+            return list(map(float, arguments))
+        except (TypeError, ValueError, OverflowError):
+            return super().convert_many(arguments)
+
+
+class Str(_Builtin):
+    """
+    A Convertible that converts an argument to a str, decoding bytes as UTF-8.
+    """
+
+    __slots__ = ()
+
+    def try_convert(self, argument: Any) -> Any:
+        if type(argument) is str:
+            return argument
+        if isinstance(argument, (bytes, bytearray, memoryview)):
+            try:
+                return str(argument, "utf-8")
+            except UnicodeDecodeError:
+                return FAILED
+        return str(argument)
+
+
+_BOOLEANS: Dict[Any, bool] = {
+    **dict.fromkeys(("true", "t", "yes", "y", "on", "1", 1), True),
+    **dict.fromkeys(("false", "f", "no", "n", "off", "0", 0), False),
+}
+
+
+class Bool(_Builtin):
+    """
+    A Convertible that converts the common spellings of true and false, regardless of case, and the integers 1 and 0.
+    """
+
+    __slots__ = ()
+
+    def try_convert(self, argument: Any) -> Any:
+        if type(argument) is bool:
+            return argument
+        if isinstance(argument, str):
+            argument = argument.strip().lower()
+        try:
+            return _BOOLEANS.get(argument, FAILED)
+        except TypeError:
+            return FAILED
+
+
+class Decimal(_Builtin):
+    """
+    A Convertible that converts an argument to a decimal.Decimal.
+    The context of the conversions is created once, instead of being looked up for each conversion.
+    """
+
+    __slots__ = ("context",)
+
+    def __init__(self, context: Optional[Context] = None, precision: Optional[int] = None):
+        """
+        Initialize a Decimal Convertible.
+
+        Parameters
+        ----------
+        context : Optional[Context], optional
+            The context of the conversions, by default None
+            If None is provided, the conversions are exact, so Decimals are provided unchanged.
+        precision : Optional[int], optional
+            The amount of significant digits of the results, by default None
+            If provided, it replaces the precision of the context.
+        """
+        if precision is not None:
+            context = (context or Context()).copy()
+            context.prec = precision
+        self.context = context
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.context})"
+
+    def try_convert(self, argument: Any) -> Any:
+        if self.context is None:
+            if type(argument) is _Decimal:
+                return argument
+            if isinstance(argument, float):
+                return _Decimal.from_float(argument)
+            try:
+                return _Decimal(argument)
+            except (DecimalException, TypeError, ValueError):
+                return FAILED
+        try:
+            return self.context.create_decimal(argument)
+        except (DecimalException, TypeError, ValueError):
+            return FAILED
+
+
+# The patterns of the directives used by strptime, so the formats match the same arguments.
+_DIRECTIVES = {
+    "Y": r"(?P<year>\d\d\d\d)",
+    "m": r"(?P<month>1[0-2]|0[1-9]|[1-9])",
+    "d": r"(?P<day>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])",
+    "H": r"(?P<hour>2[0-3]|[01]\d|\d)",
+    "M": r"(?P<minute>[0-5]\d|\d)",
+    "S": r"(?P<second>6[01]|[0-5]\d|\d)",
+    "f": r"(?P<microsecond>[0-9]{1,6})",
+}
+
+
+def _compile(format: str) -> Optional[Pattern]:
+    """
+    Compiles a format of strptime into a regular expression, or provides None if the format has a directive that is
+    not supported, so strptime must be used instead.
+    Like strptime, whitespace matches any amount of whitespace and letters match regardless of their case.
+    """
+    pattern = []
+    index = 0
+    while index < len(format):
+        character = format[index]
+        if character.isspace():
+            if not pattern or pattern[-1] != r"\s+":
+                pattern.append(r"\s+")
+        elif character != "%":
+            pattern.append(re.escape(character))
+        elif format[index + 1 : index + 2] == "%":
+            pattern.append("%")
+            index += 1
+        else:
+            directive = _DIRECTIVES.get(format[index + 1 : index + 2])
+            if directive is None or directive in pattern:
+                return None
+            pattern.append(directive)
+            index += 1
+        index += 1
+    return re.compile("".join(pattern), re.IGNORECASE)
+
+
+class Datetime(_Builtin):
+    """
+    A Convertible that converts a str to a datetime.
+    Formats that only use the directives %Y, %m, %d, %H, %M, %S and %f are compiled once into a regular expression,
+    while other formats are converted by datetime.strptime.
+    """
+
+    __slots__ = ("format", "_pattern")
+
+    def __init__(self, format: Optional[str] = None):
+        """
+        Initialize a Datetime Convertible.
+
+        Parameters
+        ----------
+        format : Optional[str], optional
+            The format of the arguments, as used by datetime.strptime, by default None
+            If None is provided, the arguments are converted by datetime.fromisoformat.
+        """
+        self.format = format
+        self._pattern = None if format is None else _compile(format)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.format!r})"
+
+    def __getstate__(self) -> Optional[str]:
+        return self.format
+
+    def __setstate__(self, state: Optional[str]):
+        self.__init__(state)
+
+    def try_convert(self, argument: Any) -> Any:
+        if type(argument) is datetime:
+            return argument
+        if not isinstance(argument, str):
+            return FAILED
+        try:
+            if self.format is None:
+                return datetime.fromisoformat(argument)
+            if self._pattern is None:
+                return datetime.strptime(argument, self.format)
+
+            # Like strptime, the first match must cover the argument, rather than any match.
+            match = self._pattern.match(argument)
+            if match is None or match.end() != len(argument):
+                return FAILED
+            fields = match.groupdict()
+            microsecond = fields.get("microsecond")
+            return datetime(
+                int(fields.get("year", 1900)),
+                int(fields.get("month", 1)),
+                int(fields.get("day", 1)),
+                int(fields.get("hour", 0)),
+                int(fields.get("minute", 0)),
+                int(fields.get("second", 0)),
+                0 if microsecond is None else int(microsecond.ljust(6, "0")),
+            )
+        except ValueError:
+            return FAILED
+
+
+class UUID(_Builtin):
+    """
+    A Convertible that converts a str, or 16 bytes, to a uuid.UUID.
+    """
+
+    __slots__ = ()
+
+    def try_convert(self, argument: Any) -> Any:
+        if type(argument) is _UUID:
+            return argument
+        try:
+            if isinstance(argument, str):
+                return _UUID(argument)
+            if isinstance(argument, (bytes, bytearray)):
+                return _UUID(bytes=bytes(argument))
+        except ValueError:
+            pass
+        return FAILED
+
+
+class Path(_Builtin):
+    """
+    A Convertible that converts a str, or another path-like argument, to a pathlib.Path.
+    """
+
+    __slots__ = ()
+
+    def try_convert(self, argument: Any) -> Any:
+        if isinstance(argument, _Path):
+            return argument
+        if isinstance(argument, (str, PurePath)) or hasattr(argument, "__fspath__"):
+            try:
+                return _Path(argument)
+            except TypeError:
+                pass
+        return FAILED
+
+
+def register_builtins(registry: Optional["Registry"] = None):
+    """
+    Registers the Convertible of each type of this module, so convert.auto converts parameters annotated with them.
+
+    Parameters
+    ----------
+    registry : Optional[Registry], optional
+        The registry of the Convertibles, by default None
+        If None is provided, the global registry is used.
+    """
+    if registry is None:
+        from convertible.Registry.Registry import registry
+
+    for type_, convertible in (
+        (int, Int()),
+        (float, Float()),
+        (str, Str()),
+        (bool, Bool()),
+        (_Decimal, Decimal()),
+        (datetime, Datetime()),
+        (_UUID, UUID()),
+        (PurePath, Path()),
+    ):
+        registry.register(type_, convertible)
@@ -0,0 +1,351 @@
+"""
+Convertibles for arguments that are containers, such as a list of ints or a dict of lists.
+
+The containers are walked with an explicit stack instead of recursion, so deeply nested arguments cannot exhaust the
+stack.  A container whose items all convert to themselves is provided unchanged instead of being rebuilt.
+"""
+
+from typing import Any, Iterable, List, Optional, Sequence
+from collections.abc import Mapping
+from abc import abstractmethod
+
+from .Convertible import Convertible, FAILED, wraps_asynchronous
+from .ConvertException import ConvertException
+
+_SCALARS = (str, bytes, bytearray, memoryview)
+
+
+class _Container(Convertible):
+    """
+    A Convertible of a container, which converts each item of the container with the Convertible of the item.
+    When nested, items that are containers of the same kind are converted by the Convertible itself, at any depth.
+    """
+
+    __slots__ = ("item", "nested")
+
+    def __init__(self, item: Optional[Convertible] = None, nested: bool = False):
+        """
+        Initialize a container Convertible.
+
+        Parameters
+        ----------
+        item : Optional[Convertible], optional
+            The Convertible of each item, by default None
+            If None is provided, the items are not converted.
+        nested : bool, optional
+            If items that are containers of the same kind are converted by this Convertible, by default False
+        """
+        self.item = item
+        self.nested = nested
+
+    def __repr__(self) -> str:
+        item = "..." if self.item is self else f"{self.item}"
+        return f"{self.__class__.__name__}({item}, nested={self.nested})"
+
+    @property
+    def asynchronous(self) -> bool:
+        return wraps_asynchronous(self, self.item)
+
+    @property
+    def _leaf(self) -> bool:
+        """If every item is converted by a Convertible that is not a container, so no stack is required."""
+        return not self.nested and not isinstance(self.item, _Container)
+
+    def _items(self, argument: Any) -> Any:
+        """
+        Provides the items of the argument, or FAILED if the argument is not a container of this kind.
+        """
+        if type(argument) is list or type(argument) is tuple:
+            return argument
+        if isinstance(argument, _SCALARS) or isinstance(argument, Mapping):
+            return FAILED
+        try:
+            return list(argument)
+        except TypeError:
+            return FAILED
+
+    def _is_nested(self, value: Any) -> bool:
+        """
+        Determines if an item is a container of the same kind, for nested Convertibles.
+        """
+        return type(value) is list
+
+    def _child(self, index: int, value: Any) -> Optional[Convertible]:
+        """
+        Provides the Convertible of the item at index.
+        """
+        if self.nested and self._is_nested(value):
+            return self
+        return self.item
+
+    def _leaf_convertibles(self) -> Sequence[Optional[Convertible]]:
+        """
+        Provides the Convertibles of the items in turn, for Convertibles without a stack.
+        """
+        return (self.item,)
+
+    @abstractmethod
+    def _build(self, argument: Any, results: List[Any], changed: bool) -> Any:
+        """
+        Creates the result from the converted items, or provides the argument if it does not need to change.
+        """
+
+    def _convert_column(self, column: List[Any]) -> List[Any]:
+        """
+        Converts the items of many containers at once, for Convertibles without a stack.
+        """
+        return column if self.item is None else self.item.convert_many(column)
+
+    def convert(self, argument: Any) -> Any:
+        """
+        Converts each item of the container provided.
+
+        Parameters
+        ----------
+        argument : Any
+            The container to be converted.
+
+        Returns
+        -------
+        Any
+            The container of the converted items, or the argument itself if every item converted to itself.
+
+        Raises
+        ------
+        ConvertException
+            Raises an exception if the argument is not a container of this kind or any item could not be converted.
+        """
+        if not self._leaf:
+            result = _walk(self, argument)
+            if result is FAILED:
+                raise ConvertException(self, argument)
+            return result
+        return self.convert_many((argument,))[0]
+
+    def try_convert(self, argument: Any) -> Any:
+        if not self._leaf:
+            return _walk(self, argument)
+
+        items = self._items(argument)
+        if items is FAILED:
+            return FAILED
+        results = [None] * len(items)
+        changed = False
+        convertibles = self._leaf_convertibles()
+        period = len(convertibles)
+        for index, value in enumerate(items):
+            convertible = convertibles[index % period]
+            if convertible is not None:
+                result = convertible.try_convert(value)
+                if result is FAILED:
+                    return FAILED
+                if result is not value:
+                    results[index] = result
+                    changed = True
+                    continue
+            results[index] = value
+        return self._build(argument, results, changed)
+
+    def convert_many(self, arguments: Iterable[Any]) -> List[Any]:
+        """
+        Converts a column of containers.  Without a stack, the items of every container are converted together by
+        the batch conversion of the Convertible of the items.
+
+        Parameters
+        ----------
+        arguments : Iterable[Any]
+            The containers to be converted.
+
+        Returns
+        -------
+        List[Any]
+            The converted containers, in order.
+        """
+        if not self._leaf:
+            return super().convert_many(arguments)
+
+        arguments = list(arguments)
+        groups = []
+        column = []
+        for argument in arguments:
+            items = self._items(argument)
+            if items is FAILED:
+                raise ConvertException(self, argument)
+            groups.append(items)
+            column.extend(items)
+
+        column = self._convert_column(column)
+        results = []
+        start = 0
+        for argument, items in zip(arguments, groups):
+            stop = start + len(items)
+            converted = column[start:stop]
+            changed = any(result is not value for result, value in zip(converted, items))
+            results.append(self._build(argument, converted, changed))
+            start = stop
+        return results
+
+
+def _walk(container: _Container, argument: Any) -> Any:
+    """
+    Converts a container whose items may be containers, using a stack of the containers being converted.
+    Each frame is the Convertible, the argument, its items, the preallocated results, the index of the next item and
+    if any item changed.  A container that contains itself cannot be converted, so it fails.
+    """
+    items = container._items(argument)
+    if items is FAILED:
+        return FAILED
+    stack = [[container, argument, items, [None] * len(items), 0, False]]
+    # The identities of the containers on the stack.
+    active = {id(argument)}
+
+    while True:
+        frame = stack[-1]
+        convertible, source, items, results, index, changed = frame
+        if index < len(items):
+            value = items[index]
+            child = convertible._child(index, value)
+            if isinstance(child, _Container):
+                if id(value) in active:
+                    return FAILED
+                child_items = child._items(value)
+                if child_items is FAILED:
+                    return FAILED
+                stack.append([child, value, child_items, [None] * len(child_items), 0, False])
+                active.add(id(value))
+                continue
+
+            result = value if child is None else child.try_convert(value)
+            if result is FAILED:
+                return FAILED
+            results[index] = result
+            if result is not value:
+                frame[5] = True
+            frame[4] = index + 1
+            continue
+
+        result = convertible._build(source, results, changed)
+        stack.pop()
+        active.discard(id(source))
+        if not stack:
+            return result
+        parent = stack[-1]
+        parent[3][parent[4]] = result
+        if result is not source:
+            parent[5] = True
+        parent[4] += 1
+
+
+class ListOf(_Container):
+    """
+    A Convertible that converts each item of a list, or any other iterable, providing a list.
+    """
+
+    __slots__ = ()
+
+    def _build(self, argument: Any, results: List[Any], changed: bool) -> List[Any]:
+        if not changed and type(argument) is list:
+            return argument
+        return results
+
+
+class TupleOf(_Container):
+    """
+    A Convertible that converts each item of a tuple, or any other iterable, providing a tuple.
+    """
+
+    __slots__ = ()
+
+    def _is_nested(self, value: Any) -> bool:
+        return type(value) is tuple
+
+    def _build(self, argument: Any, results: List[Any], changed: bool) -> tuple:
+        if not changed and type(argument) is tuple:
+            return argument
+        return tuple(results)
+
+
+class SetOf(_Container):
+    """
+    A Convertible that converts each item of a set, or any other iterable, providing a set.
+    When nested, the items that are frozensets are converted to frozensets.
+    """
+
+    __slots__ = ()
+
+    def _is_nested(self, value: Any) -> bool:
+        return type(value) is frozenset
+
+    def _build(self, argument: Any, results: List[Any], changed: bool) -> Any:
+        if not changed and type(argument) in (set, frozenset):
+            return argument
+        return frozenset(results) if type(argument) is frozenset else set(results)
+
+
+class DictOf(_Container):
+    """
+    A Convertible that converts each key and value of a mapping, providing a dict.
+    When nested, the values that are mappings are converted by the DictOf itself.
+    """
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: Optional[Convertible] = None, value: Optional[Convertible] = None, nested: bool = False):
+        """
+        Initialize a DictOf Convertible.
+
+        Parameters
+        ----------
+        key : Optional[Convertible], optional
+            The Convertible of each key, by default None
+            If None is provided, the keys are not converted.
+        value : Optional[Convertible], optional
+            The Convertible of each value, by default None
+            If None is provided, the values are not converted.
+        nested : bool, optional
+            If values that are mappings are converted by this Convertible, by default False
+        """
+        super().__init__(value, nested)
+        self.key = key
+
+    def __repr__(self) -> str:
+        value = "..." if self.item is self else f"{self.item}"
+        return f"{self.__class__.__name__}({self.key}, {value}, nested={self.nested})"
+
+    @property
+    def asynchronous(self) -> bool:
+        return wraps_asynchronous(self, self.key, self.item)
+
+    @property
+    def _leaf(self) -> bool:
+        return super()._leaf and not isinstance(self.key, _Container)
+
+    def _items(self, argument: Any) -> Any:
+        # The keys and values are interleaved, so the keys are at the even indexes.
+        if not isinstance(argument, Mapping):
+            return FAILED
+        return [item for pair in argument.items() for item in pair]
+
+    def _is_nested(self, value: Any) -> bool:
+        return isinstance(value, Mapping)
+
+    def _leaf_convertibles(self) -> Sequence[Optional[Convertible]]:
+        return self.key, self.item
+
+    def _child(self, index: int, value: Any) -> Optional[Convertible]:
+        if index % 2 == 0:
+            return self.key
+        return super()._child(index, value)
+
+    def _build(self, argument: Any, results: List[Any], changed: bool) -> dict:
+        if not changed and type(argument) is dict:
+            return argument
+        iterator = iter(results)
+        return dict(zip(iterator, iterator))
+
+    def _convert_column(self, column: List[Any]) -> List[Any]:
+        keys = column[0::2] if self.key is None else self.key.convert_many(column[0::2])
+        values = column[1::2] if self.item is None else self.item.convert_many(column[1::2])
+        column[0::2] = keys
+        column[1::2] = values
+        return column
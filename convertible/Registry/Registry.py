@@ -0,0 +1,150 @@
+from typing import Any, Callable, Dict, Type, Union, List, get_type_hints, get_origin, get_args
+from typing import Optional as OptionalType
+from inspect import signature, Parameter
+import types
+
+from convertible.Convertible import Convertible
+from convertible.Convertible.Greedy import Greedy
+from convertible.Convertible.Optional import Optional
+from convertible.Convert.ConvertHandler.ConvertHandler import ConvertHandler
+
+_UNIONS = (Union, getattr(types, "UnionType", Union))
+_CONVERTED = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY)
+
+
+class Registry:
+    """
+    A registry of the Convertibles for each type, to automatically create ConvertHandlers from type hints.
+    A type is converted by the Convertible registered for the first class of its method resolution order.
+    """
+
+    __slots__ = ("convertibles", "_resolved")
+
+    def __init__(self, convertibles: OptionalType[Dict[Type, Convertible]] = None):
+        """
+        Initializes a Registry.
+
+        Parameters
+        ----------
+        convertibles : Optional[Dict[Type, Convertible]], optional
+            The Convertibles already registered, by type, by default None
+        """
+        self.convertibles: Dict[Type, Convertible] = dict(convertibles or {})
+        self._resolved: Dict[Any, OptionalType[Convertible]] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.convertibles})"
+
+    def register(self, type_: Type, convertible: Convertible) -> Convertible:
+        """
+        Registers the Convertible for a type and its subclasses.
+
+        Parameters
+        ----------
+        type_ : Type
+            The type that is converted.
+        convertible : Convertible
+            The Convertible that converts arguments to the type.
+
+        Returns
+        -------
+        Convertible
+            The Convertible registered.
+        """
+        self.convertibles[type_] = convertible
+        self._resolved.clear()
+        return convertible
+
+    def resolve(self, annotation: Any) -> OptionalType[Convertible]:
+        """
+        Resolves the Convertible of a type hint.
+        typing.Optional is converted by Optional and List by Greedy, using the Convertible of their argument.
+
+        Parameters
+        ----------
+        annotation : Any
+            The type hint of a parameter.
+
+        Returns
+        -------
+        Optional[Convertible]
+            The Convertible of the type hint or None if no Convertible is registered for it.
+        """
+        try:
+            return self._resolved[annotation]
+        except KeyError:
+            pass
+        except TypeError:
+            # Some type hints are not hashable, so they cannot be cached.
+            return self._resolve(annotation)
+        convertible = self._resolved[annotation] = self._resolve(annotation)
+        return convertible
+
+    def _resolve(self, annotation: Any) -> OptionalType[Convertible]:
+        origin, arguments = get_origin(annotation), get_args(annotation)
+        if origin in _UNIONS:
+            arguments = tuple(argument for argument in arguments if argument is not type(None))
+            if len(arguments) == 1 and len(arguments) < len(get_args(annotation)):
+                convertible = self.resolve(arguments[0])
+                return None if convertible is None else Optional(convertible)
+            return None
+        if origin in (list, List) and len(arguments) == 1:
+            convertible = self.resolve(arguments[0])
+            return None if convertible is None else Greedy(convertible)
+        if isinstance(annotation, type):
+            for base in annotation.__mro__:
+                if base in self.convertibles:
+                    return self.convertibles[base]
+        return None
+
+    def handler(self, function: Callable) -> ConvertHandler:
+        """
+        Creates a ConvertHandler from the type hints of a function.
+        Every parameter, except variadic parameters, whose type hint can be resolved is converted, regardless of
+        if it is passed positionally or by keyword.
+
+        Parameters
+        ----------
+        function : Callable
+            The function that is converted.
+
+        Returns
+        -------
+        ConvertHandler
+            The ConvertHandler for the parameters of the function.
+        """
+        try:
+            hints = get_type_hints(function)
+        except (NameError, TypeError):
+            hints = getattr(function, "__annotations__", {})
+
+        convertibles = {}
+        for name, parameter in signature(function).parameters.items():
+            if parameter.kind not in _CONVERTED or name not in hints:
+                continue
+            convertible = self.resolve(hints[name])
+            if convertible is not None:
+                convertibles[name] = convertible
+        return ConvertHandler(**convertibles)
+
+
+registry = Registry()
+
+
+def register(type_: Type, convertible: Convertible) -> Convertible:
+    """
+    Registers the Convertible for a type and its subclasses in the global registry.
+
+    Parameters
+    ----------
+    type_ : Type
+        The type that is converted.
+    convertible : Convertible
+        The Convertible that converts arguments to the type.
+
+    Returns
+    -------
+    Convertible
+        The Convertible registered.
+    """
+    return registry.register(type_, convertible)
@@ -0,0 +1 @@
+from .Registry import Registry, registry, register
@@ -1,5 +1,64 @@
-from .ignore_self import ignore_self
-from .Convertible import Convertible
-from .convert import convert
-from .Convert import *
-from .Convertible import *
+"""
+Converts the arguments of functions automatically.
+
+The public names are imported once they are first used, so importing the package does not import the modules of
+names that are never used.
+"""
+
+from importlib import import_module
+from types import ModuleType
+import sys
+
+_EXPORTS = {
+    "ignore_self": "convertible.ignore_self",
+    "convert": "convertible.convert",
+    "Convert": "convertible.Convert.Convert",
+    "AsyncConvert": "convertible.Convert.AsyncConvert",
+    "Instrumentation": "convertible.Convert.Instrumentation",
+    "ConvertibleStatistics": "convertible.Convert.Instrumentation",
+    "ConvertHandler": "convertible.Convert.ConvertHandler.ConvertHandler",
+    "CallPlan": "convertible.Convert.ConvertHandler.CallPlan",
+    "ExceptionHandler": "convertible.Convert.ExceptionHandler.ExceptionHandler",
+    "Convertible": "convertible.Convertible.Convertible",
+    "FAILED": "convertible.Convertible.Convertible",
+    "AsyncConvertible": "convertible.Convertible.AsyncConvertible",
+    "ConvertException": "convertible.Convertible.ConvertException",
+    "NextArgumentException": "convertible.Convertible.NextArgumentException",
+    "RejectArgumentException": "convertible.Convertible.RejectArgumentException",
+    "NoMoreArguments": "convertible.Convertible.NoMoreArguments",
+    "Greedy": "convertible.Convertible.Greedy",
+    "Optional": "convertible.Convertible.Optional",
+    "Registry": "convertible.Registry.Registry",
+    "register": "convertible.Registry.Registry",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_EXPORTS})
+
+
+class _Package(ModuleType):
+    """
+    The type of the package, which keeps the submodules that share the name of a public name, such as convert and
+    Convert, from replacing the public name once the submodule is imported.
+    """
+
+    def __setattr__(self, name: str, value):
+        if name in _EXPORTS and isinstance(value, ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
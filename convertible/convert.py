@@ -1,17 +1,19 @@
 from typing import Callable, Optional
 
-from .ignore_self import ignore_self
 from .Convert.Convert import Convert
+from .Convert.AsyncConvert import AsyncConvert
 from .Convert.ConvertHandler.ConvertHandler import ConvertHandler
 from .Convert.ExceptionHandler.ExceptionHandler import ExceptionHandler
+from .Registry.Registry import Registry, registry as global_registry
 
 
 def convert(
-    convert_handler: ConvertHandler, exception_handler: Optional[ExceptionHandler] = None
+    convert_handler: ConvertHandler, exception_handler: Optional[ExceptionHandler] = None, specialize: bool = True
 ) -> Callable[[Callable], Convert]:
     """
     A function to provide a descriptor of type Convert.
-    Unlike if it was called normally, this function will strip the self argument off of classes called.
+    Unlike if it was called normally, the self argument of methods is passed through without being converted.
+    Coroutine functions and handlers with an AsyncConvertible are provided an AsyncConvert instead.
 
     Parameters
     ----------
@@ -20,6 +22,8 @@ def convert(
     exception_handler : Optional[ExceptionHandler], optional
         The handler for any ConvertExceptions, by default None
         If None is provided, then no Exceptions will be caught automatically.
+    specialize : bool, optional
+        If calls are converted by a function generated for the ConvertHandler, by default True
 
     Returns
     -------
@@ -27,10 +31,45 @@ def convert(
         A descriptor with the Convert instance, which will ignore the self argument of classes.
     """
 
-    @ignore_self
     def convert(func: Callable) -> Convert:
         """The middle wrapper for the decorator"""
 
-        return Convert(func, convert_handler, exception_handler)
+        if AsyncConvert.required(func, convert_handler):
+            return AsyncConvert(func, convert_handler, exception_handler)
+        return Convert(func, convert_handler, exception_handler, specialize)
 
     return convert
+
+
+def auto(
+    exception_handler: Optional[ExceptionHandler] = None, registry: Optional[Registry] = None
+) -> Callable[[Callable], Convert]:
+    """
+    A function to provide a descriptor of type Convert, whose ConvertHandler is created from the type hints of the
+    function by a Registry.
+    The type hints are only resolved once, when the function is decorated.
+
+    Parameters
+    ----------
+    exception_handler : Optional[ExceptionHandler], optional
+        The handler for any ConvertExceptions, by default None
+        If None is provided, then no Exceptions will be caught automatically.
+    registry : Optional[Registry], optional
+        The registry of the Convertibles for each type, by default None
+        If None is provided, the global registry is used.
+
+    Returns
+    -------
+    Callable[[Callable], Convert]
+        A descriptor with the Convert instance, which will ignore the self argument of classes.
+    """
+
+    def auto(func: Callable) -> Callable:
+        """The middle wrapper for the decorator"""
+
+        return convert((registry or global_registry).handler(func), exception_handler)(func)
+
+    return auto
+
+
+convert.auto = auto
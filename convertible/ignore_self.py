@@ -1,34 +1,142 @@
-from typing import Callable, Any
+from typing import Callable, Any, Dict, Tuple
+from importlib import import_module
+from functools import partial
+from inspect import Signature, signature
+from types import MethodType
+from weakref import ReferenceType, ref
 
 
-def ignore_self(decorator: Callable[[Callable], Any]):
+def locate(module: str, qualname: str) -> Any:
     """
-    A decorator to ignore the self variable passed for classes.
-    This will automatically strip the variable if required.
+    Finds an object by the module and qualified name it was defined with.
 
     Parameters
     ----------
+    module : str
+        The name of the module of the object.
+    qualname : str
+        The qualified name of the object inside of the module.
 
-    decorator : Callable[[Callable], Any]
-        The decorator that should ignore the self variable.
+    Returns
+    -------
+    Any
+        The object currently bound to the name, which may be a decorator wrapping the object defined.
+    """
+    result = import_module(module)
+    for name in qualname.split("."):
+        result = getattr(result, name)
+    return result
+
+
+class _WeakMethod:
+    """
+    A method that references its instance weakly, so a method decorated for an instance does not keep it alive.
+    """
+
+    __slots__ = ("__func__", "_instance")
+
+    def __init__(self, func: Callable, instance: ReferenceType):
+        self.__func__ = func
+        self._instance = instance
+
+    @property
+    def __self__(self) -> Any:
+        """The instance of the method."""
+        return self._instance()
+
+    @property
+    def __signature__(self) -> Signature:
+        """The signature of the method, without the self parameter."""
+        return signature(MethodType(self.__func__, self.__self__))
+
+    def __getattr__(self, name: str) -> Any:
+        if name in _WeakMethod.__slots__:
+            raise AttributeError(name)
+        # Provides the attributes of the function, such as __name__.
+        return getattr(self.__func__, name)
+
+    def __call__(self, *args, **kwargs):
+        instance = self._instance()
+        if instance is None:
+            raise ReferenceError(f"the instance of {self.__func__.__qualname__} no longer exists")
+        return self.__func__(instance, *args, **kwargs)
+
+
+class FunctionMethodAdaptor:
+    """
+    A descriptor to peak to see if it is a method or function at runtime.
+    The function is decorated once and methods are decorated once per instance.  The methods are cached on the
+    adaptor by the identity of their instance, which they only reference weakly, so subclasses and copies of the
+    instance always use their own methods and instances are not kept alive.  Instances that cannot be weakly
+    referenced are decorated on each lookup.
     """
 
-    class FunctionMethodAdaptor:
+    __slots__ = ("decorator", "func", "decorated", "_methods")
+
+    def __init__(self, decorator: Callable[[Callable], Any], func: Callable):
+        self.decorator = decorator
+        self.func = func
+        # The function decorated without an instance.
+        self.decorated = decorator(func)
+        # The reference to each instance and its decorated method, by the id of the instance.
+        self._methods: Dict[int, Tuple[ReferenceType, Any]] = {}
+
+    def __reduce__(self):
+        # The adaptor replaces the function in its module, so it is pickled by the name of the function.
+        return locate, (self.func.__module__, self.func.__qualname__)
+
+    @property
+    def __wrapped__(self) -> Callable:
+        """The function decorated."""
+        return self.func
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self.decorated
+
+        key = id(instance)
+        entry = self._methods.get(key)
+        if entry is not None and entry[0]() is instance:
+            return entry[1]
+        try:
+            reference = ref(instance, partial(self._evict, key))
+        except TypeError:
+            return self.decorator(self.func.__get__(instance, owner))
+        decorated = self.decorator(_WeakMethod(self.func, reference))
+        self._methods[key] = (reference, decorated)
+        return decorated
+
+    def _evict(self, key: int, reference: ReferenceType):
         """
-        A descriptor to peak to see if it is a method or function at runtime.
+        Removes the method of an instance that no longer exists, unless the id was already reused.
         """
+        entry = self._methods.get(key)
+        if entry is not None and entry[0] is reference:
+            del self._methods[key]
 
-        __slots__ = ("decorator", "func")
+    def __call__(self, *args, **kwargs):
+        return self.decorated(*args, **kwargs)
 
-        def __init__(self, decorator: Callable[[Callable], Any], func: Callable):
-            self.decorator = decorator
-            self.func = func
+    def __getattr__(self, name: str) -> Any:
+        if name in FunctionMethodAdaptor.__slots__:
+            raise AttributeError(name)
+        # Provides the attributes of the decorated function, such as Convert.map.
+        return getattr(self.decorated, name)
 
-        def __get__(self, instance, owner):
-            return self.decorator(self.func.__get__(instance, owner))
 
-        def __call__(self, *args, **kwargs):
-            return self.decorator(self.func)(*args, **kwargs)
+def ignore_self(decorator: Callable[[Callable], Any]):
+    """
+    A decorator to ignore the self variable passed for classes.
+    This will automatically strip the variable if required.
+    The function is only decorated once, and once per instance for methods, so calling the result does not
+    decorate the function again.
+
+    Parameters
+    ----------
+
+    decorator : Callable[[Callable], Any]
+        The decorator that should ignore the self variable.
+    """
 
     def ignore_self(func: Callable):
         return FunctionMethodAdaptor(decorator, func)
@@ -0,0 +1,108 @@
+import asyncio
+import time
+
+import pytest
+
+from convertible import convert, Convertible, AsyncConvertible, ConvertException, ExceptionHandler
+from convertible.Convertible.Greedy import Greedy
+from convertible.Convertible.Optional import Optional
+from convertible.Convert.ConvertHandler.ConvertHandler import ConvertHandler
+
+
+class Test(Convertible):
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def convert(self, argument: int) -> str:
+        return str(argument)
+
+
+class AsyncTest(AsyncConvertible):
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    async def convert(self, argument: str) -> int:
+        await asyncio.sleep(0.05)
+        try:
+            return int(argument)
+        except ValueError:
+            raise ConvertException(self, argument)
+
+
+def test_coroutine_function():
+    @convert(ConvertHandler(Test()))
+    async def test(test: str) -> str:
+        return test
+
+    assert str(1) == asyncio.run(test(1))
+
+
+def test_function_both():
+    @convert(ConvertHandler(AsyncTest(), Test(), test3=AsyncTest()))
+    def test(test: int, test2: str, test3: int) -> tuple:
+        return test, test2, test3
+
+    assert (1, str(2), 3) == asyncio.run(test("1", 2, test3="3"))
+
+
+def test_class_both():
+    class Foo:
+        @convert(ConvertHandler(AsyncTest(), test2=AsyncTest()))
+        async def test(self, test: int, test2: int) -> int:
+            return test + test2
+
+    assert 3 == asyncio.run(Foo().test("1", test2="2"))
+
+
+def test_concurrent():
+    @convert(ConvertHandler(AsyncTest(), AsyncTest(), AsyncTest(), AsyncTest()))
+    def test(*args):
+        return args
+
+    start = time.perf_counter()
+    assert (1, 2, 3, 4) == asyncio.run(test("1", "2", "3", "4"))
+    assert time.perf_counter() - start < 0.15
+
+
+def test_exception_handler():
+    @convert(ConvertHandler(AsyncTest()), ExceptionHandler({ConvertException: lambda convert, argument: None}))
+    async def test(test):
+        return test
+
+    assert asyncio.run(test("a")) is None
+
+    @convert(ConvertHandler(AsyncTest()))
+    async def test(test):
+        return test
+
+    with pytest.raises(ConvertException):
+        asyncio.run(test("a"))
+
+
+def test_wrapped_async_convertible():
+    with pytest.raises(TypeError):
+        ConvertHandler(Optional(AsyncTest()))
+
+    with pytest.raises(TypeError):
+        ConvertHandler(test=Greedy(AsyncTest()))
+
+
+def test_sync_exception_before_coroutines():
+    class Invalid(Convertible):
+        def convert(self, argument):
+            raise ConvertException(self, argument)
+
+    class Counted(AsyncTest):
+        calls = 0
+
+        async def convert(self, argument: str) -> int:
+            Counted.calls += 1
+            return int(argument)
+
+    @convert(ConvertHandler(Counted(), Invalid(), test3=Counted()))
+    async def test(test, test2, test3):
+        return test, test2, test3
+
+    with pytest.raises(ConvertException):
+        asyncio.run(test("1", 2, test3="3"))
+    assert 0 == Counted.calls
@@ -0,0 +1,91 @@
+from typing import List, Optional as OptionalType
+
+import pytest
+
+from convertible import convert, Convertible, ConvertException, Registry, register
+from convertible.Registry import registry
+from convertible.Convertible.Greedy import Greedy
+from convertible.Convertible.Optional import Optional
+
+
+class Test(Convertible):
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def convert(self, argument: str) -> int:
+        try:
+            return int(argument)
+        except ValueError:
+            raise ConvertException(self, argument)
+
+
+class Number(int):
+    pass
+
+
+def test_resolve():
+    test = Test()
+    registry = Registry({int: test})
+
+    assert test is registry.resolve(int)
+    assert test is registry.resolve(Number)
+    assert registry.resolve(str) is None
+    assert isinstance(registry.resolve(OptionalType[int]), Optional)
+    assert isinstance(registry.resolve(List[int]), Greedy)
+    assert isinstance(registry.resolve(list[int]), Greedy)
+    assert registry.resolve(OptionalType[str]) is None
+
+
+def test_register_clears_cache():
+    registry = Registry()
+
+    assert registry.resolve(int) is None
+    test = registry.register(int, Test())
+    assert test is registry.resolve(int)
+
+
+def test_function():
+    @convert.auto(registry=Registry({int: Test()}))
+    def test(test: int, test2: str, test3: OptionalType[int] = None):
+        return test, test2, test3
+
+    assert (1, "2", 3) == test("1", "2", "3")
+    assert (1, "2", 3) == test(test="1", test2="2", test3="3")
+    assert (1, "2", None) == test("1", "2", "a")
+
+
+def test_class():
+    class Foo:
+        @convert.auto(registry=Registry({int: Test()}))
+        def test(self, args: List[int], test: int) -> List[int]:
+            return [test] + args
+
+    assert [3, 1, 2] == Foo().test("1", "2", test="3")
+
+
+@pytest.fixture
+def global_registry():
+    """Restores the Convertibles of the global registry after the test."""
+    convertibles = dict(registry.convertibles)
+    yield registry
+    registry.convertibles.clear()
+    registry.convertibles.update(convertibles)
+    registry._resolved.clear()
+
+
+def test_global_registry(global_registry):
+    class Value:
+        def __init__(self, value):
+            self.value = value
+
+    class ValueConvertible(Convertible):
+        def convert(self, argument: str) -> Value:
+            return Value(argument)
+
+    register(Value, ValueConvertible())
+
+    @convert.auto()
+    def test(test: Value) -> str:
+        return test.value
+
+    assert "1" == test("1")
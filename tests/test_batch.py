@@ -0,0 +1,80 @@
+import pytest
+
+from convertible import convert, Convertible, ConvertException, ExceptionHandler
+from convertible.Convertible.Greedy import Greedy
+from convertible.Convertible.Optional import Optional
+from convertible.Convert.ConvertHandler.ConvertHandler import ConvertHandler
+
+
+class Test(Convertible):
+    batches = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def convert(self, argument: str) -> int:
+        try:
+            return int(argument)
+        except ValueError:
+            raise ConvertException(self, argument)
+
+    def convert_many(self, arguments):
+        self.batches += 1
+        return super().convert_many(arguments)
+
+
+def test_convert_batch():
+    test = Test()
+    handler = ConvertHandler(test, Optional(test))
+
+    assert [[1, 2], [3, None], [4]] == handler.convert_batch([("1", "2"), ("3", "a"), ("4",)])
+    assert 2 == test.batches
+
+
+def test_convert_batch_variadic():
+    with pytest.raises(ValueError):
+        ConvertHandler(Greedy(Test())).convert_batch([("1",)])
+
+
+def test_function_map():
+    @convert(ConvertHandler(Test()))
+    def test(test: int) -> int:
+        return test * 2
+
+    assert [2, 4, 6] == test.map(["1", "2", "3"])
+    assert [2, 4, 6] == list(test.map(["1", "2", "3"], chunksize=2))
+
+
+def test_function_starmap():
+    @convert(ConvertHandler(Test(), Test()))
+    def test(test: int, test2: int = 0) -> int:
+        return test + test2
+
+    assert [3, 7, 5] == test.starmap([("1", "2"), ("3", "4"), ("5",)])
+
+
+def test_function_starmap_variadic():
+    @convert(ConvertHandler(Greedy(Test())))
+    def test(args):
+        return sum(args)
+
+    assert [3, 7] == test.starmap([("1", "2"), ("3", "4")])
+
+
+def test_class_map():
+    class Foo:
+        @convert(ConvertHandler(Test()))
+        def test(self, test: int) -> int:
+            return test * 2
+
+    assert [2, 4] == Foo().test.map(["1", "2"])
+
+
+def test_exception_handler():
+    @convert(ConvertHandler(Test()), ExceptionHandler({ConvertException: lambda convert, argument: None}))
+    def test(test):
+        return test
+
+    assert [1, None, 3] == test.map(["1", "a", "3"])
+    with pytest.raises(ConvertException):
+        convert(ConvertHandler(Test()))(lambda test: test).map(["a"])
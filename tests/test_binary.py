@@ -0,0 +1,48 @@
+import pytest
+
+from convertible import convert, ConvertException, ConvertHandler, FAILED
+from convertible.Convertible.Greedy import Greedy
+from convertible.Convertible.binary import Struct, Utf8, IntFromBytes, Slice
+
+
+def test_struct():
+    assert (1, 2) == Struct("<HI").convert(b"\x01\x00\x02\x00\x00\x00")
+    assert (2,) == Struct("<I", offset=2).convert(b"\x01\x00\x02\x00\x00\x00")
+    assert FAILED is Struct("<I").try_convert(b"\x01")
+    assert FAILED is Struct("<I").try_convert("abcd")
+
+
+def test_struct_repeat():
+    assert [(1,), (2,)] == Struct("<H", repeat=True).convert(bytearray(b"\x01\x00\x02\x00"))
+    with pytest.raises(ConvertException):
+        Struct("<H", repeat=True).convert(b"\x01\x00\x02")
+
+
+def test_utf8():
+    assert "é" == Utf8().convert(memoryview("é".encode()))
+    assert FAILED is Utf8().try_convert(b"\xff")
+    assert "�" == Utf8("replace").convert(b"\xff")
+
+
+def test_int_from_bytes():
+    assert 258 == IntFromBytes().convert(b"\x01\x02")
+    assert -1 == IntFromBytes("little", signed=True).convert(b"\xff\xff")
+
+
+def test_slice():
+    buffer = bytearray(b"\x00\x01hello")
+    view = Slice(2).convert(buffer)
+
+    assert isinstance(view, memoryview)
+    buffer[2:3] = b"j"
+    assert b"jello" == view.tobytes()
+    assert 1 == Slice(0, 2, IntFromBytes()).convert(buffer)
+    assert FAILED is Slice(0, 10).try_convert(buffer)
+
+
+def test_greedy_records():
+    @convert(ConvertHandler(Greedy(Struct("<HH"))))
+    def function(records):
+        return records
+
+    assert [(1, 2), (3, 4)] == function(b"\x01\x00\x02\x00", b"\x03\x00\x04\x00")
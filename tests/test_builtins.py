@@ -0,0 +1,116 @@
+import pickle
+from datetime import datetime
+from decimal import Decimal as PyDecimal
+from pathlib import Path as PyPath
+from uuid import UUID as PyUUID
+
+import pytest
+
+from convertible import convert, ConvertException, FAILED
+from convertible.Registry import Registry
+from convertible.Convertible.builtins import Int, Float, Str, Bool, Decimal, Datetime, UUID, Path, register_builtins
+
+
+def test_int():
+    assert 1 == Int().convert("1")
+    assert 1 == Int().convert(1)
+    assert FAILED is Int().try_convert("a")
+    assert FAILED is Int().try_convert(None)
+    assert [1, 2] == Int().convert_many(["1", 2])
+    with pytest.raises(ConvertException) as info:
+        Int().convert_many(["1", "a"])
+    assert "a" == info.value.argument
+
+
+def test_float():
+    assert 1.5 == Float().convert("1.5")
+    assert [1.5, 2.0] == Float().convert_many(["1.5", 2])
+    with pytest.raises(ConvertException):
+        Float().convert("a")
+
+
+def test_str():
+    assert "a" == Str().convert(b"a")
+    assert "1" == Str().convert(1)
+    assert FAILED is Str().try_convert(b"\xff")
+
+
+def test_bool():
+    assert Bool().convert(" Yes ") is True
+    assert Bool().convert(0) is False
+    assert Bool().convert(False) is False
+    assert FAILED is Bool().try_convert("maybe")
+    assert FAILED is Bool().try_convert([])
+
+
+def test_decimal():
+    assert PyDecimal("1.10") == Decimal().convert("1.10")
+    value = PyDecimal("1")
+    assert value is Decimal().convert(value)
+    assert PyDecimal("0.33") == Decimal(precision=2).convert(PyDecimal(1) / 3)
+    assert FAILED is Decimal().try_convert("a")
+    assert FAILED is Decimal(precision=2).try_convert("a")
+
+
+def test_datetime():
+    assert datetime(2020, 1, 2, 3, 4, 5) == Datetime().convert("2020-01-02T03:04:05")
+    assert datetime(2020, 1, 2, 3, 4, 5, 600000) == Datetime("%Y/%m/%d %H:%M:%S.%f").convert("2020/01/02 03:04:05.6")
+    assert datetime(2020, 1, 2) == Datetime("%d %b %Y").convert("02 Jan 2020")
+    assert FAILED is Datetime("%Y-%m-%d").try_convert("2020-13-01")
+    assert FAILED is Datetime("%Y-%m-%d").try_convert("2020-1-01x")
+    assert datetime(2020, 1, 1) == pickle.loads(pickle.dumps(Datetime("%Y-%m-%d"))).convert("2020-01-01")
+
+
+def test_datetime_matches_strptime():
+    format = "%d.%m.%Y %H%%"
+    assert datetime.strptime("1.2.2003 4%", format) == Datetime(format).convert("1.2.2003 4%")
+
+
+@pytest.mark.parametrize(
+    "format, argument",
+    [
+        ("%Y-%m-%d %H", "2020-01-02  03"),
+        ("%Y-%m-%d %H", "2020-01-02\t03"),
+        ("%Y-%m-%d  %H", "2020-01-02 03"),
+        ("%Y-%m-%dT%H", "2020-01-02t03"),
+        ("%Y-%m-%d", "2020-01-0\u0662"),
+        ("%Y-%m-%d", "2020-01-1\u0662"),
+        ("%Y-%m-%d", "2020-01- 2"),
+        ("%Y-%m-%d", "2020-01-02 "),
+        ("%Y-%m-%d ", "2020-01-02"),
+        ("%Y-%m-%d", "2020-02-30"),
+        ("%m%d", "111"),
+        ("%H%M", "123"),
+        ("%H:%M:%S", "1:2:60"),
+        ("%S.%f", "1.1234567"),
+    ],
+)
+def test_datetime_pattern_matches_strptime(format, argument):
+    try:
+        expected = datetime.strptime(argument, format)
+    except ValueError:
+        expected = FAILED
+    assert expected == Datetime(format).try_convert(argument)
+
+
+def test_uuid():
+    value = PyUUID("12345678123456781234567812345678")
+    assert value == UUID().convert(str(value))
+    assert value == UUID().convert(value.bytes)
+    assert FAILED is UUID().try_convert("a")
+
+
+def test_path():
+    assert PyPath("a") == Path().convert("a")
+    assert FAILED is Path().try_convert(1)
+
+
+def test_register_builtins():
+    registry = Registry()
+    register_builtins(registry)
+
+    @convert.auto(registry=registry)
+    def function(a: int, b: bool):
+        return a, b
+
+    assert (1, True) == function("1", "yes")
@@ -0,0 +1,144 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from convertible import convert, Convertible, ConvertException
+from convertible.Convertible.builtins import Str
+from convertible.Convertible.Cached import Cached
+from convertible.Convert.ConvertHandler.ConvertHandler import ConvertHandler
+
+
+class Test(Convertible):
+    calls = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def convert(self, argument: str) -> int:
+        self.calls += 1
+        try:
+            return int("".join(argument))
+        except ValueError:
+            raise ConvertException(self, argument)
+
+
+def test_hits():
+    test = Test()
+    cached = Cached(test)
+
+    assert 1 == cached.convert("1")
+    assert 1 == cached.convert("1")
+    assert 2 == cached.convert("2")
+    assert 2 == test.calls
+    info = cached.cache_info()
+    assert (1, 2, 0, 2) == (info.hits, info.misses, info.evictions, info.currsize)
+
+
+def test_negative():
+    test = Test()
+    cached = Cached(test)
+
+    for _ in range(2):
+        with pytest.raises(ConvertException):
+            cached.convert("a")
+    assert 1 == test.calls
+
+
+def test_maxsize():
+    test = Test()
+    cached = Cached(test, maxsize=2)
+
+    cached.convert("1")
+    cached.convert("2")
+    cached.convert("1")
+    cached.convert("3")
+    cached.convert("1")
+    assert 3 == test.calls
+    assert 1 == cached.cache_info().evictions
+    cached.convert("2")
+    assert 4 == test.calls
+
+
+def test_ttl():
+    test = Test()
+    cached = Cached(test, ttl=0.01)
+
+    cached.convert("1")
+    time.sleep(0.02)
+    cached.convert("1")
+    assert 2 == test.calls
+    assert 1 == cached.cache_info().evictions
+
+
+def test_key():
+    test = Test()
+    cached = Cached(test, key=tuple)
+
+    assert 12 == cached.convert(["1", "2"])
+    assert 12 == cached.convert(["1", "2"])
+    assert 1 == test.calls
+
+
+def test_negative_new_exception():
+    cached = Cached(Test())
+
+    exceptions = [pytest.raises(ConvertException, cached.convert, "a").value for _ in range(3)]
+    assert exceptions[1] is not exceptions[2]
+    assert exceptions[1].args == exceptions[2].args
+
+
+class CustomException(ConvertException):
+    def __init__(self, convertible, argument):
+        super().__init__(convertible, argument, "bad input")
+        self.extra = "extra"
+
+
+class Custom(Convertible):
+    def convert(self, argument):
+        raise CustomException(self, argument)
+
+
+def test_negative_custom_exception():
+    custom = Custom()
+    cached = Cached(custom)
+
+    exceptions = [pytest.raises(CustomException, cached.convert, "a").value for _ in range(3)]
+    assert exceptions[1] is not exceptions[2]
+    assert all((custom, "a", "bad input") == exception.args for exception in exceptions)
+    assert all("extra" == exception.extra for exception in exceptions)
+    assert 2 == cached.cache_info().hits
+
+
+def test_typed_keys():
+    cached = Cached(Str())
+
+    assert "1" == cached.convert(1)
+    assert "1.0" == cached.convert(1.0)
+    assert "True" == cached.convert(True)
+    assert 3 == cached.cache_info().misses
+
+
+def test_unhashable():
+    test = Test()
+    cached = Cached(test)
+
+    assert 12 == cached.convert(["1", "2"])
+    assert 12 == cached.convert(["1", "2"])
+    assert 2 == test.calls
+
+
+def test_threads():
+    test = Test()
+    cached = Cached(test, maxsize=10)
+
+    @convert(ConvertHandler(cached))
+    def test(test: int) -> int:
+        return test
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(test, [str(i % 20) for i in range(2000)]))
+    assert [i % 20 for i in range(2000)] == results
+    info = cached.cache_info()
+    assert 2000 == info.hits + info.misses
+    assert info.currsize <= 10
@@ -0,0 +1,86 @@
+from convertible import convert, Convertible, ConvertException, ExceptionHandler, NextArgumentException
+from convertible.Convert.RejectArgumentException import RejectArgumentException
+from convertible.Convertible.Greedy import Greedy
+from convertible.Convertible.Optional import Optional
+from convertible.Convert.ConvertHandler.ConvertHandler import ConvertHandler
+
+
+class Test(Convertible):
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def convert(self, argument: str) -> int:
+        try:
+            return int(argument)
+        except ValueError:
+            raise ConvertException(self, argument)
+
+
+class Pair(Convertible):
+    """A Convertible that only implements the exception protocol for multiple arguments."""
+
+    multiple_arguments = True
+
+    def __init__(self, first=None):
+        self.first = first
+
+    def convert(self, argument):
+        if self.first is None:
+            raise NextArgumentException(Pair(argument))
+        if isinstance(argument, str):
+            raise RejectArgumentException(self, (self.first,))
+        return self.first, argument
+
+
+def test_plan():
+    test = Test()
+    handler = ConvertHandler(test, test2=test)
+
+    assert handler.plan.positional == (test,)
+    assert handler.plan.keywords == {"test2": test}
+    assert not handler.plan.variadic
+
+
+def test_plan_variadic():
+    assert ConvertHandler(Test(), Greedy(Test())).plan.variadic
+
+
+def test_extra_arguments():
+    @convert(ConvertHandler(Test()))
+    def test(*args):
+        return args
+
+    assert (1, "2", "3") == test("1", "2", "3")
+
+
+def test_greedy_then_argument():
+    @convert(ConvertHandler(Greedy(Test()), Optional(Test()), Test()))
+    def test(args, test, test2):
+        return args, test, test2
+
+    assert ([1, 2], None, 3) == test("1", "2", "a", "3")
+
+
+def test_greedy_rejects_first_argument():
+    @convert(ConvertHandler(Greedy(Test())))
+    def test(args, *extra):
+        return args, extra
+
+    assert ([], ("a",)) == test("a")
+
+
+def test_keyword_exception_handler():
+    @convert(ConvertHandler(test=Test()), ExceptionHandler({ConvertException: lambda convert, argument: None}))
+    def test(test=5):
+        return test
+
+    assert 1 == test(test="1")
+    assert test(test="a") is None
+
+
+def test_exception_protocol():
+    @convert(ConvertHandler(Pair(), Pair()))
+    def test(*args):
+        return args
+
+    assert ((1, 2), (3,), "a") == test(1, 2, 3, "a")
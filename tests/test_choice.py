@@ -0,0 +1,108 @@
+import pickle
+from enum import Enum
+
+import pytest
+
+from convertible import ConvertException, FAILED
+from convertible.Convertible.Choice import Choice, AmbiguousChoiceException
+
+
+class Color(Enum):
+    RED = 1
+    GREEN = 2
+    GREY = 3
+
+
+def test_choice():
+    choice = Choice(["alpha", "beta"])
+
+    assert "alpha" == choice.convert("ALPHA")
+    assert "beta" == choice.convert("b")
+    assert FAILED is choice.try_convert("c")
+    assert FAILED is choice.try_convert(1)
+
+
+def test_choice_enum():
+    choice = Choice(Color)
+
+    assert Color.RED is choice.convert("red")
+    assert Color.GREEN is choice.convert("gree")
+    assert Color.GREY is choice.convert(Color.GREY)
+
+
+def test_choice_ambiguous():
+    with pytest.raises(AmbiguousChoiceException) as info:
+        Choice(Color).convert("gr")
+
+    assert ("GREEN", "GREY") == info.value.candidates
+    assert isinstance(info.value, ConvertException)
+    assert FAILED is Choice(Color).try_convert("gr")
+
+
+def test_choice_exact_before_prefix():
+    choice = Choice(["in", "insert"])
+
+    assert "in" == choice.convert("in")
+    assert "insert" == choice.convert("ins")
+
+
+def test_choice_case_sensitive():
+    choice = Choice(["Alpha"], case_sensitive=True, allow_prefix=False)
+
+    assert "Alpha" == choice.convert("Alpha")
+    assert FAILED is choice.try_convert("alpha")
+    assert FAILED is choice.try_convert("Al")
+
+
+def test_choice_case_collision():
+    with pytest.raises(ValueError):
+        Choice(["a", "A"], allow_prefix=False)
+    assert "A" == Choice(["a", "A"], case_sensitive=True).convert("A")
+    assert Color.RED is Choice(Color, aliases={"red": "RED"}).convert("red")
+
+
+def test_choice_aliases():
+    choice = Choice(Color, aliases={"crimson": "RED", "gray": Color.GREY})
+
+    assert Color.RED is choice.convert("Crimson")
+    assert Color.GREY is choice.convert("gra")
+    assert Color.GREY is choice.convert("grey")
+    assert ("GREEN", "GREY") == pytest.raises(AmbiguousChoiceException, choice.convert, "gr").value.candidates
+
+
+def test_choice_mapping():
+    assert 1 == Choice({"one": 1}).convert("o")
+
+
+def test_choice_name_before_value():
+    choice = Choice({"a": "b", "b": "c"}, allow_prefix=False)
+
+    assert "c" == choice.convert("b")
+    assert "b" == choice.convert("a")
+    assert FAILED is choice.try_convert("c")
+
+
+def test_choice_equal_value():
+    choice = Choice([1000, 2000])
+
+    assert 1000 == choice.try_convert(int("1000"))
+    assert 1 == Choice([1]).try_convert(1.0)
+    assert FAILED is choice.try_convert(3000)
+
+
+def test_choice_unhashable_value():
+    choice = Choice({"a": [1], "b": [2]})
+
+    assert [2] == choice.convert([2])
+    assert FAILED is choice.try_convert([3])
+    assert FAILED is choice.try_convert((2,))
+
+
+def test_choice_pickle():
+    assert Color.RED is pickle.loads(pickle.dumps(Choice(Color))).convert("r")
+
+
+def test_choice_exception_pickle():
+    exception = pickle.loads(pickle.dumps(AmbiguousChoiceException(None, "gr", ("GREEN", "GREY"))))
+
+    assert ("GREEN", "GREY") == exception.candidates
@@ -0,0 +1,89 @@
+import pytest
+
+from convertible import Convertible, ConvertException, FAILED
+from convertible.Convertible.Chain import Chain
+from convertible.Convertible.FirstOf import FirstOf
+from convertible.Convertible.MapOf import MapOf
+
+
+class Int(Convertible):
+    def convert(self, argument):
+        try:
+            return int(argument)
+        except (TypeError, ValueError):
+            raise ConvertException(self, argument)
+
+
+class Float(Convertible):
+    def convert(self, argument):
+        try:
+            return float(argument)
+        except (TypeError, ValueError):
+            raise ConvertException(self, argument)
+
+
+class Strip(Convertible):
+    def convert(self, argument):
+        return argument.strip()
+
+
+class Positive(Convertible):
+    def convert(self, argument):
+        if argument <= 0:
+            raise ConvertException(self, argument)
+        return argument
+
+
+def test_chain():
+    chain = Chain(Strip(), Int(), Positive())
+
+    assert 1 == chain.convert(" 1 ")
+    assert FAILED is chain.try_convert(" -1 ")
+    with pytest.raises(ConvertException) as info:
+        chain.convert("a")
+    assert isinstance(info.value.convert, Int)
+
+
+def test_chain_flatten():
+    strip, integer, positive = Strip(), Int(), Positive()
+
+    assert (strip, integer, positive) == Chain(Chain(strip, integer), positive).convertibles
+
+
+def test_chain_many():
+    assert [1, 2] == Chain(Strip(), Int()).convert_many([" 1", "2 "])
+
+
+def test_first_of():
+    first_of = FirstOf(Int(), Float())
+
+    assert 1 == first_of.convert("1")
+    assert 1.5 == first_of.convert("1.5")
+    assert FAILED is first_of.try_convert("a")
+    with pytest.raises(ConvertException):
+        first_of.convert("a")
+
+
+def test_first_of_flatten():
+    integer, floating = Int(), Float()
+
+    assert (integer, floating) == FirstOf(FirstOf(integer), floating).convertibles
+
+
+def test_first_of_adaptive():
+    integer, positive = Int(), Positive()
+    first_of = FirstOf(integer, Chain(Float(), positive), adaptive=True, interval=4)
+
+    for _ in range(4):
+        assert 1.5 == first_of.convert("1.5")
+    assert first_of.order[0].convertibles[-1] is positive
+    assert 1 == first_of.convert("1")
+
+
+def test_map_of():
+    map_of = MapOf(None, Int())
+
+    assert {"a": 1} == map_of.convert({"a": "1"})
+    assert FAILED is map_of.try_convert({"a": "b"})
+    assert FAILED is map_of.try_convert(["a"])
+    assert {1: 2.5} == MapOf(Int(), Float()).convert({"1": "2.5"})
@@ -0,0 +1,118 @@
+import pickle
+
+import pytest
+
+from convertible import ConvertException, FAILED
+from convertible.Convertible.builtins import Int, Str
+from convertible.Convertible.containers import ListOf, TupleOf, SetOf, DictOf
+from convertible.Convertible.Schema import Schema
+
+
+def test_list_of():
+    assert [1, 2] == ListOf(Int()).convert(["1", 2])
+    assert [1, 2] == ListOf(Int()).convert(("1", "2"))
+    assert [1, 2] == ListOf(Int()).convert(iter(["1", "2"]))
+    assert FAILED is ListOf(Int()).try_convert(["a"])
+    assert FAILED is ListOf(Int()).try_convert("12")
+    assert FAILED is ListOf(Int()).try_convert(1)
+    with pytest.raises(ConvertException):
+        ListOf(Int()).convert(["a"])
+
+
+def test_unchanged():
+    argument = [1, 2]
+
+    assert argument is ListOf(Int()).convert(argument)
+    assert argument is ListOf(Int()).try_convert(argument)
+    assert argument is ListOf().convert(argument)
+    nested = [[1], [2]]
+    assert nested is ListOf(ListOf(Int())).convert(nested)
+    assert nested is ListOf(Int(), nested=True).convert(nested)
+
+
+def test_tuple_of():
+    assert (1, 2) == TupleOf(Int()).convert(["1", "2"])
+    argument = (1, 2)
+    assert argument is TupleOf(Int()).convert(argument)
+
+
+def test_set_of():
+    assert {1, 2} == SetOf(Int()).convert(["1", "2", "2"])
+    argument = {1, 2}
+    assert argument is SetOf(Int()).convert(argument)
+    assert {1, frozenset({2})} == SetOf(Int(), nested=True).convert({"1", frozenset({"2"})})
+
+
+def test_dict_of():
+    assert {1: "a"} == DictOf(Int(), Str()).convert({"1": b"a"})
+    argument = {1: "a"}
+    assert argument is DictOf(Int(), Str()).convert(argument)
+    assert {"a": 1, "b": {"c": 2}} == DictOf(value=Int(), nested=True).convert({"a": "1", "b": {"c": "2"}})
+    assert FAILED is DictOf(Int()).try_convert({"a": 1})
+    assert FAILED is DictOf(Int()).try_convert([1])
+
+
+def test_nested_containers():
+    convertible = ListOf(DictOf(Str(), ListOf(Int())))
+
+    assert [{"a": [1, 2]}] == convertible.convert([{"a": ["1", "2"]}])
+    assert FAILED is convertible.try_convert([{"a": ["b"]}])
+    assert FAILED is convertible.try_convert([{"a": "1"}])
+
+
+def test_deep():
+    depth = 100_000
+    argument = ["0"]
+    for _ in range(depth):
+        argument = [argument]
+
+    result = ListOf(Int(), nested=True).convert(argument)
+    for _ in range(depth):
+        result = result[0]
+    assert [0] == result
+
+
+def test_cycle():
+    argument = ["1"]
+    argument.append(argument)
+    mapping = {"a": "1"}
+    mapping["b"] = mapping
+
+    assert FAILED is ListOf(Int(), nested=True).try_convert(argument)
+    with pytest.raises(ConvertException):
+        ListOf(Int(), nested=True).convert(argument)
+    assert FAILED is DictOf(Str(), Int(), nested=True).try_convert(mapping)
+
+
+def test_repeated_item():
+    item = ["1"]
+
+    assert [[1], [1]] == ListOf(ListOf(Int())).convert([item, item])
+    assert [[1], [[1]]] == ListOf(Int(), nested=True).convert([item, [item]])
+
+
+def test_convert_many():
+    class Counting(Int):
+        batches = 0
+
+        def convert_many(self, arguments):
+            Counting.batches += 1
+            return super().convert_many(arguments)
+
+    argument = [1]
+    results = ListOf(Counting()).convert_many([["1", "2"], argument, ["3"]])
+
+    assert [[1, 2], [1], [3]] == results
+    assert argument is results[1]
+    assert 1 == Counting.batches
+    assert [{1: 2}] == DictOf(Int(), Int()).convert_many([{"1": "2"}])
+
+
+def test_schema_list_of():
+    schema = Schema({"id": Int(), "tags": ListOf(Str())})
+
+    assert {"id": 1, "tags": ["a"]} == schema.convert({"id": "1", "tags": [b"a"]})
+
+
+def test_pickle():
+    assert [1] == pickle.loads(pickle.dumps(ListOf(Int(), nested=True))).convert(["1"])
@@ -1,3 +1,5 @@
+from copy import copy
+
 from convertible import convert, Convertible
 from convertible.Convert.ConvertHandler.ConvertHandler import ConvertHandler
 
@@ -103,3 +105,52 @@ def test_function_both():
     assert res == test(1, 2, test3=3)
     assert res == test(1, test2=2, test3=3)
     assert res == test(test=1, test2=2, test3=3)
+
+
+def test_class_override_super():
+    class A:
+        @convert(ConvertHandler(Test()))
+        def test(self, test: str) -> str:
+            return "A" + test
+
+    class B(A):
+        @convert(ConvertHandler(Test()))
+        def test(self, test: str) -> str:
+            return "B" + super().test(test)
+
+    class C(A):
+        def test(self, test: str) -> str:
+            return "C" + super().test(test)
+
+    b, c = B(), C()
+    assert "BA1" == b.test(1)
+    assert "BA1" == b.test(1)
+    assert "CA1" == c.test(1)
+    assert "CA1" == c.test(1)
+
+
+def test_class_copy():
+    class Foo:
+        def __init__(self, prefix: str):
+            self.prefix = prefix
+
+        @convert(ConvertHandler(Test()))
+        def test(self, test: str) -> str:
+            return self.prefix + test
+
+    foo = Foo("a")
+    assert "a1" == foo.test(1)
+    bar = copy(foo)
+    bar.prefix = "b"
+    assert "b1" == bar.test(1)
+    assert "a1" == foo.test(1)
+
+
+def test_class_shares_plan():
+    class Foo:
+        @convert(ConvertHandler(Test()))
+        def test(self, test: str) -> str:
+            return test
+
+    assert Foo().test.plan is Foo().test.plan
+    assert (None, Foo.test.plan.positional[0]) == Foo().test.plan.positional
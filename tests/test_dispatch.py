@@ -0,0 +1,74 @@
+import gc
+import pickle
+
+import pytest
+
+from convertible import Convertible, ConvertException, FAILED
+from convertible.Convertible.Dispatch import Dispatch
+from convertible.Convertible.Identity import Identity
+
+
+class Parse(Convertible):
+    def convert(self, argument):
+        try:
+            return int(argument)
+        except ValueError:
+            raise ConvertException(self, argument)
+
+
+class Decode(Convertible):
+    def convert(self, argument):
+        return int(argument.decode())
+
+
+def test_dispatch():
+    dispatch = Dispatch({str: Parse(), bytes: Decode(), int: Identity()})
+
+    assert 1 == dispatch.convert("1")
+    assert 2 == dispatch.convert(b"2")
+    assert 3 == dispatch.convert(3)
+    assert True is dispatch.convert(True)
+    assert FAILED is dispatch.try_convert(1.5)
+    assert FAILED is dispatch.try_convert("a")
+    with pytest.raises(ConvertException):
+        dispatch.convert(1.5)
+
+
+def test_dispatch_cache():
+    identity = Identity()
+    dispatch = Dispatch({int: identity})
+    dispatch.convert(True)
+
+    assert identity is dispatch._resolved[bool]
+    dispatch.register(bool, Parse())
+    assert 1 == dispatch.convert(True)
+
+
+def test_dispatch_cache_releases_types():
+    dispatch = Dispatch({int: Identity()})
+
+    class Number(int):
+        pass
+
+    assert 1 == dispatch.convert(Number(1))
+    assert 1 == len(dispatch._resolved)
+    del Number
+    gc.collect()
+    assert 0 == len(dispatch._resolved)
+
+
+def test_dispatch_default():
+    assert 1.5 == Dispatch({str: Parse()}, Identity()).convert(1.5)
+
+
+def test_dispatch_many():
+    dispatch = Dispatch({str: Parse(), int: Identity()})
+
+    assert [1, 2] == dispatch.convert_many(["1", "2"])
+    assert [1, 2] == dispatch.convert_many(["1", 2])
+
+
+def test_dispatch_pickle():
+    dispatch = pickle.loads(pickle.dumps(Dispatch({str: Parse()})))
+
+    assert 1 == dispatch.convert("1")
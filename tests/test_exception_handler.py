@@ -0,0 +1,79 @@
+import pytest
+
+from convertible import convert, Convertible, ConvertException, ExceptionHandler
+from convertible.Convert.ConvertHandler.ConvertHandler import ConvertHandler
+
+
+class ParseException(ConvertException):
+    pass
+
+
+class Test(Convertible):
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def convert(self, argument: str) -> int:
+        try:
+            return int(argument)
+        except ValueError:
+            raise ParseException(self, argument)
+
+
+def test_subclass():
+    handled = []
+    handler = ExceptionHandler({ConvertException: lambda convert, argument: handled.append(argument)})
+
+    @convert(ConvertHandler(Test()), handler)
+    def test(test):
+        return test
+
+    assert test("a") is None
+    assert ["a"] == handled
+    assert handler.resolve(ParseException) is handler.resolve(ParseException)
+
+
+def test_most_specific():
+    handler = ExceptionHandler(
+        {ConvertException: lambda convert, argument: 1, ParseException: lambda convert, argument: 2}, substitute=True
+    )
+
+    assert 2 == handler(ParseException(Test(), "a"))
+    assert 1 == handler(ConvertException(Test(), "a"))
+
+
+def test_substitute():
+    @convert(ConvertHandler(Test(), test2=Test()), ExceptionHandler({ParseException: lambda c, a: 0}, substitute=True))
+    def test(test, test2=None):
+        return test, test2
+
+    assert (0, 0) == test("a", test2="b")
+
+
+def test_chain():
+    handler = ExceptionHandler(
+        {ParseException: (lambda convert, argument: None, lambda convert, argument: argument.upper())}, substitute=True
+    )
+
+    assert "A" == handler(ParseException(Test(), "a"))
+
+
+def test_default():
+    handler = ExceptionHandler({}, default=lambda convert, argument: argument, substitute=True)
+
+    assert "a" == handler(ParseException(Test(), "a"))
+
+
+def test_unhandled():
+    handler = ExceptionHandler({ParseException: lambda convert, argument: None})
+
+    with pytest.raises(ConvertException):
+        handler(ConvertException(Test(), "a"))
+
+
+def test_register():
+    handler = ExceptionHandler({}, substitute=True)
+
+    with pytest.raises(ParseException):
+        handler(ParseException(Test(), "a"))
+    handler.register(ConvertException, lambda convert, argument: 1)
+    assert 1 == handler(ParseException(Test(), "a"))
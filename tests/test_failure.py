@@ -0,0 +1,68 @@
+import pickle
+
+from convertible import Convertible, ConvertException, NextArgumentException, FAILED
+from convertible.Convertible.Optional import Optional
+from convertible.Convertible.Greedy import Greedy
+from convertible.Convert.RejectArgumentException import RejectArgumentException
+
+
+class Test(Convertible):
+    representations = 0
+
+    def __repr__(self) -> str:
+        self.representations += 1
+        return f"{self.__class__.__name__}()"
+
+    def convert(self, argument: str) -> int:
+        try:
+            return int(argument)
+        except ValueError:
+            raise ConvertException(self, argument)
+
+
+class Digit(Convertible):
+    """A Convertible that detects invalid arguments without raising an exception."""
+
+    def try_convert(self, argument: str):
+        return int(argument) if argument.isdigit() else FAILED
+
+    def convert(self, argument: str) -> int:
+        result = self.try_convert(argument)
+        if result is FAILED:
+            raise AssertionError("Optional should not convert through convert")
+        return result
+
+
+def test_try_convert():
+    assert 1 == Test().try_convert("1")
+    assert FAILED is Test().try_convert("a")
+
+
+def test_optional_without_exception():
+    assert 1 == Optional(Digit()).convert("1")
+    assert Optional(Digit()).convert("a") is None
+
+
+def test_greedy_without_exception():
+    assert ([1, 2], 2) == Greedy(Digit()).convert_arguments(("1", "2", "a"), 0)
+
+
+def test_lazy_message():
+    test = Test()
+
+    assert Optional(test).convert("a") is None
+    assert 0 == test.representations
+    assert "Test() was unable to convert a" == str(ConvertException(test, "a"))
+    assert "message" == str(ConvertException(test, "a", "message"))
+
+
+def test_lazy_message_protocol():
+    assert "Test() requested the next argument" == str(NextArgumentException(Test()))
+    assert "The Test() returned [] and rejected the last argument" == str(RejectArgumentException(Test(), []))
+
+
+def test_pickle():
+    exception = pickle.loads(pickle.dumps(ConvertException(None, "a")))
+
+    assert "a" == exception.argument
+    assert "None was unable to convert a" == str(exception)
@@ -1,6 +1,8 @@
 from typing import List
 
-from convertible import convert, Convertible
+import pytest
+
+from convertible import convert, Convertible, ConvertException, NextArgumentException
 from convertible.Convertible.Greedy import Greedy
 from convertible.Convert.ConvertHandler.ConvertHandler import ConvertHandler
 
@@ -62,3 +64,53 @@ def test_function_both():
         return [test] + args
 
     assert [str(1), str(2), str(3)] == test(2, 3, test=1)
+
+
+def test_convert_arguments():
+    assert (["1", "2"], 2) == Greedy(Test()).convert_arguments((0, 1, 2), 1)
+    assert ([], 0) == Greedy(Test()).convert_arguments((0,), 1)
+
+
+def test_maximum():
+    @convert(ConvertHandler(Greedy(Test(), maximum=2), Greedy(Test())))
+    def test(args: List[str], rest: List[str]) -> List[List[str]]:
+        return [args, rest]
+
+    assert [[str(1), str(2)], [str(3)]] == test(1, 2, 3)
+
+
+def test_minimum():
+    class Number(Convertible):
+        def convert(self, argument: str) -> int:
+            try:
+                return int(argument)
+            except ValueError:
+                raise ConvertException(self, argument)
+
+    @convert(ConvertHandler(Greedy(Number(), minimum=2)))
+    def test(args: List[int], *rest: str) -> List[int]:
+        return args
+
+    assert [1, 2] == test("1", "2", "a")
+    with pytest.raises(ConvertException):
+        test("1", "a")
+
+
+def test_many_arguments():
+    @convert(ConvertHandler(Greedy(Test())))
+    def test(args: List[str]) -> List[str]:
+        return args
+
+    assert [str(i) for i in range(10000)] == test(*range(10000))
+
+
+def test_exception_protocol():
+    greedy = Greedy(Test(), maximum=3)
+    with pytest.raises(NextArgumentException) as exception:
+        greedy.convert(1)
+    child = exception.value.convertible
+    assert child is not greedy
+    with pytest.raises(NextArgumentException) as exception:
+        child.convert(2)
+    assert exception.value.convertible is child
+    assert [str(1), str(2), str(3)] == child.convert(3)
@@ -1,3 +1,8 @@
+from copy import copy
+from inspect import signature
+from weakref import ref
+import gc
+
 from convertible import ignore_self
 
 
@@ -37,3 +42,109 @@ def test_class():
     assert args[2] == 3
     assert kwargs["test"] == 4
     assert kwargs["bar"] == 5
+
+
+def test_function_decorated_once():
+    calls = []
+
+    @ignore_self
+    def counted(func):
+        calls.append(func)
+        return func
+
+    @counted
+    def test(value):
+        return value
+
+    assert 1 == test(1)
+    assert 2 == test(2)
+    assert 1 == len(calls)
+
+
+def test_class_decorated_once():
+    calls = []
+
+    @ignore_self
+    def counted(func):
+        calls.append(func)
+        return func
+
+    class Test:
+        @counted
+        def test(self, value):
+            return value
+
+    test_class = Test()
+    assert test_class.test is test_class.test
+    assert 1 == test_class.test(1)
+    assert 1 == test_class.test(1)
+    assert 2 == len(calls)
+    assert "test" not in vars(test_class)
+    assert 1 == Test().test(1)
+    assert 3 == len(calls)
+
+
+def test_class_instance_collected():
+    @ignore_self
+    def bound(func):
+        return func
+
+    class Test:
+        @bound
+        def test(self, value):
+            return value
+
+    test_class = Test()
+    assert 1 == test_class.test(1)
+    assert "(value)" == str(signature(test_class.test))
+    reference = ref(test_class)
+    del test_class
+    gc.collect()
+    assert reference() is None
+    assert not vars(Test)["test"]._methods
+
+
+def test_class_override_super():
+    class A:
+        @decorator
+        def test(self, value):
+            return "A"
+
+    class B(A):
+        def test(self, value):
+            return "B", super().test(value)
+
+    b = B()
+    assert ("B", {"args": (1,), "kwargs": {}}) == b.test(1)
+    assert ("B", {"args": (1,), "kwargs": {}}) == b.test(1)
+
+
+def test_class_copy():
+    @ignore_self
+    def bound(func):
+        return func
+
+    class Test:
+        def __init__(self, value):
+            self.value = value
+
+        @bound
+        def test(self):
+            return self.value
+
+    test_class = Test(1)
+    assert 1 == test_class.test()
+    other = copy(test_class)
+    other.value = 2
+    assert 2 == other.test()
+
+
+def test_class_slots():
+    class Test:
+        __slots__ = ()
+
+        @decorator
+        def test(self, *args, **kwargs):
+            pass
+
+    assert (1,) == Test().test(1)["args"]
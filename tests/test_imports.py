@@ -8,6 +8,8 @@ def test_main():
         ConvertHandler,
         ExceptionHandler,
         ConvertException,
+        AsyncConvert,
+        AsyncConvertible,
     )
 
     assert callable(convert)
@@ -18,6 +20,8 @@ def test_main():
     assert isinstance(ConvertHandler, type)
     assert isinstance(ExceptionHandler, type)
     assert isinstance(ConvertException, type)
+    assert isinstance(AsyncConvert, type)
+    assert isinstance(AsyncConvertible, type)
 
 
 def test_convert():
@@ -38,3 +42,34 @@ def test_exception_handler():
 
     assert isinstance(ExceptionHandler, type)
     assert isinstance(ConvertException, type)
+
+
+def test_registry():
+    from convertible import Registry, register
+    from convertible.Registry import registry
+
+    assert isinstance(Registry, type)
+    assert callable(register)
+    assert isinstance(registry, Registry)
+
+
+def test_lazy():
+    import subprocess
+    import sys
+
+    statement = "import sys, convertible; print(sorted(name for name in sys.modules if name.startswith('convertible')))"
+    process = subprocess.run([sys.executable, "-c", statement], capture_output=True, text=True, check=True)
+
+    assert "['convertible']" == process.stdout.strip()
+
+
+def test_submodule_names():
+    import convertible
+    import convertible.convert
+    import convertible.Convert.ConvertHandler
+    from convertible.Convertible.Greedy import Greedy
+
+    assert callable(convertible.convert)
+    assert isinstance(convertible.Convert, type)
+    assert isinstance(convertible.Convertible, type)
+    assert convertible.Greedy is Greedy
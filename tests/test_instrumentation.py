@@ -0,0 +1,119 @@
+import pytest
+
+from convertible import convert, Convertible, ConvertException, ExceptionHandler
+from convertible.Convertible.Greedy import Greedy
+from convertible.Convert.ConvertHandler.ConvertHandler import ConvertHandler
+
+
+class Test(Convertible):
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def convert(self, argument: str) -> int:
+        try:
+            return int(argument)
+        except ValueError:
+            raise ConvertException(self, argument)
+
+
+def test_instrument_counts():
+    test, greedy = Test(), Greedy(Test())
+
+    @convert(ConvertHandler(test, greedy), ExceptionHandler({ConvertException: lambda c, a: None}))
+    def function(a, b=None):
+        return a, b
+
+    instrumentation = function.instrument()
+    assert (1, [2, 3]) == function("1", "2", "3")
+    assert (None, [2]) == function("a", "2")
+    assert (1, None) == function("1")
+
+    statistics = instrumentation[test]
+    assert 3 == statistics.calls
+    assert {ConvertException: 1} == statistics.failures
+    assert 0 <= statistics.percentile(50) <= statistics.percentile(100)
+    assert {2: 1, 1: 1} == instrumentation[greedy].consumed
+
+
+def test_instrument_hook():
+    test = Test()
+    calls = []
+
+    @convert(ConvertHandler(test))
+    def function(a):
+        return a
+
+    function.instrument(lambda convertible, argument, result, elapsed: calls.append((convertible, argument, result)))
+    assert 1 == function("1")
+    with pytest.raises(ConvertException):
+        function("a")
+
+    assert (test, "1", 1) == calls[0]
+    assert isinstance(calls[1][2], ConvertException)
+
+
+def test_uninstrument():
+    test = Test()
+
+    @convert(ConvertHandler(test))
+    def function(a):
+        return a
+
+    plan = function.plan
+    instrumentation = function.instrument()
+    function.uninstrument()
+    assert 1 == function("1")
+
+    assert 0 == instrumentation[test].calls
+    assert function.instrumentation is None
+    assert plan.positional == function.plan.positional
+    assert function.specialized is not None
+
+
+def test_instrument_batch():
+    test = Test()
+
+    @convert(ConvertHandler(test))
+    def function(a):
+        return a
+
+    instrumentation = function.instrument(reservoir=2)
+    assert [1, 2, 3] == function.map(["1", "2", "3"])
+
+    assert 3 == instrumentation[test].calls
+    assert 1 == len(instrumentation[test].samples)
+
+
+def test_instrument_method():
+    test = Test()
+
+    class Foo:
+        @convert(ConvertHandler(test))
+        def function(self, a):
+            return a
+
+    before = Foo()
+    assert 1 == before.function("1")
+    instrumentation = Foo.function.instrument()
+    assert 1 == before.function("1")
+    assert 2 == Foo().function("2")
+    assert [3] == Foo().function.map(["3"])
+    assert 3 == instrumentation[test].calls
+
+    Foo.function.uninstrument()
+    assert 1 == Foo().function("1")
+    assert 3 == instrumentation[test].calls
+    assert (None, test) == Foo().function.plan.positional
+
+
+def test_instrument_method_before_lookup():
+    test = Test()
+
+    class Foo:
+        @convert(ConvertHandler(test))
+        def function(self, a):
+            return a
+
+    instrumentation = Foo.function.instrument()
+    assert 1 == Foo().function("1")
+    assert 1 == instrumentation[test].calls
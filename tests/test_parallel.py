@@ -0,0 +1,150 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_all_start_methods, get_context
+
+import pytest
+
+from convertible import convert, Convertible, ConvertException, ExceptionHandler
+from convertible.Convertible.Cached import Cached
+from convertible.Convertible.Greedy import Greedy
+from convertible.Convert.Convert import Convert
+from convertible.Convert.ConvertHandler.ConvertHandler import ConvertHandler
+
+
+class Test(Convertible):
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def convert(self, argument: str) -> int:
+        try:
+            return int(argument)
+        except ValueError:
+            raise ConvertException(self, argument)
+
+
+def replace(convertible, argument):
+    return -1
+
+
+@convert(ConvertHandler(Test(), Test()))
+def add(a, b):
+    return a + b
+
+
+@convert(ConvertHandler(Test(), Greedy(Test())))
+def total(a, b):
+    return a + sum(b)
+
+
+@convert(ConvertHandler(Test()), ExceptionHandler({ConvertException: replace}, substitute=True))
+def identity(a):
+    return a
+
+
+class Foo:
+    def __init__(self, offset: int = 0):
+        self.offset = offset
+
+    @convert(ConvertHandler(Test()))
+    def test(self, a):
+        return a + self.offset
+
+    def undecorated(self, a):
+        return a + self.offset
+
+
+# The workers are forked, so they can use the Convertibles defined in this module.
+requires_fork = pytest.mark.skipif("fork" not in get_all_start_methods(), reason="requires the fork start method")
+
+
+def copy(function: Convert) -> Convert:
+    """Pickles a Convert of the function, which is not the one in the module, so its state is pickled."""
+    return pickle.loads(pickle.dumps(Convert(function.function, function.convert_handler, function.exception_handler)))
+
+
+def test_pickle_convert():
+    function = copy(add)
+
+    assert 3 == function("1", "2")
+    assert function.specialized is not None
+
+
+def test_pickle_decorated():
+    assert pickle.loads(pickle.dumps(add)) is add
+
+
+def test_pickle_variadic():
+    function = copy(total)
+
+    assert 6 == function("1", "2", "3")
+
+
+def test_pickle_exception_handler():
+    function = copy(identity)
+
+    assert -1 == function("a")
+
+
+def test_pickle_cached():
+    cached = Cached(Test())
+    cached.convert("1")
+    copy = pickle.loads(pickle.dumps(cached))
+
+    assert 1 == copy.convert("1")
+    assert 0 == copy.cache_info().hits
+
+
+def test_convert_call():
+    assert ([1, 2], {}) == add.convert_call("1", "2")
+
+
+@requires_fork
+def test_parallel_map():
+    with ProcessPoolExecutor(2, mp_context=get_context("fork")) as executor:
+        assert [3, 5, 7] == add.parallel_map([("1", "2"), ("2", "3"), ("3", "4")], executor, chunksize=2)
+
+
+def test_parallel_map_without_call():
+    with ThreadPoolExecutor(2) as executor:
+        assert [[1, [2, 3]], [4]] == total.parallel_map([("1", "2", "3"), ("4",)], executor, call=False)
+
+
+@pytest.mark.parametrize("chunksize", [0, -1])
+def test_parallel_map_chunksize(chunksize):
+    with ThreadPoolExecutor(2) as executor:
+        with pytest.raises(ValueError):
+            add.parallel_map([("1", "2")], executor, chunksize=chunksize)
+
+
+def test_parallel_map_exceptions():
+    with ThreadPoolExecutor(2) as executor:
+        with pytest.raises(ConvertException):
+            add.parallel_map([("1", "2"), ("a", "2")], executor)
+
+        results = add.parallel_map([("1", "2"), ("a", "2")], executor, return_exceptions=True)
+    assert 3 == results[0]
+    assert isinstance(results[1], ConvertException)
+
+
+def test_pickle_bound_convert():
+    function = pickle.loads(pickle.dumps(Foo(1).test))
+
+    assert 2 == function("1")
+    assert 1 == function.instance.offset
+
+
+def test_pickle_convert_of_method():
+    function = pickle.loads(pickle.dumps(Convert(Foo(1).undecorated, ConvertHandler(Test()))))
+
+    assert 2 == function("1")
+
+
+@requires_fork
+def test_parallel_map_method():
+    with ProcessPoolExecutor(2, mp_context=get_context("fork")) as executor:
+        assert [2, 3] == Foo(1).test.parallel_map([("1",), ("2",)], executor)
+
+
+def test_parallel_map_method_without_call():
+    with ThreadPoolExecutor(2) as executor:
+        assert [[1], [2]] == Foo(1).test.parallel_map([("1",), ("2",)], executor, call=False)
@@ -0,0 +1,71 @@
+import pickle
+import sys
+
+import pytest
+
+from convertible import convert, ConvertException, ConvertHandler, FAILED
+from convertible.Convertible.Schema import Schema
+from convertible.Convertible.builtins import Int, Str, Bool
+
+
+def test_schema():
+    schema = Schema({"id": Int(), "name": Str(), "raw": None})
+
+    assert {"id": 1, "name": "a", "raw": [1]} == schema.convert({"id": "1", "name": b"a", "raw": [1], "other": 1})
+    assert FAILED is schema.try_convert({"id": "a", "name": "a", "raw": 1})
+    assert FAILED is schema.try_convert({"id": "1", "name": "a"})
+    assert FAILED is schema.try_convert(["id"])
+    with pytest.raises(ConvertException):
+        schema.convert({})
+
+
+def test_schema_extra():
+    assert {"id": 1, "other": "2"} == Schema({"id": Int()}, extra="keep").convert({"id": "1", "other": "2"})
+    assert FAILED is Schema({"id": Int()}, extra="error").try_convert({"id": "1", "other": "2"})
+    assert {"id": 1} == Schema({"id": Int()}, extra="error").convert({"id": "1"})
+    with pytest.raises(ValueError):
+        Schema({"id": Int()}, extra="drop")
+
+
+def test_schema_defaults():
+    schema = Schema({"id": Int(), "active": Bool()}, defaults={"active": "unchanged"})
+
+    assert {"id": 1, "active": "unchanged"} == schema.convert({"id": "1"})
+    assert {"id": 1, "active": True} == schema.convert({"id": "1", "active": "yes"})
+
+
+def test_schema_nested():
+    schema = Schema({"id": Int(), "owner": {"id": Int()}}, extra="error")
+
+    assert {"id": 1, "owner": {"id": 2}} == schema.convert({"id": "1", "owner": {"id": "2"}})
+    assert FAILED is schema.try_convert({"id": "1", "owner": {"id": "2", "name": "a"}})
+
+
+def test_schema_record():
+    schema = Schema({"id": Int(), "owner": {"id": Int()}}, record="User")
+    user = schema.convert({"id": "1", "owner": {"id": "2"}})
+
+    assert 1 == user.id
+    assert 2 == user.owner.id
+    assert not hasattr(user, "__dict__")
+    assert sys.getsizeof(user) < sys.getsizeof({"id": 1, "owner": None})
+    assert "User(id=1, owner=User_owner(id=2))" == repr(user)
+    assert user == schema.convert({"id": 1, "owner": {"id": 2}})
+    with pytest.raises(ValueError):
+        Schema({"id": Int()}, extra="keep", record="User")
+    with pytest.raises(ValueError):
+        Schema({"class": Int()}, record="User")
+
+
+def test_schema_pickle():
+    schema = pickle.loads(pickle.dumps(Schema({"id": Int(), "owner": {"id": Int()}}, record="User")))
+
+    assert 2 == schema.convert({"id": "1", "owner": {"id": "2"}}).owner.id
+
+
+def test_schema_convert():
+    @convert(ConvertHandler(Schema({"id": Int()})))
+    def function(user):
+        return user["id"]
+
+    assert 1 == function({"id": "1"})
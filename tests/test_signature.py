@@ -0,0 +1,87 @@
+from weakref import ref
+import gc
+
+from convertible import convert, Convertible
+from convertible.Convertible.Greedy import Greedy
+from convertible.Convert.ConvertHandler.ConvertHandler import ConvertHandler
+
+
+class Test(Convertible):
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def convert(self, argument: int) -> str:
+        return str(argument)
+
+
+def test_function_positional_as_keyword():
+    @convert(ConvertHandler(Test(), Test()))
+    def test(test: str, test2: str) -> str:
+        return test + test2
+
+    assert str(1) + str(2) == test(1, 2)
+    assert str(1) + str(2) == test(1, test2=2)
+    assert str(1) + str(2) == test(test=1, test2=2)
+
+
+def test_function_keyword_as_positional():
+    @convert(ConvertHandler(test2=Test()))
+    def test(test, test2: str):
+        return test, test2
+
+    assert (1, str(2)) == test(1, 2)
+    assert (1, str(2)) == test(1, test2=2)
+
+
+def test_class_positional_as_keyword():
+    class Foo:
+        @convert(ConvertHandler(Test()))
+        def test(self, test: str) -> str:
+            return test
+
+    assert str(1) == Foo().test(test=1)
+
+
+def test_function_special_parameters():
+    @convert(ConvertHandler(Test(), Test(), Test(), test3=Test(), extra=Test()))
+    def test(test, /, test2, *args, test3, **kwargs):
+        return test, test2, args, test3, kwargs
+
+    assert (str(1), str(2), (str(3), 4), str(5), {"extra": str(6)}) == test(1, 2, 3, 4, test3=5, extra=6)
+    assert (str(1), str(2), (), str(5), {"test": 7}) == test(1, test2=2, test3=5, test=7)
+
+
+def test_greedy_not_keyword():
+    @convert(ConvertHandler(Greedy(Test()), test2=Test()))
+    def test(test, test2=None):
+        return test, test2
+
+    assert ([str(1), str(2)], None) == test(1, 2)
+    assert ([1], str(2)) == test(test=[1], test2=2)
+
+
+def test_plan_cached():
+    handler = ConvertHandler(Test())
+
+    class Foo:
+        @convert(handler)
+        def test(self, test: str) -> str:
+            return test
+
+    Foo().test(1)
+    Foo().test(1)
+    assert 1 == len(handler._bindings)
+
+
+def test_plan_does_not_keep_function_alive():
+    handler = ConvertHandler(Test())
+
+    def test(test):
+        return test
+
+    handler.bind(test)
+    reference = ref(test)
+    del test
+    gc.collect()
+    assert reference() is None
+    assert 0 == len(handler._bindings)
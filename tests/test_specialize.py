@@ -0,0 +1,52 @@
+import pytest
+
+from convertible import convert, Convertible, ConvertException, ExceptionHandler, Convert
+from convertible.Convertible.Greedy import Greedy
+from convertible.Convert.ConvertHandler.ConvertHandler import ConvertHandler
+
+
+class Test(Convertible):
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def convert(self, argument: str) -> int:
+        try:
+            return int(argument)
+        except ValueError:
+            raise ConvertException(self, argument)
+
+
+def function(test, test2=None, *args, test3=None, **kwargs):
+    return test, test2, args, test3, kwargs
+
+
+@pytest.mark.parametrize("specialize", [True, False])
+def test_specialized(specialize):
+    handler = ConvertHandler(Test(), None, Test(), test3=Test(), extra=Test())
+    test = Convert(function, handler, ExceptionHandler({ConvertException: lambda convert, argument: None}), specialize)
+
+    assert (test.specialized is not None) == specialize
+    assert (1, "2", (3, "4"), 5, {"extra": 6, "other": "7"}) == test(
+        "1", "2", "3", "4", test3="5", extra="6", other="7"
+    )
+    assert (1, "2", (), None, {}) == test("1", test2="2", test3="a")
+    assert (1, None, (), None, {}) == test(test="1")
+
+
+def test_variadic_not_specialized():
+    assert Convert(function, ConvertHandler(Greedy(Test()))).specialized is None
+
+
+def test_exception():
+    @convert(ConvertHandler(Test()))
+    def test(test):
+        return test
+
+    with pytest.raises(ConvertException):
+        test("a")
+
+
+def test_generated_once():
+    plan = ConvertHandler(Test()).plan
+
+    assert plan.compile() is plan.compile()
@@ -0,0 +1,61 @@
+import itertools
+
+import pytest
+
+from convertible import convert, Convertible, ConvertException
+from convertible.Convertible.Stream import Stream
+from convertible.Convert.ConvertHandler.ConvertHandler import ConvertHandler
+
+
+class Test(Convertible):
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def convert(self, argument: str) -> int:
+        try:
+            return int(argument)
+        except ValueError:
+            raise ConvertException(self, argument)
+
+
+def test_function_arg():
+    @convert(ConvertHandler(Stream(Test())))
+    def test(items):
+        return items
+
+    items = test(str(i) for i in itertools.count())
+    assert [0, 1, 2] == list(itertools.islice(items, 3))
+
+
+def test_function_kwarg():
+    @convert(ConvertHandler(items=Stream(Test())))
+    def test(items):
+        return sum(items)
+
+    assert 6 == test(items=["1", "2", "3"])
+
+
+def test_lazy():
+    seen = []
+
+    def items():
+        for item in ["1", "2", "a"]:
+            seen.append(item)
+            yield item
+
+    stream = Stream(Test()).convert(items())
+    assert [] == seen
+    assert 1 == next(stream)
+    assert ["1"] == seen
+    assert 2 == next(stream)
+    with pytest.raises(ConvertException):
+        next(stream)
+
+
+def test_skip_invalid():
+    assert [1, 3] == list(Stream(Test(), skip_invalid=True).convert(["1", "a", "3"]))
+
+
+def test_not_iterable():
+    with pytest.raises(ConvertException):
+        Stream(Test()).convert(1)
@@ -0,0 +1,64 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+from convertible import convert, Convertible, ConvertException, Convert
+from convertible.Convertible.Greedy import Greedy
+from convertible.Convertible.Optional import Optional
+from convertible.Convert.ConvertHandler.ConvertHandler import ConvertHandler
+
+THREADS = 16
+CALLS = 200
+
+
+class Test(Convertible):
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def convert(self, argument: str) -> int:
+        try:
+            return int(argument)
+        except ValueError:
+            raise ConvertException(self, argument)
+
+
+def hammer(function, arguments):
+    barrier = Barrier(THREADS)
+
+    def worker(thread):
+        barrier.wait()
+        return [function(*arguments(thread, call)) for call in range(CALLS)]
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        return list(executor.map(worker, range(THREADS)))
+
+
+def arguments(thread, call):
+    return [str(thread)] * (call % 7 + 1) + ["x", str(call)]
+
+
+def expected(thread, call):
+    return [thread] * (call % 7 + 1), None, call
+
+
+def test_shared_function():
+    greedy, optional = Greedy(Test()), Optional(Test())
+
+    @convert(ConvertHandler(greedy, optional, Test()))
+    def test(args, test, test2):
+        return args, test, test2
+
+    results = hammer(test, arguments)
+    assert [[expected(thread, call) for call in range(CALLS)] for thread in range(THREADS)] == results
+
+
+def test_shared_exception_protocol():
+    class Legacy(Greedy):
+        """A Greedy that is only used through the exception protocol."""
+
+        def convert_arguments(self, arguments, start):
+            return Convertible.convert_arguments(self, arguments, start)
+
+    test = Convert(lambda *args: args, ConvertHandler(Legacy(Test()), Optional(Test()), Test()))
+
+    results = hammer(test, arguments)
+    assert [[expected(thread, call) for call in range(CALLS)] for thread in range(THREADS)] == results